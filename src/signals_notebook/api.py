@@ -1,13 +1,27 @@
+import asyncio
 import logging
+import time
+from contextlib import nullcontext
 from enum import Enum
-from typing import Any, Dict, IO, Iterable, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, IO, Iterable, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from signals_notebook.exceptions import SignalsNotebookError
+from signals_notebook.utils.http_cache import HttpCache
+from signals_notebook.utils.json_decoder import bind_json_decoder, get_json_decoder, JsonLoads
+from signals_notebook.utils.rate_limiter import RateLimiter
+from signals_notebook.utils.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    import httpx
 
 log = logging.getLogger(__name__)
 
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 32
+
 _Data = Union[None, str, bytes, Mapping[str, Any], Mapping[str, Any], Iterable[Tuple[str, Optional[str]]], IO[Any]]
 
 
@@ -28,20 +42,69 @@ class SignalsNotebookApi:
     """ headers that are used in api (dict)
     """
 
-    def __init__(self, session: requests.Session):
+    def __init__(
+        self,
+        session: requests.Session,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
+        json_decoder: Optional[Union[str, JsonLoads]] = None,
+    ):
         """
         Args:
             session: A Requests session
+            retry_policy: (optional) policy of retrying failed calls. Calls are not retried if it is not passed
+            rate_limiter: (optional) limiter of request rate and number of in-flight requests
+            http_cache: (optional) persistent cache of GET responses
+            json_decoder: (optional) JSON backend used by response.json(): 'orjson', 'msgspec', 'ujson', 'json',
+                'auto' or a function decoding bytes. The standard library is used by default
         """
         self._session = session
+        self._retry_policy = retry_policy or RetryPolicy(total=0)
+        self._rate_limiter = rate_limiter
+        self._http_cache = http_cache
+        self._json_loads = get_json_decoder(json_decoder) if json_decoder is not None else None
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy of the api. Its statistics contain number of retries and total backoff time
+
+        Returns:
+            RetryPolicy
+        """
+        return self._retry_policy
 
     @classmethod
-    def init(cls, api_host: str, api_key: str) -> 'SignalsNotebookApi':
+    def init(
+        cls,
+        api_host: str,
+        api_key: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        http_adapter: Optional[HTTPAdapter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
+        json_decoder: Optional[Union[str, JsonLoads]] = None,
+    ) -> 'SignalsNotebookApi':
         """Initialize SignalsNotebookApi with api host and api key
 
         Args:
             api_host: api host for signals notebook api
             api_key: api key for signals notebook api
+            pool_connections: number of hosts to keep connection pools for
+            pool_maxsize: maximum number of connections kept alive per host
+            pool_block: wait for a free connection instead of opening a throwaway one when the pool is full
+            http_adapter: (optional) adapter created by create_http_adapter to share one connection pool
+                between several SignalsNotebookApi instances. Pool arguments are ignored if it is passed.
+            retry_policy: (optional) policy of retrying failed calls. RetryPolicy() is used by default
+            rate_limiter: (optional) limiter of request rate and number of in-flight requests.
+                The same limiter can be shared between several api instances
+            http_cache: (optional) persistent cache of GET responses. Cached responses are revalidated
+                with ETag / Last-Modified headers or entity digest
+            json_decoder: (optional) JSON backend used by response.json(): 'orjson', 'msgspec', 'ujson', 'json',
+                'auto' or a function decoding bytes. The standard library is used by default
 
         Returns:
             SignalsNotebookApi
@@ -54,7 +117,20 @@ class SignalsNotebookApi:
 
         session.headers.update({'x-api-key': api_key})
 
-        api = cls(session)
+        if http_adapter is None:
+            http_adapter = cls.create_http_adapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+            )
+        session.mount('https://', http_adapter)
+        session.mount('http://', http_adapter)
+
+        api = cls(
+            session,
+            retry_policy=retry_policy or RetryPolicy(),
+            rate_limiter=rate_limiter,
+            http_cache=http_cache,
+            json_decoder=json_decoder,
+        )
         cls.set_default_api(api)
         log.info(
             'Default api configured. Host: %s | Base Path: %s | Version: %s ',
@@ -64,6 +140,30 @@ class SignalsNotebookApi:
         )
         return api
 
+    @staticmethod
+    def create_http_adapter(
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+    ) -> HTTPAdapter:
+        """Create HTTP adapter with a keep-alive connection pool
+
+        Args:
+            pool_connections: number of hosts to keep connection pools for
+            pool_maxsize: maximum number of connections kept alive per host
+            pool_block: wait for a free connection instead of opening a throwaway one when the pool is full
+
+        Returns:
+            HTTPAdapter
+        """
+        log.debug(
+            'Create HTTP adapter. pool_connections: %s | pool_maxsize: %s | pool_block: %s',
+            pool_connections,
+            pool_maxsize,
+            pool_block,
+        )
+        return HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
     @classmethod
     def set_default_api(cls, api: 'SignalsNotebookApi') -> None:
         """Set default api
@@ -96,6 +196,8 @@ class SignalsNotebookApi:
         data: _Data = None,
         json: Optional[Union[list, Dict[str, Any]]] = None,
         headers: Optional[Dict[str, str]] = None,
+        cache_validator: Optional[str] = None,
+        stream: bool = False,
     ) -> requests.Response:
         """Makes an API call
 
@@ -110,59 +212,387 @@ class SignalsNotebookApi:
             json:  (optional) A request body
             headers: (optional) A mapping of request headers where a key is the
                 header name and its value is the header value.
+            cache_validator: (optional) value identifying version of requested content, e.g. entity digest.
+                If http cache contains response stored with the same validator, it is returned without request.
+            stream: (optional) do not download response body until it is accessed,
+                so it can be read chunk by chunk with iter_content
 
         Returns:
             Response object
         """
-        if not params:
-            params = {}
-        if not headers:
-            headers = {}
+        if self._http_cache is not None and method.upper() == 'GET' and not (json or data):
+            return self._call_cached(self._http_cache, path, params, headers, cache_validator, stream)
+
+        request_kwargs: Dict[str, Any] = {
+            'method': method,
+            'url': self._prepare_path(path),
+            'params': params or {},
+            'headers': self._prepare_headers(headers),
+        }
+        if json:
+            request_kwargs['json'] = json
+        elif data:
+            request_kwargs['data'] = data
+        if stream:
+            request_kwargs['stream'] = True
+
+        response = self._send(request_kwargs, replayable=_is_replayable(data))
+
+        if not response.ok:
+            _log_failed_response(response)
+            raise SignalsNotebookError(response)
+        log.info('Successful request - HTTP url: %s, status code: %s', response.url, response.status_code)
+
+        return response
+
+    def _call_cached(
+        self,
+        http_cache: HttpCache,
+        path: Union[str, Sequence[str]],
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        cache_validator: Optional[str],
+        stream: bool = False,
+    ) -> requests.Response:
+        url = self._prepare_path(path)
+        key = http_cache.get_key(url, params)
+        entry = http_cache.get(key)
+
+        if entry is not None and cache_validator is not None and entry.validator == cache_validator:
+            log.info('Cached response is used - HTTP url: %s', url)
+            return self._with_json_decoder(entry.to_response())
+
+        conditional_headers = entry.get_conditional_headers() if entry is not None else {}
+        request_kwargs: Dict[str, Any] = {
+            'method': 'GET',
+            'url': url,
+            'params': params or {},
+            'headers': self._prepare_headers({**conditional_headers, **(headers or {})}),
+        }
+        if stream:
+            request_kwargs['stream'] = True
+        response = self._send(request_kwargs)
+
+        if entry is not None and response.status_code == 304:
+            log.info('Cached response was revalidated - HTTP url: %s', url)
+            return self._with_json_decoder(entry.to_response())
+
+        if not response.ok:
+            _log_failed_response(response)
+            raise SignalsNotebookError(response)
+        log.info('Successful request - HTTP url: %s, status code: %s', response.url, response.status_code)
 
-        headers = {**self.HTTP_DEFAULT_HEADERS, **headers}
+        entry = http_cache.put(key, response, validator=cache_validator)
+        if entry is None:
+            return response
+        if stream:
+            # body of streamed response has been consumed by the cache
+            return self._with_json_decoder(entry.to_response())
 
-        for key, value in headers.items():
+        entry.discard()
+        return response
+
+    def _send(self, request_kwargs: Dict[str, Any], replayable: bool = True) -> requests.Response:
+        method = request_kwargs['method']
+        body = request_kwargs.get('data')
+        body_position = body.tell() if replayable and body is not None and hasattr(body, 'seek') else None
+        attempt = 0
+        while True:
+            if attempt and body is not None and body_position is not None:
+                body.seek(body_position)
+            try:
+                with self._rate_limiter or nullcontext():
+                    response = self._session.request(**request_kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not (replayable and self._retry_policy.is_retryable_error(method, attempt)):
+                    raise
+                status_code, response_headers, reason = None, None, str(e)
+            else:
+                if response.ok or not (
+                    replayable and self._retry_policy.is_retryable_status(method, response.status_code, attempt)
+                ):
+                    return self._with_json_decoder(response)
+                status_code, response_headers, reason = response.status_code, response.headers, response.reason
+
+            backoff = self._retry_policy.get_backoff(attempt, response_headers)
+            _log_retry(method, request_kwargs['url'], reason, backoff, attempt)
+            self._retry_policy.statistics.record(status_code, backoff)
+            time.sleep(backoff)
+            attempt += 1
+
+    def _with_json_decoder(self, response: requests.Response) -> requests.Response:
+        if self._json_loads is not None:
+            bind_json_decoder(response, self._json_loads)
+        return response
+
+    @classmethod
+    def _prepare_headers(cls, headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        prepared_headers = {**cls.HTTP_DEFAULT_HEADERS, **(headers or {})}
+
+        for key, value in prepared_headers.items():
             if isinstance(value, Enum):
-                headers[key] = value.value
+                prepared_headers[key] = value.value
+
+        return prepared_headers
+
+    @classmethod
+    def _prepare_path(cls, path: Union[str, Sequence[str]]) -> str:
+        if not isinstance(path, str):
+            return '/'.join((cls._api_host, cls.BASE_PATH, cls.API_VERSION, *path))
+
+        return path
+
+
+class AsyncSignalsNotebookApi:
+    """Asyncio counterpart of SignalsNotebookApi.
+
+    Requires the optional ``httpx`` dependency (``pip install pesn-sdk[async]``).
+    """
+
+    _default_api_instance: Optional['AsyncSignalsNotebookApi'] = None
+    _api_host = ''
+
+    API_VERSION = SignalsNotebookApi.API_VERSION
+    BASE_PATH = SignalsNotebookApi.BASE_PATH
+    HTTP_DEFAULT_HEADERS = SignalsNotebookApi.HTTP_DEFAULT_HEADERS
+
+    def __init__(
+        self,
+        client: 'httpx.AsyncClient',
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_decoder: Optional[Union[str, JsonLoads]] = None,
+    ):
+        """
+        Args:
+            client: An httpx asynchronous client
+            retry_policy: (optional) policy of retrying failed calls. Calls are not retried if it is not passed
+            rate_limiter: (optional) limiter of request rate and number of in-flight requests
+            json_decoder: (optional) JSON backend used by response.json(): 'orjson', 'msgspec', 'ujson', 'json',
+                'auto' or a function decoding bytes. The standard library is used by default
+        """
+        self._client = client
+        self._retry_policy = retry_policy or RetryPolicy(total=0)
+        self._rate_limiter = rate_limiter
+        self._json_loads = get_json_decoder(json_decoder) if json_decoder is not None else None
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Retry policy of the api. Its statistics contain number of retries and total backoff time
+
+        Returns:
+            RetryPolicy
+        """
+        return self._retry_policy
+
+    @classmethod
+    def init(
+        cls,
+        api_host: str,
+        api_key: str,
+        max_connections: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        json_decoder: Optional[Union[str, JsonLoads]] = None,
+    ) -> 'AsyncSignalsNotebookApi':
+        """Initialize AsyncSignalsNotebookApi with api host and api key
+
+        Args:
+            api_host: api host for signals notebook api
+            api_key: api key for signals notebook api
+            max_connections: maximum number of requests kept in flight at the same time
+            retry_policy: (optional) policy of retrying failed calls. RetryPolicy() is used by default
+            rate_limiter: (optional) limiter of request rate and number of in-flight requests.
+                The same limiter can be shared with SignalsNotebookApi
+            json_decoder: (optional) JSON backend used by response.json(): 'orjson', 'msgspec', 'ujson', 'json',
+                'auto' or a function decoding bytes. The standard library is used by default
 
+        Returns:
+            AsyncSignalsNotebookApi
+        """
+        try:
+            import httpx
+        except ImportError:
+            log.error('httpx is required for AsyncSignalsNotebookApi')
+            raise ImportError('httpx is required for AsyncSignalsNotebookApi. Install it with pesn-sdk[async]')
+
+        cls._api_host = api_host
+
+        log.info('Initialize async client for api...')
+        client = httpx.AsyncClient(
+            headers={'x-api-key': api_key},
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+        api = cls(
+            client,
+            retry_policy=retry_policy or RetryPolicy(),
+            rate_limiter=rate_limiter,
+            json_decoder=json_decoder,
+        )
+        cls.set_default_api(api)
+        log.info(
+            'Default async api configured. Host: %s | Base Path: %s | Version: %s ',
+            api._api_host,
+            api.BASE_PATH,
+            api.API_VERSION,
+        )
+        return api
+
+    @classmethod
+    def set_default_api(cls, api: 'AsyncSignalsNotebookApi') -> None:
+        """Set default async api
+
+        Args:
+            api: default async api
+
+        Returns:
+
+        """
+        cls._default_api_instance = api
+
+    @classmethod
+    def get_default_api(cls) -> 'AsyncSignalsNotebookApi':
+        """Get initialized async API
+
+        Returns:
+            AsyncSignalsNotebookApi: Initialized async API
+        """
+        if not cls._default_api_instance:
+            log.error('You must initialize async API before using')
+            raise AttributeError('You must initialize async API before using')
+        return cls._default_api_instance
+
+    async def call(
+        self,
+        method: str,
+        path: Union[str, Sequence[str]],
+        params: Optional[Dict[str, Any]] = None,
+        data: Union[None, str, bytes, Mapping[str, Any]] = None,
+        json: Optional[Union[list, Dict[str, Any]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> 'httpx.Response':
+        """Makes an API call without blocking the event loop
+
+        Args:
+            method: The HTTP method name (e.g. 'GET').
+            path: an absolute API path
+            params: (optional) A mapping of request parameters. Parameters with None value are skipped.
+            data: (optional) Dictionary, bytes or string to send in the body of the request.
+            json:  (optional) A request body
+            headers: (optional) A mapping of request headers where a key is the
+                header name and its value is the header value.
+
+        Returns:
+            Response object
+        """
+        request_kwargs: Dict[str, Any] = {
+            'method': method,
+            'url': self._prepare_path(path),
+            'params': {key: value for key, value in (params or {}).items() if value is not None},
+            'headers': SignalsNotebookApi._prepare_headers(headers),
+        }
         if json:
-            response = self._session.request(
-                method=method,
-                url=self._prepare_path(path),
-                params=params,
-                json=json,
-                headers=headers,
-            )
+            request_kwargs['json'] = json
+        elif isinstance(data, (str, bytes)):
+            request_kwargs['content'] = data
         elif data:
-            response = self._session.request(
-                method=method,
-                url=self._prepare_path(path),
-                params=params,
-                data=data,
-                headers=headers,
-            )
-        else:
-            response = self._session.request(
-                method=method,
-                url=self._prepare_path(path),
-                params=params,
-                headers=headers,
-            )
+            request_kwargs['data'] = data
 
-        if not response.ok:
-            log.error(
-                'Error has been occurred while getting response, status code: %s',
-                response.status_code,
-                extra={'response': response},
-            )
+        response = await self._send(request_kwargs)
+
+        if not response.is_success:
+            _log_failed_response(response)
             raise SignalsNotebookError(response)
         log.info('Successful request - HTTP url: %s, status code: %s', response.url, response.status_code)
 
         return response
 
+    async def _send(self, request_kwargs: Dict[str, Any]) -> 'httpx.Response':
+        import httpx
+
+        method = request_kwargs['method']
+        attempt = 0
+        while True:
+            try:
+                async with self._rate_limiter or _AsyncNullContext():
+                    response = await self._client.request(**request_kwargs)
+            except httpx.TransportError as e:
+                if not self._retry_policy.is_retryable_error(method, attempt):
+                    raise
+                status_code, response_headers, reason = None, None, str(e)
+            else:
+                if response.is_success or not self._retry_policy.is_retryable_status(
+                    method, response.status_code, attempt
+                ):
+                    if self._json_loads is not None:
+                        bind_json_decoder(response, self._json_loads)
+                    return response
+                status_code, response_headers, reason = response.status_code, response.headers, response.reason_phrase
+
+            backoff = self._retry_policy.get_backoff(attempt, response_headers)
+            _log_retry(method, request_kwargs['url'], reason, backoff, attempt)
+            self._retry_policy.statistics.record(status_code, backoff)
+            await asyncio.sleep(backoff)
+            attempt += 1
+
+    async def close(self) -> None:
+        """Close underlying connections
+
+        Returns:
+
+        """
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncSignalsNotebookApi':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
     @classmethod
     def _prepare_path(cls, path: Union[str, Sequence[str]]) -> str:
         if not isinstance(path, str):
             return '/'.join((cls._api_host, cls.BASE_PATH, cls.API_VERSION, *path))
 
         return path
+
+
+class _AsyncNullContext:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+def _is_replayable(data: _Data) -> bool:
+    if data is None or isinstance(data, (str, bytes, Mapping, list, tuple)):
+        return True
+    if not hasattr(data, 'read'):
+        # generators and other iterables are exhausted after the first attempt
+        return False
+
+    try:
+        return bool(data.seekable())  # type: ignore
+    except (AttributeError, ValueError):
+        return False
+
+
+def _log_retry(method: str, url: str, reason: str, backoff: float, attempt: int) -> None:
+    log.warning(
+        'Retrying %s %s in %.2f seconds (retry %s). Reason: %s',
+        method,
+        url,
+        backoff,
+        attempt + 1,
+        reason,
+    )
+
+
+def _log_failed_response(response: Any) -> None:
+    log.error(
+        'Error has been occurred while getting response, status code: %s',
+        response.status_code,
+        extra={'response': response},
+    )
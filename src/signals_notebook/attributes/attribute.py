@@ -7,6 +7,8 @@ from pydantic.fields import PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import AttrID, ObjectType, Response, ResponseData
+from signals_notebook.utils import Paginator
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -84,31 +86,25 @@ class Attribute(BaseModel):
         return cast(ResponseData, result.data).body
 
     @classmethod
-    def get_list(cls) -> Generator['Attribute', None, None]:
+    def get_list(cls, prefetch: int = DEFAULT_PREFETCH) -> Generator['Attribute', None, None]:
         """Get all Attributes.
 
+        Args:
+            prefetch: Number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
            list of available Attributes
         """
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get List of Attributes')
 
-        response = api.call(
-            method='GET',
+        pages = Paginator(
+            api,
+            AttributeResponse,
+            prefetch=prefetch,
             path=(cls._get_endpoint(),),
         )
-        result = AttributeResponse(**response.json())
-
-        yield from [cast(ResponseData, item).body for item in result.data]
-
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
-
-            result = AttributeResponse(**response.json())
-            yield from [cast(ResponseData, item).body for item in result.data]
+        yield from (cast(ResponseData, item).body for item in pages)
 
         log.debug('List of Attributes was got successfully.')
 
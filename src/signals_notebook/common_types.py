@@ -5,7 +5,7 @@ import re
 from base64 import b64encode
 from datetime import datetime
 from enum import Enum
-from typing import Any, Generic, List, Optional, TypeVar, Union
+from typing import Any, BinaryIO, Callable, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union
 from uuid import UUID
 
 from dateutil.parser import parse
@@ -321,6 +321,19 @@ class Response(GenericModel, Generic[EntityClass]):
 
         super().__init__(**{**kwargs, 'data': data})
 
+    @classmethod
+    def get_item_class(cls) -> Type[ResponseData]:
+        """Get model of a single item of response data
+
+        Returns:
+            ResponseData model
+        """
+        sub_fields = cls.__fields__['data'].sub_fields
+        if not sub_fields:
+            raise TypeError(f'{cls.__name__} does not describe a list of items')
+
+        return sub_fields[0].type_
+
 
 class DataObject(GenericModel, Generic[AnyModel]):
     data: AnyModel
@@ -406,6 +419,90 @@ class File(BaseModel):
             f.write(self.content)
 
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# content of uploaded file: bytes, binary file object or path of local file
+UploadContent = Union[bytes, BinaryIO, os.PathLike]
+
+
+class FileStream:
+    def __init__(
+        self,
+        name: str,
+        content_type: Optional[str],
+        chunks: Iterable[bytes],
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        """File content which is read chunk by chunk
+
+        Content can be iterated only once. Whole content is never held in memory unless read() is called.
+
+        Args:
+            name: file name
+            content_type: content type
+            chunks: iterable of content chunks
+            on_close: (optional) function releasing underlying resources, e.g. HTTP connection
+        """
+        self.name = name
+        self.content_type = content_type
+        self._chunks = chunks
+        self._on_close = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            if chunk:
+                yield chunk
+
+    def __enter__(self) -> 'FileStream':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release underlying resources
+
+        Returns:
+
+        """
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def read(self) -> bytes:
+        """Read whole content to memory
+
+        Returns:
+            bytes
+        """
+        return b''.join(self)
+
+    def to_file(self) -> File:
+        """Read whole content to File
+
+        Returns:
+            File
+        """
+        return File(name=self.name, content=self.read(), content_type=self.content_type)
+
+    def save(self, path: str) -> None:
+        """Save content in file writing it chunk by chunk
+
+        Args:
+            path: path to the file or directory where file is saved with its name
+
+        Returns:
+
+        """
+        _path = path
+        if os.path.isdir(path):
+            _path = os.path.join(path, self.name)
+
+        with open(_path, 'wb') as f:
+            for chunk in self:
+                f.write(chunk)
+
+
 class DateTime(datetime):
     @classmethod
     def __get_validators__(cls):
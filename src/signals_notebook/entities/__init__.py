@@ -1,5 +1,7 @@
 from signals_notebook.entities.entity import Entity  # noqa
 from signals_notebook.entities.entity_store import EntityStore  # noqa
+from signals_notebook.entities.entity_ref import EntityRef  # noqa
+from signals_notebook.entities.template_index import TemplateIndex  # noqa
 from signals_notebook.entities.notebook import Notebook  # noqa
 from signals_notebook.entities.experiment import Experiment  # noqa
 from signals_notebook.entities.text import Text  # noqa
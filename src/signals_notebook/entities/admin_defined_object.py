@@ -9,7 +9,7 @@ from signals_notebook.common_types import Ancestors, EntityCreationRequestPayloa
 from signals_notebook.entities import Notebook
 from signals_notebook.entities.container import Container
 from signals_notebook.jinja_env import env
-from signals_notebook.utils import FSHandler
+from signals_notebook.utils import DumpManifest, FSHandler, LoadJournal
 
 CUSTOM_SYSTEM_OBJECT = 'Custom System Object'
 log = logging.getLogger(__name__)
@@ -132,7 +132,12 @@ class AdminDefinedObject(Container):
         return template.render(data=data)
 
     def dump(
-        self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]] = None,
+        max_workers: int = 1,
+        manifest: Optional[DumpManifest] = None,
     ) -> None:  # type: ignore[override]
         """Dump AdminDefinedObject entity
 
@@ -140,6 +145,8 @@ class AdminDefinedObject(Container):
             base_path: content path where create dump
             fs_handler: FSHandler
             alias: Backup alias
+            max_workers: number of children dumped concurrently
+            manifest: (optional) manifest of incremental dump. Unchanged children are not dumped again
 
         Returns:
 
@@ -153,8 +160,14 @@ class AdminDefinedObject(Container):
             json.dumps(metadata),
             base_alias=alias + [self.name, '__Metadata'] if alias else None,
         )
-        for child in self.get_children():
-            child.dump(fs_handler.join_path(base_path, self.eid), fs_handler)
+        self._dump_children(
+            self.get_children(),
+            fs_handler.join_path(base_path, self.eid),
+            fs_handler,
+            None,
+            max_workers=max_workers,
+            manifest=manifest,
+        )
 
     @classmethod
     def load(cls, path: str, fs_handler: FSHandler, notebook: Notebook) -> None:
@@ -171,20 +184,24 @@ class AdminDefinedObject(Container):
         cls._load(path, fs_handler, notebook)
 
     @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
-
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        experiment = cls.create(
-            notebook=parent,
-            name=metadata['name'],
-            ado_type_name=metadata.get('ado_name', CUSTOM_SYSTEM_OBJECT),
-            description=metadata['description'],
-            force=True,
+        ado = cls._restore(
+            path,
+            lambda: cls.create(
+                notebook=parent,
+                name=metadata['name'],
+                ado_type_name=metadata.get('ado_name', CUSTOM_SYSTEM_OBJECT),
+                description=metadata['description'],
+                force=True,
+            ),
+            journal,
         )
-        child_entities_folders = fs_handler.list_subfolders(path)
-        for child_entity in child_entities_folders:
-            child_entity_type = child_entity.split(':')[0]
-            ItemMapper.get_item_class(child_entity_type)._load(
-                fs_handler.join_path(path, child_entity), fs_handler, experiment
-            )
+        cls._load_children(path, fs_handler, ado, journal=journal, max_workers=max_workers)
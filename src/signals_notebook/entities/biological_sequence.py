@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -35,7 +35,7 @@ class BiologicalSequence(ContentfulEntity):
         *,
         container: Container,
         name: str,
-        content: bytes = b'',
+        content: UploadContent = b'',
         content_type: str = ContentType.GB,
         force: bool = True,
     ) -> Entity:
@@ -45,7 +45,7 @@ class BiologicalSequence(ContentfulEntity):
             container: Container where create new BiologicalSequence
             name: file name
             content_type: content type of BiologicalSequence entity
-            content: BiologicalSequence content
+            content: BiologicalSequence content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
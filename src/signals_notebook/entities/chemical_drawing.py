@@ -7,7 +7,7 @@ from typing import Any, cast, ClassVar, Dict, List, Literal, Optional, Union
 from pydantic import BaseModel, Field
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import ChemicalDrawingFormat, EntityType, File, Response, ResponseData
+from signals_notebook.common_types import ChemicalDrawingFormat, EntityType, File, Response, ResponseData, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -145,6 +145,7 @@ class ChemicalDrawing(ContentfulEntity):
 
         request_data = StructureRequestData(attributes=StructureAttribute(dataType=data_type, data=data))
 
+        self._invalidate_digest()
         response = api.call(
             method='POST',
             path=(self._get_chemical_drawing_endpoint(), self.eid, 'reaction', positions),
@@ -164,7 +165,7 @@ class ChemicalDrawing(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = CreationContentType.CDXML,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create ChemicalDrawing Entity
@@ -173,7 +174,7 @@ class ChemicalDrawing(ContentfulEntity):
             container: Container where create new ChemicalDrawing
             name: file name
             content_type: type of the file
-            content: Entity content
+            content: Entity content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
@@ -237,13 +238,11 @@ class ChemicalDrawing(ContentfulEntity):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
         try:
             for template in templates:
                 template.dump(
@@ -3,15 +3,45 @@ import json
 import logging
 import mimetypes
 import os
-from typing import cast, Generator, List, Optional, Union
+from contextlib import contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    BinaryIO,
+    Callable,
+    cast,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
 
-from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import EntityType, Response, ResponseData
+from signals_notebook.api import AsyncSignalsNotebookApi, SignalsNotebookApi
+from signals_notebook.common_types import EID, EntityType, ResponseData, UploadContent
 from signals_notebook.entities import Entity
+from signals_notebook.entities.entity_ref import EntityRef
+from signals_notebook.utils import AsyncPaginator, map_concurrently, Paginator
+from signals_notebook.utils.dump_manifest import DumpManifest
 from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.load_journal import LoadJournal
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
+ContainerType = TypeVar('ContainerType', bound='Container')
+
+
+@contextmanager
+def _open_content(content: UploadContent) -> Iterator[Union[bytes, BinaryIO]]:
+    if isinstance(content, os.PathLike):
+        with open(content, 'rb') as f:
+            yield f
+    else:
+        yield content
+
 
 class Container(Entity, abc.ABC):
     @classmethod
@@ -22,15 +52,18 @@ class Container(Entity, abc.ABC):
     def add_child(
         self,
         name: str,
-        content: bytes,
+        content: UploadContent,
         content_type: Optional[str] = None,
         force: bool = True,
     ) -> Entity:
         """Upload a file to an entity as a child.
 
+        File object or file path is streamed from disk, so large files are never loaded to memory.
+        Seekable file is rewound before the upload is retried.
+
         Args:
             name: file name
-            content: entity content
+            content: entity content as bytes, binary file object or path of local file
             content_type: entity type
             force: Force to post attachment
 
@@ -46,61 +79,323 @@ class Container(Entity, abc.ABC):
             content_type = mimetypes.guess_type(name)[0]
             file_name = name
 
-        response = api.call(
-            method='POST',
-            path=(self._get_endpoint(), self.eid, 'children', file_name),
-            params={
-                'digest': None if force else self.digest,
-                'force': json.dumps(force),
-            },
-            headers={
-                'Content-Type': content_type or 'application/octet-stream',
-            },
-            data=content,
-        )
+        with _open_content(content) as data:
+            response = api.call(
+                method='POST',
+                path=(self._get_endpoint(), self.eid, 'children', file_name),
+                params={
+                    'digest': None if force else self.digest,
+                    'force': json.dumps(force),
+                },
+                headers={
+                    'Content-Type': content_type or 'application/octet-stream',
+                },
+                data=data,
+            )
         log.debug('Added child: %s to Container: %s', self.name, self.eid)
 
-        entity_classes = (*Entity.get_subclasses(), Entity)
-        result = Response[Union[entity_classes]](**response.json())  # type: ignore
+        result = Entity.get_response_class()(**response.json())
 
         return cast(ResponseData, result.data).body
 
-    def get_children(self, order: Optional[str] = None) -> Generator[Entity, None, None]:
+    def get_children(
+        self, order: Optional[str] = None, prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator[Entity, None, None]:
         """Get children of a specified entity.
 
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
             list of Entities
         """
-        api = SignalsNotebookApi.get_default_api()
         log.debug('Get children for: %s', self.eid)
+        yield from (cast(ResponseData, item).body for item in self._get_children_pages(order, prefetch))
+
+    def get_children_refs(
+        self, order: Optional[str] = None, prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator[EntityRef, None, None]:
+        """Get lightweight references to children of a specified entity.
 
+        Reference is validated only when attribute other than eid, type or name is accessed.
+
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            list of EntityRefs
+        """
+        log.debug('Get children references for: %s', self.eid)
+        yield from (EntityRef.from_item(item) for item in self._get_children_pages(order, prefetch).iter_raw())
+
+    def _get_children_pages(self, order: Optional[str], prefetch: int) -> Paginator:
+        api = SignalsNotebookApi.get_default_api()
         params = {'order': order} if order else {}
-        response = api.call(method='GET', path=(self._get_endpoint(), self.eid, 'children'), params=params)
 
-        entity_classes = (*Entity.get_subclasses(), Entity)
+        return Paginator(
+            api,
+            Entity.get_response_class(),
+            prefetch=prefetch,
+            path=(self._get_endpoint(), self.eid, 'children'),
+            params=params,
+        )
+
+    async def get_children_async(self, order: Optional[str] = None) -> AsyncGenerator[Entity, None]:
+        """Get children of a specified entity using AsyncSignalsNotebookApi.
+
+        Returns:
+            list of Entities
+        """
+        api = AsyncSignalsNotebookApi.get_default_api()
+        log.debug('Get children for: %s asynchronously', self.eid)
+
+        params = {'order': order} if order else {}
 
-        result = Response[Union[entity_classes]](**response.json())  # type: ignore
+        pages = AsyncPaginator(
+            api,
+            Entity.get_response_class(),
+            path=(self._get_endpoint(), self.eid, 'children'),
+            params=params,
+        )
+        async for item in pages:
+            yield cast(ResponseData, item).body
 
-        yield from [cast(ResponseData, item).body for item in result.data]
+    def dump(
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]] = None,
+        max_workers: int = 1,
+        manifest: Optional[DumpManifest] = None,
+    ) -> None:
+        """Dump Container entity
 
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
+        Args:
+            base_path: content path where create dump
+            fs_handler: FSHandler
+            alias: Backup alias
+            max_workers: number of children dumped concurrently. Children of children are dumped one at a time
+            manifest: (optional) manifest of incremental dump. Unchanged children are not dumped again
 
-            result = Response[Union[entity_classes]](**response.json())  # type: ignore
-            yield from [cast(ResponseData, item).body for item in result.data]
+        Returns:
 
-    def dump(self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None) -> None:
+        """
         metadata = {k: v for k, v in self.dict().items() if k in ('name', 'description', 'eid')}
         fs_handler.write(
             fs_handler.join_path(base_path, self.eid, 'metadata.json'),
             json.dumps(metadata),
             base_alias=alias + [self.name, '__Metadata'] if alias else None,
         )
-        for child in self.get_children():
-            child.dump(fs_handler.join_path(base_path, self.eid), fs_handler, alias + [self.name] if alias else None)
+        self._dump_children(
+            self.get_children(),
+            fs_handler.join_path(base_path, self.eid),
+            fs_handler,
+            alias + [self.name] if alias else None,
+            max_workers=max_workers,
+            manifest=manifest,
+        )
+
+    def _dump_children(
+        self,
+        children: Iterable[Entity],
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]],
+        max_workers: int = 1,
+        isolate_errors: bool = False,
+        manifest: Optional[DumpManifest] = None,
+    ) -> None:
+        """Dump children to the same location in serial or concurrent mode
+
+        In concurrent mode failure of one child does not stop dumping of the others,
+        the first error is raised when all children are processed unless errors are isolated.
+
+        Args:
+            children: entities to dump
+            base_path: content path where create dump of children
+            fs_handler: FSHandler
+            alias: Backup alias of children
+            max_workers: number of children dumped concurrently
+            isolate_errors: log error and continue if child dump fails
+            manifest: (optional) manifest of incremental dump. Dumped children are recorded in it
+
+        Returns:
+
+        """
+
+        def _dump(child: Entity) -> None:
+            self._dump_child(child, base_path, fs_handler, alias, manifest)
+
+        if max_workers > 1:
+            results = map_concurrently(_dump, children, max_workers)
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors and not isolate_errors:
+                raise errors[0]
+            return
+
+        for child in children:
+            try:
+                _dump(child)
+            except Exception as e:
+                if not isolate_errors:
+                    raise
+                log.error(str(e))
+
+    def _dump_child(
+        self,
+        child: Entity,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]],
+        manifest: Optional[DumpManifest],
+    ) -> None:
+        if manifest is None:
+            child.dump(base_path, fs_handler, alias)
+        else:
+            self._dump_child_incrementally(child, base_path, fs_handler, alias, manifest)
+
+    def _dump_child_incrementally(
+        self,
+        child: Entity,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]],
+        manifest: DumpManifest,
+    ) -> None:
+        if manifest.is_unchanged(child):
+            manifest.carry_forward(child.eid)
+            return
+
+        if isinstance(child, Container):
+            child.dump(base_path, fs_handler, alias, manifest=manifest)
+        else:
+            child.dump(base_path, fs_handler, alias)
+        manifest.record(child, fs_handler.join_path(base_path, child.eid), parent=self.eid)
+
+    @classmethod
+    def _restore(
+        cls,
+        path: str,
+        create: Callable[[], ContainerType],
+        journal: Optional[LoadJournal] = None,
+    ) -> ContainerType:
+        """Create container from dump folder or get the one created by interrupted restore
+
+        Args:
+            path: path of dump folder
+            create: function creating container
+            journal: (optional) journal of restore
+
+        Returns:
+            Container
+        """
+        from signals_notebook.entities import EntityStore
+
+        eid = journal.get_created(path) if journal else None
+        if eid is not None:
+            log.info('%s has already been restored as %s', path, eid)
+            return cast(ContainerType, EntityStore.get(EID(eid)))
+
+        container = create()
+        if journal:
+            journal.record_created(path, container.eid)
+        return container
+
+    @classmethod
+    def _load_children(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: 'Container',
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+        folders: Optional[List[str]] = None,
+        skip_not_implemented: bool = False,
+    ) -> None:
+        """Load children from dump folder in serial or concurrent mode
+
+        Every child is loaded only after its parent has been created, so children of the same parent
+        are independent and can be loaded concurrently. Each container level uses its own pool of workers.
+        In concurrent mode failure of one child does not stop loading of the others,
+        the first error is raised when all of them are finished.
+
+        Args:
+            path: path of dump folder of parent
+            fs_handler: FSHandler
+            parent: created parent of children
+            journal: (optional) journal of restore. Completed children are skipped
+            max_workers: number of children loaded concurrently
+            folders: (optional) names of child folders. All subfolders are loaded by default
+            skip_not_implemented: log error and continue if loading of child type is not supported
+
+        Returns:
+
+        """
+        if folders is None:
+            folders = fs_handler.list_subfolders(path)
+        if journal:
+            folders = [folder for folder in folders if not journal.is_completed(fs_handler.join_path(path, folder))]
+
+        def _load(folder: str) -> None:
+            cls._load_child(
+                fs_handler.join_path(path, folder),
+                folder.split(':')[0],
+                fs_handler,
+                parent,
+                journal,
+                max_workers,
+                skip_not_implemented,
+            )
+
+        if max_workers <= 1:
+            for folder in folders:
+                _load(folder)
+            return
+
+        errors = [result for result in map_concurrently(_load, folders, max_workers) if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+    @classmethod
+    def _load_child(
+        cls,
+        path: str,
+        entity_type: str,
+        fs_handler: FSHandler,
+        parent: 'Container',
+        journal: Optional[LoadJournal],
+        max_workers: int,
+        skip_not_implemented: bool,
+    ) -> None:
+        from signals_notebook.item_mapper import ItemMapper
+
+        child_class = ItemMapper.get_item_class(entity_type)
+        try:
+            if issubclass(child_class, Container):
+                child_class._load(path, fs_handler, parent, journal=journal, max_workers=max_workers)
+            else:
+                child_class._load(path, fs_handler, parent)
+        except NotImplementedError:
+            if not skip_not_implemented:
+                raise
+            log.error('Failed to load entity %s. Not supported' % entity_type)
+            return
+
+        if journal:
+            journal.mark_completed(path)
+
+    @classmethod
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
+        log.error('Loading is not implemented')
 
     @classmethod
     def dump_templates(cls, base_path: str, fs_handler: FSHandler) -> None:
@@ -113,13 +408,11 @@ class Container(Entity, abc.ABC):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
 
         for template in templates:
             template.dump(
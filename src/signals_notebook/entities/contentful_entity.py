@@ -6,11 +6,11 @@ from enum import Enum
 from typing import Any, List, Optional
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import DEFAULT_CHUNK_SIZE, EntityType, File, FileStream, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.jinja_env import env
-from signals_notebook.utils import FSHandler
+from signals_notebook.utils import FSHandler, open_read, write_chunks
 
 log = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ class ContentfulEntity(Entity, abc.ABC):
         container: Container,
         name: str,
         content_type: str = ContentType.BYTES,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         raise NotImplementedError
@@ -49,6 +49,7 @@ class ContentfulEntity(Entity, abc.ABC):
             params={
                 'format': format,
             },
+            cache_validator=self._get_cache_validator(),
         )
 
         content_disposition = response.headers.get('content-disposition', '')
@@ -60,6 +61,41 @@ class ContentfulEntity(Entity, abc.ABC):
             content_type=response.headers.get('content-type'),
         )
 
+    def get_content_stream(self) -> FileStream:
+        """Get content which is downloaded chunk by chunk
+
+        Use it for large files: content is not loaded to memory unless it is read at once.
+        Stream should be closed when it is not needed, e.g. by using it as context manager.
+
+        Returns:
+            FileStream
+        """
+        return self._get_content_stream()
+
+    def _get_content_stream(self, format: Optional[str] = None) -> FileStream:
+        api = SignalsNotebookApi.get_default_api()
+        log.debug('Get content stream for: %s| %s', self.__class__.__name__, self.eid)
+
+        response = api.call(
+            method='GET',
+            path=(self._get_endpoint(), self.eid, 'export'),
+            params={
+                'format': format,
+            },
+            cache_validator=self._get_cache_validator(),
+            stream=True,
+        )
+
+        content_disposition = response.headers.get('content-disposition', '')
+        _, params = cgi.parse_header(content_disposition)
+
+        return FileStream(
+            name=params['filename'],
+            content_type=response.headers.get('content-type'),
+            chunks=response.iter_content(DEFAULT_CHUNK_SIZE),
+            on_close=response.close,
+        )
+
     def get_html(self) -> str:
         """Get in HTML format
 
@@ -87,24 +123,24 @@ class ContentfulEntity(Entity, abc.ABC):
         Returns:
 
         """
-        content = self.get_content()
-        metadata = {
-            'file_name': content.name,
-            'content_type': content.content_type,
-            **{k: v for k, v in self.dict().items() if k in ('name', 'description', 'eid')},
-        }
-        fs_handler.write(
-            fs_handler.join_path(base_path, self.eid, 'metadata.json'),
-            json.dumps(metadata),
-            base_alias=alias + [self.name, '__Metadata'] if alias else None,
-        )
-        file_name = content.name
-        data = content.content
-        fs_handler.write(
-            fs_handler.join_path(base_path, self.eid, file_name),
-            data,
-            base_alias=alias + [self.name, file_name] if alias else None,
-        )
+        with self.get_content_stream() as content:
+            metadata = {
+                'file_name': content.name,
+                'content_type': content.content_type,
+                **{k: v for k, v in self.dict().items() if k in ('name', 'description', 'eid')},
+            }
+            fs_handler.write(
+                fs_handler.join_path(base_path, self.eid, 'metadata.json'),
+                json.dumps(metadata),
+                base_alias=alias + [self.name, '__Metadata'] if alias else None,
+            )
+            file_name = content.name
+            write_chunks(
+                fs_handler,
+                fs_handler.join_path(base_path, self.eid, file_name),
+                content,
+                base_alias=alias + [self.name, file_name] if alias else None,
+            )
 
     @classmethod
     def load(cls, path: str, fs_handler: FSHandler, parent: Container) -> None:
@@ -126,8 +162,10 @@ class ContentfulEntity(Entity, abc.ABC):
         metadata = json.loads(fs_handler.read(metadata_path))
         content_path = fs_handler.join_path(path, metadata['file_name'])
         content_type = metadata.get('content_type')
-        content = fs_handler.read(content_path)
-        if content_type:
-            cls.create(container=parent, name=metadata['name'], content=content, content_type=content_type, force=True)
-        else:
-            cls.create(container=parent, name=metadata['name'], content=content, force=True)
+        with open_read(fs_handler, content_path) as content:
+            if content_type:
+                cls.create(
+                    container=parent, name=metadata['name'], content=content, content_type=content_type, force=True
+                )
+            else:
+                cls.create(container=parent, name=metadata['name'], content=content, force=True)
@@ -1,7 +1,9 @@
 import json
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import Any, cast, ClassVar, Dict, Generator, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, cast, ClassVar, Dict, Generator, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr
@@ -24,6 +26,7 @@ CellValueType = TypeVar('CellValueType')
 
 log = logging.getLogger(__name__)
 MAIN_PROPERTIES = ['Name', 'Description', 'createdAt', 'editedAt']
+CACHE_VALIDATOR_TTL = 60.0
 
 
 class Property(GenericModel, Generic[CellValueType]):
@@ -70,6 +73,25 @@ class PropertiesResponse(Response[Property]):
     pass
 
 
+class _EntityRegistry:
+    def __init__(self):
+        """Lazily built lookup tables of Entity subclasses
+
+        Tables are built on first use and dropped when a new Entity subclass is defined.
+        """
+        self.lock = threading.RLock()
+        self.subclasses: Dict[type, Tuple[Type['Entity'], ...]] = {}
+        self.classes_by_type: Optional[Dict[str, Type['Entity']]] = None
+
+    def clear(self) -> None:
+        with self.lock:
+            self.subclasses = {}
+            self.classes_by_type = None
+
+
+_registry = _EntityRegistry()
+
+
 class Entity(BaseModel):
     type: str = Field(allow_mutation=False)
     eid: EID = Field(allow_mutation=False)
@@ -81,6 +103,7 @@ class Entity(BaseModel):
     _template_name: ClassVar = 'entity.html'
     _properties: List[Property] = PrivateAttr(default=[])
     _properties_by_id: Dict[Union[str, UUID], Property] = PrivateAttr(default={})
+    _digest_fetched_at: Optional[float] = PrivateAttr(default_factory=time.monotonic)
 
     class Config:
         validate_assignment = True
@@ -116,17 +139,65 @@ class Entity(BaseModel):
     def _get_entity_type(cls) -> EntityType:
         raise NotImplementedError
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        _registry.clear()
+
     @classmethod
-    def get_subclasses(cls) -> Generator[Type['Entity'], None, None]:
+    def get_subclasses(cls) -> Tuple[Type['Entity'], ...]:
         """Get all Entity subclasses
 
+        The result is computed once and reused until a new subclass is defined.
+
         Returns:
-            One of the Entity subclasses
+            Entity subclasses
         """
-        log.debug('Get subclasses for: %s', cls.__name__)
-        for subclass in cls.__subclasses__():
-            yield from subclass.get_subclasses()
-            yield subclass
+        subclasses = _registry.subclasses.get(cls)
+        if subclasses is None:
+            log.debug('Get subclasses for: %s', cls.__name__)
+            subclasses = tuple(
+                item for subclass in cls.__subclasses__() for item in (*subclass.get_subclasses(), subclass)
+            )
+            with _registry.lock:
+                _registry.subclasses[cls] = subclasses
+
+        return subclasses
+
+    @classmethod
+    def get_entity_class(cls, entity_type: Union[EntityType, str]) -> Type['Entity']:
+        """Get Entity subclass by entity type
+
+        Args:
+            entity_type: entity type or its value
+
+        Returns:
+            Entity subclass
+        """
+        classes_by_type = _registry.classes_by_type
+        if classes_by_type is None:
+            classes_by_type = {}
+            for subclass in Entity.get_subclasses():
+                try:
+                    subclass_type = subclass._get_entity_type()
+                except NotImplementedError:
+                    continue
+                if subclass_type:
+                    classes_by_type.setdefault(subclass_type.value, subclass)
+            with _registry.lock:
+                _registry.classes_by_type = classes_by_type
+
+        return classes_by_type[entity_type.value if isinstance(entity_type, EntityType) else entity_type]
+
+    @classmethod
+    def get_response_class(cls) -> Type[Response]:
+        """Get Response model which parses any known Entity
+
+        Attributes of each item are validated only by the Entity subclass registered for their type.
+
+        Returns:
+            Response model
+        """
+        return EntityResponse
 
     @classmethod
     def set_template_name(cls, template_name: str) -> None:
@@ -239,8 +310,32 @@ class Entity(BaseModel):
 
         EntityStore.refresh(self)
 
+    def _get_cache_validator(self) -> Optional[str]:
+        """Get digest which may be used to validate cached content of entity
+
+        Digest is trusted only for CACHE_VALIDATOR_TTL seconds after it was fetched from server
+        and never after entity was changed by this object.
+
+        Returns:
+            digest or None if cached content should be revalidated by server
+        """
+        fetched_at = self._digest_fetched_at
+        if fetched_at is None or time.monotonic() - fetched_at > CACHE_VALIDATOR_TTL:
+            return None
+
+        return self.digest
+
+    def _invalidate_digest(self) -> None:
+        """Mark digest as outdated after entity was changed
+
+        Returns:
+
+        """
+        self._digest_fetched_at = None
+
     def _patch_properties(self, request_body, force: bool) -> None:
         api = SignalsNotebookApi.get_default_api()
+        self._invalidate_digest()
         api.call(
             method='PATCH',
             path=(self._get_endpoint(), self.eid, 'properties'),
@@ -321,13 +416,11 @@ class Entity(BaseModel):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
         try:
             for template in templates:
                 fs_handler.write(
@@ -338,3 +431,33 @@ class Entity(BaseModel):
 
         except TypeError:
             pass
+
+
+class _EntityByType:
+    """Pydantic type which validates entity attributes with the Entity subclass registered for their type"""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> Entity:
+        if isinstance(value, Entity):
+            return value
+        if not isinstance(value, dict):
+            raise TypeError('Entity attributes must be a dict')
+
+        entity_type = value.get('type')
+        if entity_type is None:
+            return Entity(**value)
+
+        try:
+            entity_class = Entity.get_entity_class(entity_type)
+        except KeyError:
+            entity_class = Entity
+
+        return entity_class(**value)
+
+
+class EntityResponse(Response[_EntityByType]):  # type: ignore
+    pass
@@ -0,0 +1,111 @@
+import logging
+from typing import Any, Dict, Optional, Union
+
+from signals_notebook.common_types import EID, EntityShortDescription, EntityType
+from signals_notebook.entities.entity import Entity
+
+log = logging.getLogger(__name__)
+
+
+class EntityRef:
+    """Lightweight reference to Entity which is validated only when it is needed
+
+    Entity ID, type and name are available right away. Accessing any other attribute or method
+    turns the reference into the full Entity subclass built from the already fetched attributes.
+    """
+
+    __slots__ = ('eid', 'type', 'name', '_attributes', '_entity')
+
+    def __init__(self, attributes: Dict[str, Any]):
+        """
+        Args:
+            attributes: decoded JSON of entity attributes. It is kept until the entity is hydrated
+        """
+        entity_type = attributes['type']
+        try:
+            entity_type = EntityType(entity_type)
+        except ValueError:
+            pass
+
+        object.__setattr__(self, 'eid', EID(attributes['eid'], validate=False))
+        object.__setattr__(self, 'type', entity_type)
+        object.__setattr__(self, 'name', attributes.get('name'))
+        object.__setattr__(self, '_attributes', attributes)
+        object.__setattr__(self, '_entity', None)
+
+    eid: EID
+    type: Union[EntityType, str]
+    name: Optional[str]
+
+    @classmethod
+    def from_item(cls, item: Dict[str, Any]) -> 'EntityRef':
+        """Create reference from decoded JSON of response data item
+
+        Args:
+            item: response data item with attributes of entity
+
+        Returns:
+            EntityRef
+        """
+        return cls(item['attributes'])
+
+    @property
+    def short_description(self) -> EntityShortDescription:
+        """Get short description of referenced entity
+
+        Returns:
+            EntityShortDescription
+        """
+        return EntityShortDescription.construct(type=self.type, id=self.eid)
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Check if referenced entity has already been validated
+
+        Returns:
+            bool
+        """
+        return self._entity is not None
+
+    def hydrate(self) -> Entity:
+        """Get the full Entity subclass of referenced entity
+
+        If EntityStore keeps an identity map, the entity is merged into it, so the same object is shared
+        with entities fetched in other ways.
+
+        Returns:
+            Entity
+        """
+        from signals_notebook.entities import EntityStore
+
+        entity = self._entity
+        if entity is None:
+            log.debug('Hydrating %s...', self.eid)
+            try:
+                entity_class = Entity.get_entity_class(self.type)
+            except KeyError:
+                entity_class = Entity
+            entity = entity_class(**self._attributes)
+            identity_map = EntityStore._identity_map
+            if identity_map is not None:
+                entity = identity_map.merge(entity)
+            object.__setattr__(self, '_entity', entity)
+            object.__setattr__(self, '_attributes', None)
+
+        return entity
+
+    def __getattr__(self, name: str) -> Any:
+        if name in EntityRef.__slots__ or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.hydrate(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        entity = self.hydrate()
+        setattr(entity, name, value)
+        if name in EntityRef.__slots__:
+            object.__setattr__(self, name, getattr(entity, name))
+
+    def __str__(self) -> str:
+        return f'<{self.__class__.__name__} type={getattr(self.type, "value", self.type)} eid={self.eid}>'
+
+    __repr__ = __str__
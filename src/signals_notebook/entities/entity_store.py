@@ -2,12 +2,16 @@ import json
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import cast, Generator, List, Optional, Union
+from typing import Any, AsyncGenerator, cast, Dict, Generator, Iterable, List, Optional, Union
 
-from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import EID, EntityType, Response, ResponseData
+from signals_notebook.api import AsyncSignalsNotebookApi, SignalsNotebookApi
+from signals_notebook.common_types import EID, EntityType, ResponseData
 from signals_notebook.entities import Entity
-from signals_notebook.utils import FSHandler
+from signals_notebook.entities.entity_ref import EntityRef
+from signals_notebook.utils import AsyncPaginator, FSHandler, map_concurrently, Paginator
+from signals_notebook.utils.concurrency import DEFAULT_MAX_WORKERS
+from signals_notebook.utils.identity_map import IdentityMap
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -27,21 +31,50 @@ class EntityStore:
         SYSTEM_TEMPLATE = 'systemTemplate'
         NON_SYSTEM_TEMPLATE = 'nonSystemTemplate'
 
+    _identity_map: Optional[IdentityMap] = None
+
     @staticmethod
     def _get_endpoint() -> str:
         return 'entities'
 
+    @classmethod
+    def set_identity_map(cls, identity_map: Optional[IdentityMap]) -> None:
+        """Enable in-process cache of entities
+
+        While it is enabled, the same Entity ID resolves to the same Python object.
+
+        Args:
+            identity_map: IdentityMap used to cache entities. None disables caching
+
+        Returns:
+
+        """
+        cls._identity_map = identity_map
+
     @classmethod
     def get(cls, eid: EID) -> Entity:
         """Get Entity by ID
 
+        If identity map is enabled, cached Entity is returned while it is fresh.
+
         Args:
             eid: Entity ID
 
         Returns:
             Entity
         """
+        identity_map = cls._identity_map
+        if identity_map is not None:
+            cached_entity = identity_map.get(eid)
+            if cached_entity is not None:
+                log.debug('Entity: %s was got from identity map.', eid)
+                return cached_entity
+
+        entity = cls._fetch(eid)
+        return identity_map.merge(entity) if identity_map is not None else entity
 
+    @classmethod
+    def _fetch(cls, eid: EID) -> Entity:
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get Entity: %s from EntityStore...', eid)
 
@@ -50,8 +83,7 @@ class EntityStore:
             path=(cls._get_endpoint(), eid),
         )
 
-        entity_classes = (*Entity.get_subclasses(), Entity)
-        result = Response[Union[entity_classes]](**response.json())  # type: ignore
+        result = Entity.get_response_class()(**response.json())
         log.debug('Entity: %s was got successfully from EntityStore.', eid)
 
         return cast(ResponseData, result.data).body
@@ -64,6 +96,7 @@ class EntityStore:
         include_options: Optional[List[IncludeOptions]] = None,
         modified_after: Optional[datetime] = None,
         modified_before: Optional[datetime] = None,
+        prefetch: int = DEFAULT_PREFETCH,
     ) -> Generator[Entity, None, None]:
         """Get all entities
 
@@ -75,13 +108,167 @@ class EntityStore:
             include_options: Flags of entities, separated by comma ','.
             modified_after: Return the entities which are modified after start time.
             modified_before: Return the entities which are modified before end time.
+            prefetch: Number of pages fetched in background ahead of consumer. 0 disables prefetching.
 
         Returns:
             Entity
         """
-        api = SignalsNotebookApi.get_default_api()
         log.debug('Get List of Entities from EntityStore...')
 
+        params = cls._get_list_params(
+            include_types=include_types,
+            exclude_types=exclude_types,
+            include_options=include_options,
+            modified_after=modified_after,
+            modified_before=modified_before,
+        )
+
+        identity_map = cls._identity_map
+        for item in cls._get_list_pages(params, prefetch):
+            entity = cast(ResponseData, item).body
+            yield identity_map.merge(entity) if identity_map is not None else entity
+
+        log.debug('List of Entities were got successfully from EntityStore.')
+
+    @classmethod
+    def get_list_refs(
+        cls,
+        include_types: Optional[List[EntityType]] = None,
+        exclude_types: Optional[List[EntityType]] = None,
+        include_options: Optional[List[IncludeOptions]] = None,
+        modified_after: Optional[datetime] = None,
+        modified_before: Optional[datetime] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Generator[EntityRef, None, None]:
+        """Get lightweight references to all entities
+
+        Reference is validated only when attribute other than eid, type or name is accessed.
+
+        Args:
+            include_types: Included entity types, separated by comma ','.
+                For example, 'experiment, journal, ado'.
+                The default include types are experiment, request and journal.
+            exclude_types: Excluded entity types, separated by comma ','. For example, 'experiment, journal'.
+            include_options: Flags of entities, separated by comma ','.
+            modified_after: Return the entities which are modified after start time.
+            modified_before: Return the entities which are modified before end time.
+            prefetch: Number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            EntityRef
+        """
+        log.debug('Get List of Entity references from EntityStore...')
+
+        params = cls._get_list_params(
+            include_types=include_types,
+            exclude_types=exclude_types,
+            include_options=include_options,
+            modified_after=modified_after,
+            modified_before=modified_before,
+        )
+
+        yield from (EntityRef.from_item(item) for item in cls._get_list_pages(params, prefetch).iter_raw())
+
+    @classmethod
+    def _get_list_pages(cls, params: Dict[str, Any], prefetch: int) -> Paginator:
+        api = SignalsNotebookApi.get_default_api()
+        return Paginator(
+            api,
+            Entity.get_response_class(),
+            prefetch=prefetch,
+            path=(cls._get_endpoint(),),
+            params=params or None,
+        )
+
+    @classmethod
+    def get_many(cls, eids: Iterable[EID], max_workers: int = DEFAULT_MAX_WORKERS) -> List[Union[Entity, Exception]]:
+        """Get several Entities by ID concurrently
+
+        Args:
+            eids: Entity IDs
+            max_workers: maximum number of requests sent at the same time
+
+        Returns:
+            list of Entities in the order of eids. If Entity can not be fetched,
+            the raised exception is returned at its position instead.
+        """
+        log.debug('Get several Entities from EntityStore using %s workers...', max_workers)
+        return map_concurrently(cls.get, eids, max_workers=max_workers)
+
+    @classmethod
+    async def get_async(cls, eid: EID) -> Entity:
+        """Get Entity by ID using AsyncSignalsNotebookApi
+
+        Args:
+            eid: Entity ID
+
+        Returns:
+            Entity
+        """
+        api = AsyncSignalsNotebookApi.get_default_api()
+        log.debug('Get Entity: %s from EntityStore asynchronously...', eid)
+
+        response = await api.call(
+            method='GET',
+            path=(cls._get_endpoint(), eid),
+        )
+
+        result = Entity.get_response_class()(**response.json())
+        log.debug('Entity: %s was got successfully from EntityStore.', eid)
+
+        return cast(ResponseData, result.data).body
+
+    @classmethod
+    async def get_list_async(
+        cls,
+        include_types: Optional[List[EntityType]] = None,
+        exclude_types: Optional[List[EntityType]] = None,
+        include_options: Optional[List[IncludeOptions]] = None,
+        modified_after: Optional[datetime] = None,
+        modified_before: Optional[datetime] = None,
+    ) -> AsyncGenerator[Entity, None]:
+        """Get all entities using AsyncSignalsNotebookApi
+
+        Args:
+            include_types: Included entity types.
+            exclude_types: Excluded entity types.
+            include_options: Flags of entities.
+            modified_after: Return the entities which are modified after start time.
+            modified_before: Return the entities which are modified before end time.
+
+        Returns:
+            Entity
+        """
+        api = AsyncSignalsNotebookApi.get_default_api()
+        log.debug('Get List of Entities from EntityStore asynchronously...')
+
+        params = cls._get_list_params(
+            include_types=include_types,
+            exclude_types=exclude_types,
+            include_options=include_options,
+            modified_after=modified_after,
+            modified_before=modified_before,
+        )
+
+        pages = AsyncPaginator(
+            api,
+            Entity.get_response_class(),
+            path=(cls._get_endpoint(),),
+            params=params or None,
+        )
+        async for item in pages:
+            yield cast(ResponseData, item).body
+
+        log.debug('List of Entities were got successfully from EntityStore.')
+
+    @staticmethod
+    def _get_list_params(
+        include_types: Optional[List[EntityType]] = None,
+        exclude_types: Optional[List[EntityType]] = None,
+        include_options: Optional[List[IncludeOptions]] = None,
+        modified_after: Optional[datetime] = None,
+        modified_before: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
         params = {}
         if include_types:
             params['includeTypes'] = ','.join(include_types)
@@ -94,27 +281,7 @@ class EntityStore:
         if modified_before:
             params['end'] = modified_before.isoformat()
 
-        entity_classes = (*Entity.get_subclasses(), Entity)
-
-        response = api.call(
-            method='GET',
-            path=(cls._get_endpoint(),),
-            params=params or None,
-        )
-
-        result = Response[Union[entity_classes]](**response.json())  # type: ignore
-        yield from [cast(ResponseData, item).body for item in result.data]
-
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
-
-            result = Response[Union[entity_classes]](**response.json())  # type: ignore
-            yield from [cast(ResponseData, item).body for item in result.data]
-
-        log.debug('List of Entities were got successfully from EntityStore.')
+        return params
 
     @classmethod
     def refresh(cls, entity: Entity) -> None:
@@ -126,12 +293,18 @@ class EntityStore:
         Returns:
 
         """
-        refreshed_entity = cls.get(entity.eid)
+        refreshed_entity = cls._fetch(entity.eid)
+        if cls._identity_map is not None:
+            cls._identity_map.merge(refreshed_entity)
+
         for field in entity.__fields__.values():
             if field.field_info.allow_mutation:
                 new_value = getattr(refreshed_entity, field.name)
                 setattr(entity, field.name, new_value)
 
+        object.__setattr__(entity, 'digest', refreshed_entity.digest)
+        entity._digest_fetched_at = refreshed_entity._digest_fetched_at
+
     @classmethod
     def delete(cls, eid: EID, digest: Optional[str] = None, force: bool = True) -> None:
         """Delete Entity by ID
@@ -157,6 +330,8 @@ class EntityStore:
                 'force': json.dumps(force),
             },
         )
+        if cls._identity_map is not None:
+            cls._identity_map.invalidate(eid)
         log.debug('Entity: %s was deleted from EntityStore successfully', eid)
 
     @classmethod
@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -35,7 +35,7 @@ class Excel(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = ContentType.XLSX,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create Excel Entity
@@ -44,7 +44,7 @@ class Excel(ContentfulEntity):
             container: Container where create new Excel
             name: file name
             content_type: content type of Excel entity
-            content: Excel content
+            content: Excel content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
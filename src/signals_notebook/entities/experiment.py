@@ -2,17 +2,21 @@ import json
 import logging
 from enum import Enum
 from functools import cached_property
-from typing import Any, cast, ClassVar, Dict, Generator, List, Literal, Optional, Union
+from typing import Any, AsyncGenerator, cast, ClassVar, Dict, Generator, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
 from signals_notebook.common_types import Ancestors, EntityCreationRequestPayload, EntityType, Template
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
+from signals_notebook.entities.entity_ref import EntityRef
 from signals_notebook.entities.notebook import Notebook
 from signals_notebook.entities.stoichiometry.stoichiometry import Stoichiometry
 from signals_notebook.jinja_env import env
+from signals_notebook.utils.dump_manifest import DumpManifest
 from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.load_journal import LoadJournal
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -132,74 +136,136 @@ class Experiment(Container):
 
         return template.render(data=data)
 
-    def get_children(self, order: Optional[str] = 'layout') -> Generator[Entity, None, None]:
+    def get_children(
+        self, order: Optional[str] = 'layout', prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator[Entity, None, None]:
         """Get children of Experiment.
 
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
             list of Entities
         """
-        return super().get_children(order=order)
+        return super().get_children(order=order, prefetch=prefetch)
+
+    def get_children_refs(
+        self, order: Optional[str] = 'layout', prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator[EntityRef, None, None]:
+        """Get lightweight references to children of Experiment.
+
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            list of EntityRefs
+        """
+        return super().get_children_refs(order=order, prefetch=prefetch)
+
+    def get_children_async(self, order: Optional[str] = 'layout') -> AsyncGenerator[Entity, None]:
+        """Get children of Experiment using AsyncSignalsNotebookApi.
+
+        Returns:
+            list of Entities
+        """
+        return super().get_children_async(order=order)
 
     @classmethod
-    def load(cls, path: str, fs_handler: FSHandler, notebook: Notebook) -> None:
+    def load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        notebook: Notebook,
+        max_workers: int = 1,
+        journal: Optional[LoadJournal] = None,
+    ) -> None:
         """Load Experiment entity
 
         Args:
             path: content path
             fs_handler: FSHandler
             notebook: Container where load Experiment entity
+            max_workers: number of sibling entities loaded concurrently on every level
+            journal: (optional) journal of restore. If restore is interrupted, loading with the same journal
+                resumes it without creating already restored entities again
 
         Returns:
 
         """
-        cls._load(path, fs_handler, notebook)
+        if journal and journal.is_completed(path):
+            log.info('%s has already been restored', path)
+            return
 
-    @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
+        cls._load(path, fs_handler, notebook, journal=journal, max_workers=max_workers)
+        if journal:
+            journal.mark_completed(path)
 
+    @classmethod
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        try:
-            experiment = cls.create(
-                notebook=parent,
-                name=metadata['name'],
-                description=metadata['description'],
-                force=True,
-                attributes=dict(
-                    organization=metadata['Organization'],
-                    project=metadata['Project'],
-                    modality=metadata['Modality'],
-                    department=metadata['Department'],
-                ),
-            )
-        except Exception as e:
-            log.error(str(e))
-            if 'According to template, name is auto generated, can not be specified' in str(e):
-                log.error('Retrying create')
-                experiment = cls.create(
+        attributes = dict(
+            organization=metadata['Organization'],
+            project=metadata['Project'],
+            modality=metadata['Modality'],
+            department=metadata['Department'],
+        )
+
+        def _create() -> Experiment:
+            try:
+                return cls.create(
                     notebook=parent,
+                    name=metadata['name'],
                     description=metadata['description'],
                     force=True,
-                    attributes=dict(
-                        organization=metadata['Organization'],
-                        project=metadata['Project'],
-                        modality=metadata['Modality'],
-                        department=metadata['Department'],
-                    ),
+                    attributes=attributes,
                 )
-            else:
-                raise e
-        child_entities_folders = fs_handler.list_subfolders(path)
-        for child_entity in child_entities_folders:
-            child_entity_type = child_entity.split(':')[0]
-            try:
-                ItemMapper.get_item_class(child_entity_type)._load(
-                    fs_handler.join_path(path, child_entity), fs_handler, experiment
-                )
-            except NotImplementedError:
-                log.error('Failed to load entity %s. Not supported' % child_entity_type)
+            except Exception as e:
+                log.error(str(e))
+                if 'According to template, name is auto generated, can not be specified' in str(e):
+                    log.error('Retrying create')
+                    return cls.create(
+                        notebook=parent,
+                        description=metadata['description'],
+                        force=True,
+                        attributes=attributes,
+                    )
+                else:
+                    raise e
+
+        experiment = cls._restore(path, _create, journal)
+        cls._load_children(
+            path, fs_handler, experiment, journal=journal, max_workers=max_workers, skip_not_implemented=True
+        )
+
+    def dump(
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]] = None,
+        max_workers: int = 1,
+        manifest: Optional[DumpManifest] = None,
+    ) -> None:
+        """Dump Experiment entity
 
-    def dump(self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None) -> None:
+        Args:
+            base_path: content path where create dump
+            fs_handler: FSHandler
+            alias: Backup alias
+            max_workers: number of children dumped concurrently
+            manifest: (optional) manifest of incremental dump. Unchanged children are not dumped again
+
+        Returns:
+
+        """
         metadata = {k: v for k, v in self.dict().items() if k in ('name', 'description', 'eid')}
         self._reload_properties()
         for prop in self._properties:
@@ -211,10 +277,12 @@ class Experiment(Container):
             json.dumps(metadata),
             alias + [self.name, '__Metadata'] if alias else None,
         )
-        for child in self.get_children():
-            try:
-                child.dump(
-                    fs_handler.join_path(base_path, self.eid), fs_handler, alias + [self.name] if alias else None
-                )
-            except Exception as e:
-                log.error(str(e))
+        self._dump_children(
+            self.get_children(),
+            fs_handler.join_path(base_path, self.eid),
+            fs_handler,
+            alias + [self.name] if alias else None,
+            max_workers=max_workers,
+            manifest=manifest,
+            isolate_errors=True,
+        )
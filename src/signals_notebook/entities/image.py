@@ -5,7 +5,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -36,7 +36,7 @@ class Image(ContentfulEntity):
         *,
         container: Container,
         name: str,
-        content: bytes = b'',
+        content: UploadContent = b'',
         content_type: str = ContentType.PNG,
         force: bool = True,
     ) -> Entity:
@@ -46,7 +46,7 @@ class Image(ContentfulEntity):
             container: Container where create new Image
             name: file name
             content_type: content type of Image entity
-            content: Image content
+            content: Image content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
@@ -1,12 +1,15 @@
 import json
 import logging
+from datetime import datetime, timezone
 from typing import Any, cast, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
 from signals_notebook.common_types import EntityCreationRequestPayload, EntityType
 from signals_notebook.entities.container import Container
+from signals_notebook.utils.dump_manifest import DumpManifest, MANIFEST_FILE_NAME
 from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.load_journal import LoadJournal
 
 log = logging.getLogger(__name__)
 
@@ -65,7 +68,26 @@ class Notebook(Container):
         log.debug('Creating Notebook for: %s', cls.__name__)
         return cast('Notebook', super()._create(digest=digest, force=force, request=request))
 
-    def dump(self, base_path: str, fs_handler: FSHandler, alias: Optional[List[str]] = None) -> None:
+    def dump(
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        alias: Optional[List[str]] = None,
+        max_workers: int = 1,
+        manifest: Optional[DumpManifest] = None,
+    ) -> None:
+        """Dump Notebook entity
+
+        Args:
+            base_path: content path where create dump
+            fs_handler: FSHandler
+            alias: Backup alias
+            max_workers: number of children dumped concurrently. Children of children are dumped one at a time
+            manifest: (optional) manifest of incremental dump. Unchanged children are not dumped again
+
+        Returns:
+
+        """
         metadata = {k: v for k, v in self.dict().items() if k in ('name', 'description', 'eid')}
         self._reload_properties()
         for prop in self._properties:
@@ -76,37 +98,114 @@ class Notebook(Container):
             json.dumps(metadata),
             alias + [self.name, '__Metadata'] if alias else None,
         )
-        for child in self.get_children(order=None):
-            child.dump(base_path + '/' + self.eid, fs_handler, alias + [self.name] if alias else None)
+        self._dump_children(
+            self.get_children(order=None),
+            base_path + '/' + self.eid,
+            fs_handler,
+            alias + [self.name] if alias else None,
+            max_workers=max_workers,
+            manifest=manifest,
+        )
 
-    @classmethod
-    def load(cls, path: str, fs_handler: FSHandler) -> None:
-        cls._load(path, fs_handler, None)
+    def dump_incremental(
+        self,
+        base_path: str,
+        fs_handler: FSHandler,
+        previous_manifest: Optional[DumpManifest] = None,
+        alias: Optional[List[str]] = None,
+        max_workers: int = 1,
+    ) -> DumpManifest:
+        """Dump only entities changed since the previous dump
+
+        Entities of all types modified after the previous dump are listed with EntityStore.get_list_refs,
+        and digest of every child is compared with the previous manifest.
+        Unchanged entities are not exported again and their entries point to the previous dump.
+        The new manifest is written to <base_path>/<eid>/manifest.json.
+
+        Args:
+            base_path: content path where create dump
+            fs_handler: FSHandler
+            previous_manifest: (optional) manifest of the previous dump. Full dump is made if it is not passed
+            alias: Backup alias
+            max_workers: number of children dumped concurrently
+
+        Returns:
+            manifest of the dump
+        """
+        from signals_notebook.entities import EntityStore
+
+        started_at = datetime.now(timezone.utc)
+        changed_eids = None
+        if previous_manifest is not None:
+            modified_entities = EntityStore.get_list_refs(
+                include_types=list(EntityType), modified_after=previous_manifest.created_at
+            )
+            changed_eids = {entity.eid for entity in modified_entities}
+            log.debug('%s entities were modified since the previous dump', len(changed_eids))
+
+        manifest = DumpManifest(previous=previous_manifest, changed_eids=changed_eids, created_at=started_at)
+        self.dump(base_path, fs_handler, alias, max_workers=max_workers, manifest=manifest)
+        manifest.record(self, fs_handler.join_path(base_path, self.eid))
+        manifest.save(fs_handler, fs_handler.join_path(base_path, self.eid, MANIFEST_FILE_NAME))
+
+        return manifest
 
     @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
+    def load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        max_workers: int = 1,
+        journal: Optional[LoadJournal] = None,
+    ) -> None:
+        """Load Notebook entity
+
+        Args:
+            path: content path
+            fs_handler: FSHandler
+            max_workers: number of sibling entities loaded concurrently on every level
+            journal: (optional) journal of restore. If restore is interrupted, loading with the same journal
+                resumes it without creating already restored entities again
+
+        Returns:
 
+        """
+        if journal and journal.is_completed(path):
+            log.info('%s has already been restored', path)
+            return
+
+        cls._load(path, fs_handler, None, journal=journal, max_workers=max_workers)
+        if journal:
+            journal.mark_completed(path)
+
+    @classmethod
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        try:
-            notebook = cls.create(
-                name='restore:' + metadata['name'],
-                description=metadata['description'],
-                organization=metadata['Organization'],
-                force=True,
-            )
-        except Exception as e:
-            log.error(str(e))
-            if 'According to template, name is auto generated, can not be specified' in str(e):
-                log.error('Retrying create')
-                notebook = cls.create(
-                    description=metadata['description'], organization=metadata['Organization'], force=True
+
+        def _create() -> Notebook:
+            try:
+                return cls.create(
+                    name='restore:' + metadata['name'],
+                    description=metadata['description'],
+                    organization=metadata['Organization'],
+                    force=True,
                 )
-            else:
-                raise e
-        child_entities_folders = fs_handler.list_subfolders(path)
-        for child_entity in child_entities_folders:
-            child_entity_type = child_entity.split(':')[0]
-            ItemMapper.get_item_class(child_entity_type)._load(
-                fs_handler.join_path(path, child_entity), fs_handler, notebook
-            )
+            except Exception as e:
+                log.error(str(e))
+                if 'According to template, name is auto generated, can not be specified' in str(e):
+                    log.error('Retrying create')
+                    return cls.create(
+                        description=metadata['description'], organization=metadata['Organization'], force=True
+                    )
+                else:
+                    raise e
+
+        notebook = cls._restore(path, _create, journal)
+        cls._load_children(path, fs_handler, notebook, journal=journal, max_workers=max_workers)
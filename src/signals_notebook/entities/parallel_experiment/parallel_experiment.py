@@ -14,9 +14,12 @@ from signals_notebook.common_types import (
 )
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
+from signals_notebook.entities.entity_ref import EntityRef
 from signals_notebook.entities.notebook import Notebook
 from signals_notebook.jinja_env import env
 from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.load_journal import LoadJournal
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -104,13 +107,29 @@ class ParallelExperiment(Container):
         log.debug('Creating Parallel Experiment for: %s', cls.__name__)
         return cast('ParallelExperiment', super()._create(digest=digest, force=force, request=request))
 
-    def get_children(self, order='') -> Generator[Entity, None, None]:
+    def get_children(self, order='', prefetch: int = DEFAULT_PREFETCH) -> Generator[Entity, None, None]:
         """Get children of SubExperiment.
 
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
             list of Entities
         """
-        return super().get_children(order=order)
+        return super().get_children(order=order, prefetch=prefetch)
+
+    def get_children_refs(self, order='', prefetch: int = DEFAULT_PREFETCH) -> Generator[EntityRef, None, None]:
+        """Get lightweight references to children of ParallelExperiment.
+
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            list of EntityRefs
+        """
+        return super().get_children_refs(order=order, prefetch=prefetch)
 
     def get_html(self) -> str:
         """Get in HTML format
@@ -136,24 +155,30 @@ class ParallelExperiment(Container):
         cls._load(path, fs_handler, notebook)
 
     @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
-
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        experiment = cls.create(notebook=parent, name=metadata['name'], description=metadata['description'], force=True)
-        experiment_children = [
-            child for child in experiment.get_children() if child.type != EntityType.SUB_EXPERIMENT_SUMMARY
-        ]
-
-        for child_entity in experiment_children:
-            child_entity.delete()
-
-        child_entities_folders = fs_handler.list_subfolders(path)
-        for folder in child_entities_folders:
-            child_entity_type = folder.split(':')[0]
-            try:
-                ItemMapper.get_item_class(child_entity_type)._load(
-                    fs_handler.join_path(path, folder), fs_handler, experiment
-                )
-            except NotImplementedError:
-                log.info('Entity %s is not implemented.', folder)
+
+        def _create() -> ParallelExperiment:
+            experiment = cls.create(
+                notebook=parent, name=metadata['name'], description=metadata['description'], force=True
+            )
+            experiment_children = [
+                child for child in experiment.get_children() if child.type != EntityType.SUB_EXPERIMENT_SUMMARY
+            ]
+
+            for child_entity in experiment_children:
+                child_entity.delete()
+
+            return experiment
+
+        experiment = cls._restore(path, _create, journal)
+        cls._load_children(
+            path, fs_handler, experiment, journal=journal, max_workers=max_workers, skip_not_implemented=True
+        )
@@ -19,9 +19,12 @@ from signals_notebook.entities.chemical_drawing import (
     Structure,
 )
 from signals_notebook.entities.container import Container
+from signals_notebook.entities.entity_ref import EntityRef
 from signals_notebook.entities.parallel_experiment.parallel_experiment import ParallelExperiment
 from signals_notebook.jinja_env import env
 from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.load_journal import LoadJournal
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -56,13 +59,29 @@ class SubExperiment(Container):
     def _get_entity_type(cls) -> EntityType:
         return EntityType.SUB_EXPERIMENT
 
-    def get_children(self, order='') -> Generator[Entity, None, None]:
+    def get_children(self, order='', prefetch: int = DEFAULT_PREFETCH) -> Generator[Entity, None, None]:
         """Get children of SubExperiment.
 
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
             list of Entities
         """
-        return super().get_children(order=order)
+        return super().get_children(order=order, prefetch=prefetch)
+
+    def get_children_refs(self, order='', prefetch: int = DEFAULT_PREFETCH) -> Generator[EntityRef, None, None]:
+        """Get lightweight references to children of SubExperiment.
+
+        Args:
+            order: order of children
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            list of EntityRefs
+        """
+        return super().get_children_refs(order=order, prefetch=prefetch)
 
     @classmethod
     def create(
@@ -131,44 +150,68 @@ class SubExperiment(Container):
         cls._load(path, fs_handler, parallel_experiment)
 
     @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
-
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        sub_experiment = cls.create(parallel_experiment=parent, description=metadata['description'], force=True)
+        sub_experiment = cls._restore(
+            path,
+            lambda: cls.create(parallel_experiment=parent, description=metadata['description'], force=True),
+            journal,
+        )
         existing_chemical_drawing = [
             cast(ChemicalDrawing, i) for i in sub_experiment.get_children() if i.type == EntityType.CHEMICAL_DRAWING
         ][0]
 
         child_entities_folders = fs_handler.list_subfolders(path)
-        for child_entity in child_entities_folders:
-            child_path = fs_handler.join_path(path, child_entity)
-            metadata = json.loads(fs_handler.read(fs_handler.join_path(child_path, 'metadata.json')))
-            child_entity_type = child_entity.split(':')[0]
-            entity_type = ItemMapper.get_item_class(child_entity_type)
-
-            if child_entity_type == EntityType.CHEMICAL_DRAWING:
-
-                if not metadata.get('reactants') or not metadata.get('products'):
-                    continue
-                cls._add_structures_from_metadata(
-                    metadata['reactants'],
-                    ChemicalStructure.REACTANT,
-                    ChemicalDrawingPosition.REACTANTS,
-                    existing_chemical_drawing,
-                )
-                cls._add_structures_from_metadata(
-                    metadata['products'],
-                    ChemicalStructure.PRODUCT,
-                    ChemicalDrawingPosition.PRODUCTS,
-                    existing_chemical_drawing,
-                )
-                cls._add_structures_from_metadata(
-                    metadata['reagents'],
-                    ChemicalStructure.REAGENT,
-                    ChemicalDrawingPosition.REAGENTS,
-                    existing_chemical_drawing,
-                )
-
-            else:
-                entity_type._load(fs_handler.join_path(path, child_entity), fs_handler, sub_experiment)
+        drawing_folders = [
+            folder for folder in child_entities_folders if folder.split(':')[0] == EntityType.CHEMICAL_DRAWING
+        ]
+        for folder in drawing_folders:
+            drawing_path = fs_handler.join_path(path, folder)
+            if journal and journal.is_completed(drawing_path):
+                continue
+            cls._load_chemical_drawing(drawing_path, fs_handler, existing_chemical_drawing)
+            if journal:
+                journal.mark_completed(drawing_path)
+
+        cls._load_children(
+            path,
+            fs_handler,
+            sub_experiment,
+            journal=journal,
+            max_workers=max_workers,
+            folders=[folder for folder in child_entities_folders if folder not in drawing_folders],
+        )
+
+    @classmethod
+    def _load_chemical_drawing(
+        cls, path: str, fs_handler: FSHandler, existing_chemical_drawing: ChemicalDrawing
+    ) -> None:
+        metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
+        if not metadata.get('reactants') or not metadata.get('products'):
+            return
+
+        cls._add_structures_from_metadata(
+            metadata['reactants'],
+            ChemicalStructure.REACTANT,
+            ChemicalDrawingPosition.REACTANTS,
+            existing_chemical_drawing,
+        )
+        cls._add_structures_from_metadata(
+            metadata['products'],
+            ChemicalStructure.PRODUCT,
+            ChemicalDrawingPosition.PRODUCTS,
+            existing_chemical_drawing,
+        )
+        cls._add_structures_from_metadata(
+            metadata['reagents'],
+            ChemicalStructure.REAGENT,
+            ChemicalDrawingPosition.REAGENTS,
+            existing_chemical_drawing,
+        )
@@ -3,7 +3,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, FileStream
 from signals_notebook.entities.contentful_entity import ContentfulEntity
 
 log = logging.getLogger(__name__)
@@ -19,3 +19,6 @@ class SubExperimentLayout(ContentfulEntity):
 
     def get_content(self) -> File:
         return super()._get_content(format='csv')
+
+    def get_content_stream(self) -> FileStream:
+        return super()._get_content_stream(format='csv')
@@ -7,7 +7,7 @@ from uuid import UUID
 from pydantic import Field, PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import EntityType, File, Response, ResponseData
+from signals_notebook.common_types import EntityType, File, FileStream, Response, ResponseData
 from signals_notebook.entities.contentful_entity import ContentfulEntity
 from signals_notebook.entities.parallel_experiment.row import Row
 from signals_notebook.jinja_env import env
@@ -109,6 +109,7 @@ class SubExperimentSummary(ContentfulEntity):
         if not request_body:
             return
 
+        self._invalidate_digest()
         update_response = api.call(
             method='PATCH',
             path=(self._get_subexpsum_endpoint(), self.eid, 'bulkUpdate'),
@@ -159,3 +160,11 @@ class SubExperimentSummary(ContentfulEntity):
             File
         """
         return super()._get_content(format='csv')
+
+    def get_content_stream(self) -> FileStream:
+        """Get SubExperiment Summary content which is downloaded chunk by chunk
+
+        Returns:
+            FileStream
+        """
+        return super()._get_content_stream(format='csv')
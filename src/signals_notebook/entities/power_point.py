@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -36,7 +36,7 @@ class PowerPoint(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = ContentType.PPTX,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create PowerPoint Entity
@@ -45,7 +45,7 @@ class PowerPoint(ContentfulEntity):
             container: Container where create new PowerPoint
             name: file name
             content_type: content type of PowerPoint entity
-            content: PowerPoint content
+            content: PowerPoint content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
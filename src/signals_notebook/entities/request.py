@@ -9,7 +9,7 @@ from signals_notebook.common_types import Ancestors, EntityCreationRequestPayloa
 from signals_notebook.entities import Notebook
 from signals_notebook.entities.container import Container
 from signals_notebook.jinja_env import env
-from signals_notebook.utils import FSHandler
+from signals_notebook.utils import FSHandler, LoadJournal
 
 log = logging.getLogger(__name__)
 
@@ -114,16 +114,20 @@ class RequestContainer(Container):
         cls._load(path, fs_handler, notebook)
 
     @classmethod
-    def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.item_mapper import ItemMapper
-
+    def _load(
+        cls,
+        path: str,
+        fs_handler: FSHandler,
+        parent: Any,
+        journal: Optional[LoadJournal] = None,
+        max_workers: int = 1,
+    ) -> None:
         metadata = json.loads(fs_handler.read(fs_handler.join_path(path, 'metadata.json')))
-        request_container = cls.create(
-            notebook=parent, name=metadata['name'], description=metadata['description'], force=True
+        request_container = cls._restore(
+            path,
+            lambda: cls.create(
+                notebook=parent, name=metadata['name'], description=metadata['description'], force=True
+            ),
+            journal,
         )
-        child_entities_folders = fs_handler.list_subfolders(path)
-        for child_entity in child_entities_folders:
-            child_entity_type = child_entity.split(':')[0]
-            ItemMapper.get_item_class(child_entity_type)._load(
-                fs_handler.join_path(path, child_entity), fs_handler, request_container
-            )
+        cls._load_children(path, fs_handler, request_container, journal=journal, max_workers=max_workers)
@@ -136,6 +136,7 @@ class Sample(Entity):
         if not request_body:
             return
 
+        self._invalidate_digest()
         api.call(
             method='PATCH',
             path=(self._get_samples_endpoint(), self.eid, 'properties'),
@@ -238,7 +239,7 @@ class Sample(Entity):
 
     @classmethod
     def _load(cls, path: str, fs_handler: FSHandler, parent: Any) -> None:
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         log.debug('Loading sample from dump...')
 
@@ -260,19 +261,15 @@ class Sample(Entity):
                     pass
 
         column_definitions = metadata.get('columns')
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
+        template = TemplateIndex.get_default().find_by_columns(
+            entity_type, column_definitions, lambda item: cast('Sample', item).get_column_definitions_list()
         )
-        for item in templates:
-            template = cast('Sample', item)
-            template_column_definitions = template.get_column_definitions_list()
-            if set(template_column_definitions) == set(column_definitions):
-                cls.create(
-                    ancestors=[parent],
-                    template=template,
-                    cells=cells,
-                )
-                break
+        if template:
+            cls.create(
+                ancestors=[parent],
+                template=cast('Sample', template),
+                cells=cells,
+            )
 
     @classmethod
     def dump_templates(cls, base_path: str, fs_handler: FSHandler) -> None:
@@ -285,13 +282,11 @@ class Sample(Entity):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
 
         for template in templates:
             template.dump(
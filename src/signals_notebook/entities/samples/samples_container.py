@@ -13,7 +13,7 @@ from signals_notebook.entities import Sample
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
 from signals_notebook.jinja_env import env
-from signals_notebook.utils import FSHandler
+from signals_notebook.utils import FSHandler, Paginator
 
 log = logging.getLogger(__name__)
 
@@ -82,23 +82,12 @@ class SamplesContainer(ContentfulEntity):
         log.debug('Getting samples for Samples Container: %s...', self.eid)
         api = SignalsNotebookApi.get_default_api()
 
-        response = api.call(
-            method='GET',
+        pages = Paginator(
+            api,
+            SamplesContainerResponse,
             path=(super()._get_endpoint(), self.eid, 'children'),
         )
-
-        result = SamplesContainerResponse(**response.json())
-
-        yield from [cast(ResponseData, item).body for item in result.data]
-
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
-
-            result = SamplesContainerResponse(**response.json())
-            yield from [cast(ResponseData, item).body for item in result.data]
+        yield from (cast(ResponseData, item).body for item in pages)
         log.debug('Samples for SamplesContainer: %s were got successfully.', self.eid)
 
     def save(self, force: bool = True) -> None:
@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -30,7 +30,7 @@ class Spotfire(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = ContentType.DXP,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create Spotfiredxp Entity
@@ -39,7 +39,7 @@ class Spotfire(ContentfulEntity):
             container: Container where create new Excel
             name: file name
             content_type: content type of Spotfire entity
-            content: Excel content
+            content: Excel content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
@@ -0,0 +1,401 @@
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, cast, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+from signals_notebook.entities.tables.cell import (
+    CellContent,
+    ColumnDataType,
+    GenericColumnDefinition,
+    UnitColumnDefinition,
+    UpdateCellRequest,
+)
+from signals_notebook.entities.tables.row import (
+    ChangeRowRequest,
+    CreateRowActionBody,
+    CreateRowRequest,
+    UpdateRowActionBody,
+    UpdateRowRequest,
+)
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: int = 500
+DEFAULT_MAX_BATCH_BYTES: int = 4 * 1024 * 1024
+
+UpsertRow = Union[Mapping[str, Any], Tuple[Any, Mapping[str, Any]]]
+
+_BODY_START = '{"data": ['
+_BODY_END = ']}'
+_SEPARATOR = ', '
+_CREATE_ROW_START = '{"type": "adtRow", "attributes": {"action": "create", "cells": ['
+_CREATE_ROW_END = ']}}'
+_NUMBER_COLUMN_TYPES = (ColumnDataType.NUMBER, ColumnDataType.INTEGER, ColumnDataType.UNIT)
+
+
+class BatchResult:
+    def __init__(self, index: int, first_row: int, rows: int, size: int, error: Optional[Exception] = None):
+        """Outcome of one batch of rows sent by Table.bulk_upsert
+
+        Args:
+            index: number of batch starting from 0
+            first_row: position of the first row of batch in upserted rows
+            rows: number of rows in batch
+            size: size of request body in bytes
+            error: (optional) exception raised while sending batch
+        """
+        self.index = index
+        self.first_row = first_row
+        self.rows = rows
+        self.size = size
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Check if batch was saved
+
+        Returns:
+            bool
+        """
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = 'ok' if self.ok else f'failed: {self.error}'
+        return f'<BatchResult {self.index}: rows {self.first_row}-{self.first_row + self.rows - 1}, {status}>'
+
+
+class Batch:
+    def __init__(self, index: int, first_row: int):
+        """Batch of serialized row requests which are sent in one PATCH
+
+        Args:
+            index: number of batch starting from 0
+            first_row: position of the first row of batch in upserted rows
+        """
+        self.index = index
+        self.first_row = first_row
+        self.rows: List[str] = []
+        self.size = len(_BODY_START) + len(_BODY_END)
+
+    def get_size_with(self, row: str) -> int:
+        """Get body size in bytes if row is added
+
+        Args:
+            row: serialized row request
+
+        Returns:
+            int
+        """
+        return self.size + len(row.encode('utf-8')) + (len(_SEPARATOR) if self.rows else 0)
+
+    def add(self, row: str) -> None:
+        """Add serialized row request
+
+        Args:
+            row: serialized row request
+
+        Returns:
+
+        """
+        self.size = self.get_size_with(row)
+        self.rows.append(row)
+
+    @property
+    def body(self) -> str:
+        """Get request body equal to serialized ChangeTableDataRequest
+
+        Returns:
+            str
+        """
+        return _BODY_START + _SEPARATOR.join(self.rows) + _BODY_END
+
+
+def iter_upsert_rows(rows: Union[pd.DataFrame, Iterable[UpsertRow]]) -> Iterator[Tuple[Any, Mapping[str, Any]]]:
+    """Iterate over rows as pairs of row ID and values
+
+    Index of DataFrame is used as row ID. Iterable may contain dictionaries of values of new rows
+    or (row ID, values) pairs, e.g. produced by DataFrame.iterrows.
+
+    Args:
+        rows: DataFrame or iterable of rows
+
+    Returns:
+        (row ID or None, values)
+    """
+    if isinstance(rows, pd.DataFrame):
+        columns = list(rows.columns)
+        for row_id, *values in rows.itertuples(index=True, name=None):
+            yield row_id, dict(zip(columns, values))
+        return
+
+    for row in rows:
+        if isinstance(row, tuple):
+            yield cast(Tuple[Any, Mapping[str, Any]], row)
+        else:
+            yield None, row
+
+
+def build_row_request(
+    row_id: Any,
+    values: Mapping[Any, Any],
+    column_definitions_map: Dict[str, GenericColumnDefinition],
+) -> Optional[ChangeRowRequest]:
+    """Build request creating new row or updating existing one
+
+    Row is updated if row ID is UUID of table row, otherwise it is created. Columns which are not in table
+    and missing values are skipped.
+
+    Args:
+        row_id: row ID or None
+        values: mapping of column title or key to plain value or cell content dictionary
+        column_definitions_map: column definitions by title and key
+
+    Returns:
+        CreateRowRequest, UpdateRowRequest or None if there is nothing to save
+    """
+    cells = []
+    for column, value in values.items():
+        column_definition = column_definitions_map.get(str(column))
+        content = to_cell_content(value)
+        if column_definition is None or content is None:
+            continue
+        cells.append(UpdateCellRequest[Any](key=column_definition.key, content=CellContent[Any](**content)))
+
+    if not cells:
+        return None
+
+    uuid = _to_uuid(row_id)
+    if uuid is None:
+        return CreateRowRequest(attributes=CreateRowActionBody(cells=cells))
+
+    return UpdateRowRequest(id=uuid, attributes=UpdateRowActionBody(cells=cells))
+
+
+def to_cell_content(value: Any) -> Optional[Dict[str, Any]]:
+    """Convert plain value to cell content dictionary
+
+    Args:
+        value: plain value, list of values or cell content dictionary
+
+    Returns:
+        cell content dictionary or None if value is missing
+    """
+    if isinstance(value, dict):
+        return value
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        values = [_to_json_value(item) for item in value]
+        return {'value': ', '.join(str(item) for item in values), 'values': values}
+
+    if pd.isna(value):
+        return None
+
+    return {'value': _to_json_value(value)}
+
+
+def iter_batches(rows: Iterable[Optional[str]], batch_size: int, max_bytes: int) -> Iterator[Batch]:
+    """Split serialized row requests to batches limited by number of rows and body size
+
+    Row request larger than max_bytes is sent in its own batch.
+
+    Args:
+        rows: serialized row requests. None items are counted as rows but are not sent
+        batch_size: maximum number of rows in batch
+        max_bytes: maximum size of request body in bytes
+
+    Returns:
+        Batch
+    """
+    index = 0
+    batch = Batch(index, 0)
+    for position, row in enumerate(rows):
+        if row is None:
+            continue
+
+        if batch.rows and (len(batch.rows) >= batch_size or batch.get_size_with(row) > max_bytes):
+            yield batch
+            index += 1
+            batch = Batch(index, position)
+        elif not batch.rows:
+            batch.first_row = position
+
+        batch.add(row)
+        if batch.size > max_bytes:
+            log.warning('Row %s is larger than %s bytes, it is sent in a separate batch', position, max_bytes)
+
+    if batch.rows:
+        yield batch
+
+
+def serialize_columns(
+    dataframe: pd.DataFrame,
+    column_definitions: Optional[Sequence[Optional[GenericColumnDefinition]]] = None,
+) -> List[List[Optional[str]]]:
+    """Serialize cell contents of data table column by column
+
+    Numbers, booleans, date/times and categorical columns are converted with vectorized operations,
+    so only text and list values are serialized one by one. If column definition is given, values are
+    converted to its type: numbers are sent as integers to integer columns and with default unit to unit
+    columns, values of text columns are sent as strings and date/time strings are parsed for date/time columns.
+
+    Args:
+        dataframe: data table
+        column_definitions: (optional) column definitions in order of data table columns, None for unknown column
+
+    Returns:
+        list of columns. Column is a list of serialized cell contents, None for missing value
+    """
+    if column_definitions is None:
+        column_definitions = [None] * dataframe.shape[1]
+
+    return [
+        _serialize_column(dataframe.iloc[:, i], column_definition)
+        for i, column_definition in enumerate(column_definitions)
+    ]
+
+
+def iter_create_rows(keys: Sequence[str], columns: Sequence[List[Optional[str]]]) -> Iterator[Optional[str]]:
+    """Iterate over serialized requests creating rows from serialized columns
+
+    Args:
+        keys: column keys
+        columns: serialized cell contents of columns
+
+    Returns:
+        serialized CreateRowRequest or None if row has no values
+    """
+    prefixes = ['{"key": ' + json.dumps(key) + ', "content": ' for key in keys]
+    for cells in _iter_row_cells(prefixes, columns, '}'):
+        yield _CREATE_ROW_START + _SEPARATOR.join(cells) + _CREATE_ROW_END if cells else None
+
+
+def iter_json_document(names: Sequence[str], columns: Sequence[List[Optional[str]]]) -> Iterator[str]:
+    """Iterate over chunks of JSON table file from serialized columns
+
+    Args:
+        names: column names
+        columns: serialized cell contents of columns
+
+    Returns:
+        str
+    """
+    prefixes = [json.dumps(name) + ': ' for name in names]
+    yield _BODY_START
+    for i, cells in enumerate(_iter_row_cells(prefixes, columns, '')):
+        yield (_SEPARATOR if i else '') + '{' + _SEPARATOR.join(cells) + '}'
+    yield _BODY_END
+
+
+def _iter_row_cells(prefixes: List[str], columns: Sequence[List[Optional[str]]], suffix: str) -> Iterator[List[str]]:
+    for contents in zip(*columns):
+        yield [prefix + content + suffix for prefix, content in zip(prefixes, contents) if content is not None]
+
+
+def _serialize_column(
+    series: pd.Series, column_definition: Optional[GenericColumnDefinition] = None
+) -> List[Optional[str]]:
+    if pd.api.types.is_categorical_dtype(series.dtype):
+        categories = _serialize_column(pd.Series(series.cat.categories), column_definition)
+        return [categories[code] if code >= 0 else None for code in series.cat.codes]
+
+    column_type = column_definition.type if column_definition is not None else None
+    if column_type == ColumnDataType.TEXT and not pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return _serialize_texts(series)
+    if column_type in _NUMBER_COLUMN_TYPES and _is_number_dtype(series.dtype):
+        return _serialize_numbers(series, cast(GenericColumnDefinition, column_definition))
+    if column_type == ColumnDataType.DATE_TIME:
+        series = _parse_date_times(series)
+
+    return _serialize_by_dtype(series)
+
+
+def _serialize_by_dtype(series: pd.Series) -> List[Optional[str]]:
+    missing = series.isna()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        utc = series.dt.tz_convert('UTC') if series.dt.tz else series.dt.tz_localize('UTC')
+        contents = '{"value": "' + utc.dt.strftime('%Y-%m-%dT%H:%M:%S.%f').str[:-3] + 'Z"}'
+    elif pd.api.types.is_bool_dtype(series.dtype):
+        contents = series.map({True: '{"value": true}', False: '{"value": false}'})
+    elif pd.api.types.is_integer_dtype(series.dtype):
+        contents = '{"value": ' + series.astype(object).astype(str) + '}'
+    elif pd.api.types.is_numeric_dtype(series.dtype):
+        numbers = pd.Series(series.to_numpy(dtype='float64', na_value=np.nan), index=series.index)
+        missing |= ~np.isfinite(numbers)
+        contents = '{"value": ' + numbers.astype(str) + '}'
+    else:
+        contents = series.map(lambda value: json.dumps(to_cell_content(value), default=str), na_action='ignore')
+
+    return contents.where(~missing, None).tolist()
+
+
+def _serialize_numbers(series: pd.Series, column_definition: GenericColumnDefinition) -> List[Optional[str]]:
+    missing = series.isna()
+    if pd.api.types.is_integer_dtype(series.dtype):
+        values = series.astype(object).astype(str)
+    else:
+        numbers = pd.Series(series.to_numpy(dtype='float64', na_value=np.nan), index=series.index)
+        missing |= ~np.isfinite(numbers)
+        values = numbers.astype(str)
+        if column_definition.type == ColumnDataType.INTEGER:
+            # integer columns with missing values have float dtype in pandas
+            integral = ~missing & (numbers == np.floor(numbers))
+            values = values.where(~integral, numbers.where(integral, 0).astype('int64').astype(str))
+
+    units = ''
+    if isinstance(column_definition, UnitColumnDefinition):
+        units = ', "units": ' + json.dumps(column_definition.default_unit)
+
+    contents = '{"value": ' + values + units + '}'
+    return contents.where(~missing, None).tolist()
+
+
+def _serialize_texts(series: pd.Series) -> List[Optional[str]]:
+    def _to_text_content(value: Any) -> Optional[Dict[str, Any]]:
+        if isinstance(value, (dict, list, tuple, np.ndarray)):
+            return to_cell_content(value)
+        return {'value': str(_to_json_value(value))}
+
+    contents = series.map(lambda value: json.dumps(_to_text_content(value)), na_action='ignore')
+    return contents.where(~series.isna(), None).tolist()
+
+
+def _parse_date_times(series: pd.Series) -> pd.Series:
+    if not (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+        return series
+
+    try:
+        return pd.to_datetime(series)
+    except (TypeError, ValueError):
+        log.debug('Values of column %s are not date/times, they are sent as is', series.name)
+        return series
+
+
+def _is_number_dtype(dtype: Any) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def _to_uuid(value: Any) -> Optional[UUID]:
+    if isinstance(value, UUID):
+        return value
+
+    if isinstance(value, str):
+        try:
+            return UUID(value)
+        except ValueError:
+            return None
+
+    return None
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    return value
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Annotated, Any, cast, Generic, List, Literal, Optional, TypedDict, TypeVar, Union
+from typing import Annotated, Any, Callable, cast, Generic, List, Literal, Optional, TypedDict, TypeVar, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr
@@ -119,6 +119,7 @@ class Cell(GenericModel, Generic[CellContentType]):
     name: str = Field(allow_mutation=False)
     content: CellContent[CellContentType]
     _changed: bool = PrivateAttr(default=False)
+    _on_change: Optional[Callable[['Cell'], None]] = PrivateAttr(default=None)
 
     class Config:
         validate_assignment = True
@@ -137,6 +138,8 @@ class Cell(GenericModel, Generic[CellContentType]):
         self.content.display = display
 
         self._changed = True
+        if self._on_change:
+            self._on_change(self)
 
     @property
     def is_changed(self) -> bool:
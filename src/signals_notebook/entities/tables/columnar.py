@@ -0,0 +1,133 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+import pandas as pd
+from dateutil.parser import parse
+
+from signals_notebook.entities.tables.cell import ColumnDataType, GenericColumnDefinition
+
+log = logging.getLogger(__name__)
+
+RawRow = Dict[str, Any]
+
+
+def get_cell_value(cell: Dict[str, Any]) -> Any:
+    """Get value of raw cell the same way as Cell.value does
+
+    Args:
+        cell: cell of normalized table data
+
+    Returns:
+        list of values for multi-value cell, otherwise single value
+    """
+    content = cell.get('content') or {}
+    return content.get('values') or content.get('value')
+
+
+def build_dataframe(
+    rows: Sequence[RawRow],
+    column_definitions: List[GenericColumnDefinition],
+    use_labels: bool = True,
+) -> pd.DataFrame:
+    """Build data table from normalized table rows column by column
+
+    Cell values are collected straight into per-column lists and every column is converted once
+    according to its definition, so no Row or Cell objects are created.
+
+    Args:
+        rows: rows of normalized table data
+        column_definitions: column definitions of table
+        use_labels: use column titles as column names, otherwise column keys
+
+    Returns:
+        pd.DataFrame
+    """
+    definitions = {str(column_definition.key): column_definition for column_definition in column_definitions}
+    columns: Dict[str, List[Any]] = {key: [None] * len(rows) for key in definitions}
+    labels: Dict[str, Any] = {}
+    index = []
+
+    for i, row in enumerate(rows):
+        index.append(UUID(row['id']))
+        for cell in row['attributes']['cells']:
+            key = cell['key']
+            if key not in columns:
+                columns[key] = [None] * len(rows)
+                labels[key] = cell.get('name', key)
+            columns[key][i] = get_cell_value(cell)
+
+    data = {}
+    names: List[Any] = []
+    for key, values in columns.items():
+        column_definition = definitions.get(key)
+        data[len(names)] = _convert_column(values, column_definition)
+        if use_labels:
+            names.append(column_definition.title if column_definition else labels[key])
+        else:
+            names.append(column_definition.key if column_definition else UUID(key))
+
+    dataframe = pd.DataFrame(data, index=pd.Index(index))
+    dataframe.columns = names
+    return dataframe
+
+
+def _convert_column(values: List[Any], column_definition: Optional[GenericColumnDefinition]) -> Any:
+    if column_definition is None:
+        return pd.array(values, dtype=object)
+
+    converter = _CONVERTERS.get(column_definition.type, _to_object)
+    return converter(values, column_definition)
+
+
+def _to_object(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    return pd.array(values, dtype=object)
+
+
+def _to_number(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype='float64')
+
+
+def _to_integer(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    numbers = pd.Series(_to_number(values, column_definition))
+    if (numbers.dropna() % 1 != 0).any():
+        log.warning('Column %s has fractional values, it is loaded as float', column_definition.title)
+        return numbers.to_numpy()
+
+    return numbers.astype('Int64').array
+
+
+def _to_boolean(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    return pd.array(values, dtype='boolean')
+
+
+def _to_datetime(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    parsed_values = [parse(value) if isinstance(value, str) else value for value in values]
+    return pd.to_datetime(parsed_values, utc=True).array
+
+
+def _to_category(values: List[Any], column_definition: GenericColumnDefinition) -> Any:
+    if any(isinstance(value, list) for value in values):
+        return pd.array(values, dtype=object)
+
+    categories = list(dict.fromkeys(getattr(column_definition, 'options', [])))
+    known_categories = set(categories)
+    for value in values:
+        if value is not None and value not in known_categories:
+            categories.append(value)
+            known_categories.add(value)
+
+    return pd.Categorical(values, categories=categories)
+
+
+_CONVERTERS: Dict[ColumnDataType, Callable[[List[Any], GenericColumnDefinition], Any]] = {
+    ColumnDataType.NUMBER: _to_number,
+    ColumnDataType.UNIT: _to_number,
+    ColumnDataType.INTEGER: _to_integer,
+    ColumnDataType.BOOLEAN: _to_boolean,
+    ColumnDataType.DATE_TIME: _to_datetime,
+    ColumnDataType.LIST: _to_category,
+    ColumnDataType.ATTRIBUTE_LIST: _to_category,
+    ColumnDataType.AUTOTEXT_LIST: _to_category,
+    ColumnDataType.MULTI_SELECT: _to_category,
+}
@@ -1,7 +1,7 @@
 import logging
 from enum import Enum
 from operator import attrgetter
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, PrivateAttr
@@ -68,6 +68,8 @@ class Row(BaseModel):
     cells: List[GenericCell]
     _cells_dict: Dict[Union[UUID, str], GenericCell] = PrivateAttr(default={})
     _deleted: bool = PrivateAttr(default=False)
+    _changed_cells: Dict[UUID, GenericCell] = PrivateAttr(default={})
+    _on_change: Optional[Callable[['Row'], None]] = PrivateAttr(default=None)
 
     class Config:
         validate_assignment = True
@@ -78,6 +80,20 @@ class Row(BaseModel):
         for cell in self.cells:
             self._cells_dict[cell.id] = cell
             self._cells_dict[cell.name] = cell
+            cell._on_change = self._cell_changed
+
+    def _cell_changed(self, cell: GenericCell) -> None:
+        self._changed_cells[cell.id] = cell
+        self._notify()
+
+    def _notify(self) -> None:
+        if self._on_change:
+            self._on_change(self)
+
+    def _mark_saved(self) -> None:
+        for cell in self._changed_cells.values():
+            cell._changed = False
+        self._changed_cells = {}
 
     def get(self, value: Union[str, UUID], default: Any = None) -> Union[Cell, Any]:
         """Get one of the GenericCell objects by value
@@ -111,7 +127,7 @@ class Row(BaseModel):
         Returns:
             bool: True/False
         """
-        return any([cell.is_changed for cell in self.cells])
+        return bool(self._changed_cells)
 
     @property
     def is_new(self) -> bool:
@@ -163,6 +179,7 @@ class Row(BaseModel):
 
         """
         self._deleted = True
+        self._notify()
 
     def get_change_request(self) -> Optional[ChangeRowRequest]:
         """Get ChangeRowRequest depending on Row status
@@ -173,13 +190,15 @@ class Row(BaseModel):
         if self.is_deleted:
             return DeleteRowRequest(id=self.id)
 
+        if self.is_new:
+            return CreateRowRequest(attributes=CreateRowActionBody(cells=[cell.update_request for cell in self.cells]))
+
         if self.is_changed:
             return UpdateRowRequest(
                 id=self.id,
-                attributes=UpdateRowActionBody(cells=[cell.update_request for cell in self.cells if cell.is_changed]),
+                attributes=UpdateRowActionBody(
+                    cells=[cell.update_request for cell in self.cells if cell.id in self._changed_cells]
+                ),
             )
 
-        if self.is_new:
-            return CreateRowRequest(attributes=CreateRowActionBody(cells=[cell.update_request for cell in self.cells]))
-
         return None
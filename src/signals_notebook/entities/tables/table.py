@@ -1,24 +1,60 @@
 import cgi
 import json
 import logging
+import tempfile
 from enum import Enum
-from typing import Any, cast, Dict, List, Literal, Optional, Union
+from itertools import islice
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TYPE_CHECKING,
+    Union,
+)
 from uuid import UUID
 
 import pandas as pd
 from pydantic import Field, PrivateAttr
 
-from signals_notebook.api import SignalsNotebookApi
+from signals_notebook.api import AsyncSignalsNotebookApi, SignalsNotebookApi
 from signals_notebook.common_types import DataList, EntityType, File, Response, ResponseData
-from signals_notebook.entities import Entity, EntityStore
+from signals_notebook.entities import Entity, TemplateIndex
 from signals_notebook.entities.container import Container
+from signals_notebook.entities.tables.bulk import (
+    Batch,
+    BatchResult,
+    build_row_request,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_BATCH_BYTES,
+    iter_batches,
+    iter_create_rows,
+    iter_json_document,
+    iter_upsert_rows,
+    serialize_columns,
+    UpsertRow,
+)
 from signals_notebook.entities.tables.cell import Cell, CellContentDict, ColumnDefinitions, GenericColumnDefinition
+from signals_notebook.entities.tables.columnar import build_dataframe, RawRow
 from signals_notebook.entities.tables.row import ChangeRowRequest, Row
+from signals_notebook.exceptions import BatchUpsertError
 from signals_notebook.jinja_env import env
-from signals_notebook.utils import FSHandler
+from signals_notebook.utils import FSHandler, map_concurrently, Paginator
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
+
+if TYPE_CHECKING:
+    import pyarrow  # type: ignore
 
 log = logging.getLogger(__name__)
 
+DEFAULT_PAGE_SIZE = 100
+
 
 class TableDataResponse(Response[Row]):
     pass
@@ -40,6 +76,7 @@ class Table(Entity):
     type: Literal[EntityType.GRID] = Field(allow_mutation=False)
     _rows: List[Row] = PrivateAttr(default=[])
     _rows_by_id: Dict[UUID, Row] = PrivateAttr(default={})
+    _dirty_rows: Dict[int, Row] = PrivateAttr(default={})
     _template_name = 'table.html'
 
     @classmethod
@@ -63,16 +100,39 @@ class Table(Entity):
         )
 
         result = TableDataResponse(**response.json())
+        self._set_rows(result)
+        log.debug('Data in Table: %s were reloaded', self.eid)
+
+    async def _reload_data_async(self) -> None:
+        api = AsyncSignalsNotebookApi.get_default_api()
+        log.debug('Reloading data in Table: %s asynchronously...', self.eid)
+
+        response = await api.call(
+            method='GET',
+            path=(self._get_adt_endpoint(), self.eid),
+            params={
+                'value': 'normalized',
+            },
+        )
 
+        result = TableDataResponse(**response.json())
+        self._set_rows(result)
+        log.debug('Data in Table: %s were reloaded', self.eid)
+
+    def _set_rows(self, result: TableDataResponse) -> None:
         self._rows = []
         self._rows_by_id = {}
+        self._dirty_rows = {}
         for item in result.data:
             row = cast(Row, cast(ResponseData, item).body)
             assert row.id
 
+            row._on_change = self._row_changed
             self._rows.append(row)
             self._rows_by_id[row.id] = row
-        log.debug('Data in Table: %s were reloaded', self.eid)
+
+    def _row_changed(self, row: Row) -> None:
+        self._dirty_rows[id(row)] = row
 
     def get_column_definitions_list(self) -> List[GenericColumnDefinition]:
         """Fetch column definitions
@@ -103,15 +163,38 @@ class Table(Entity):
 
         return column_definitions_map
 
-    def as_dataframe(self, use_labels: bool = True) -> pd.DataFrame:
+    def _get_raw_rows(self) -> List[RawRow]:
+        api = SignalsNotebookApi.get_default_api()
+        log.debug('Fetching raw data of Table: %s...', self.eid)
+
+        response = api.call(
+            method='GET',
+            path=(self._get_adt_endpoint(), self.eid),
+            params={
+                'value': 'normalized',
+            },
+        )
+
+        return response.json()['data']
+
+    def as_dataframe(self, use_labels: bool = True, columnar: bool = False) -> pd.DataFrame:
         """Get as data table
 
+        Columnar mode reads saved table data straight into typed columns without creating Row and Cell objects,
+        which is much faster and lighter for large tables. Number and unit columns are loaded as float,
+        integer as Int64, boolean as boolean, date/time as UTC datetime and single-value list columns
+        as categorical. Unsaved changes of the table are not included in this mode.
+
         Args:
             use_labels: use cells names
+            columnar: load data column by column with types from column definitions
 
         Returns:
             pd.DataFrame
         """
+        if columnar:
+            return build_dataframe(self._get_raw_rows(), self.get_column_definitions_list(), use_labels)
+
         if not self._rows:
             self._reload_data()
 
@@ -123,6 +206,83 @@ class Table(Entity):
 
         return pd.DataFrame(data=data, index=index)
 
+    async def as_dataframe_async(self, use_labels: bool = True) -> pd.DataFrame:
+        """Get as data table, loading table data using AsyncSignalsNotebookApi
+
+        Args:
+            use_labels: use cells names
+
+        Returns:
+            pd.DataFrame
+        """
+        if not self._rows:
+            await self._reload_data_async()
+
+        return self.as_dataframe(use_labels)
+
+    def _get_row_pages(self, page_size: int, prefetch: int) -> Paginator:
+        api = SignalsNotebookApi.get_default_api()
+
+        return Paginator(
+            api,
+            TableDataResponse,
+            prefetch=prefetch,
+            path=(self._get_adt_endpoint(), self.eid),
+            params={
+                'value': 'normalized',
+                'page[offset]': 0,
+                'page[limit]': page_size,
+            },
+        )
+
+    def iter_rows(self, page_size: int = DEFAULT_PAGE_SIZE, prefetch: int = DEFAULT_PREFETCH) -> Iterator[Row]:
+        """Iterate over saved rows page by page
+
+        Rows are yielded as soon as their page arrives and are not kept in the table,
+        so tables larger than memory can be processed.
+
+        Args:
+            page_size: number of rows requested per page
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            Row
+        """
+        log.debug('Iterating over rows of Table: %s by %s', self.eid, page_size)
+        for item in self._get_row_pages(page_size, prefetch):
+            yield cast(Row, cast(ResponseData, item).body)
+
+    def iter_dataframes(
+        self,
+        chunk_rows: int = DEFAULT_PAGE_SIZE,
+        use_labels: bool = True,
+        prefetch: int = DEFAULT_PREFETCH,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over saved data as data tables of at most chunk_rows rows
+
+        Only the current chunk is kept in memory. Columns are typed the same way as in columnar mode
+        of as_dataframe.
+
+        Args:
+            chunk_rows: maximum number of rows in one data table. It is also used as page size
+            use_labels: use cells names
+            prefetch: number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
+        Returns:
+            pd.DataFrame
+        """
+        column_definitions = self.get_column_definitions_list()
+        chunk: List[RawRow] = []
+
+        for row in self._get_row_pages(chunk_rows, prefetch).iter_raw():
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield build_dataframe(chunk, column_definitions, use_labels)
+                chunk = []
+
+        if chunk:
+            yield build_dataframe(chunk, column_definitions, use_labels)
+
     def as_raw_data(self, use_labels: bool = True) -> List[Dict[str, Any]]:
         """Get as a list of dictionaries
 
@@ -181,6 +341,7 @@ class Table(Entity):
             _row_id = row_id
 
         api = SignalsNotebookApi.get_default_api()
+        self._invalidate_digest()
 
         api.call(
             method='DELETE',
@@ -221,12 +382,17 @@ class Table(Entity):
             )
 
         row = Row(cells=prepared_data)
+        row._on_change = self._row_changed
         self._rows.append(row)
+        self._row_changed(row)
         log.debug('Row: %s was added to Table', row)
 
     def save(self, force: bool = True) -> None:
         """Save all changes in the table
 
+        Only rows which were added, changed or deleted since the last save are sent. Saved changes are applied
+        to local rows, so table data is downloaded again only if new rows were created and need their IDs.
+
         Args:
             force: Force to update properties without digest check.
 
@@ -235,29 +401,147 @@ class Table(Entity):
         """
         super().save(force)
 
+        dirty_rows = list(self._dirty_rows.values())
         row_requests: List[ChangeRowRequest] = []
-        for row in self._rows:
+        for row in dirty_rows:
+            if row.is_new and row.is_deleted:
+                continue
             row_request = row.get_change_request()
             if row_request:
                 row_requests.append(row_request)
 
-        if not row_requests:
+        if row_requests:
+            request = ChangeTableDataRequest(data=row_requests)
+            api = SignalsNotebookApi.get_default_api()
+            self._invalidate_digest()
+
+            api.call(
+                method='PATCH',
+                path=(self._get_adt_endpoint(), self.eid),
+                params={
+                    'digest': None if force else self.digest,
+                    'force': json.dumps(force),
+                },
+                data=request.json(exclude_none=True, by_alias=True),
+            )
+
+        if any(row.is_new and not row.is_deleted for row in dirty_rows):
+            self._reload_data()
             return
 
-        request = ChangeTableDataRequest(data=row_requests)
-        api = SignalsNotebookApi.get_default_api()
+        self._apply_saved_rows(dirty_rows)
+
+    def _apply_saved_rows(self, rows: List[Row]) -> None:
+        deleted_rows = set()
+        for row in rows:
+            self._dirty_rows.pop(id(row), None)
+            if row.is_deleted:
+                deleted_rows.add(id(row))
+                if row.id:
+                    self._rows_by_id.pop(row.id, None)
+            else:
+                row._mark_saved()
+
+        if deleted_rows:
+            self._rows = [row for row in self._rows if id(row) not in deleted_rows]
+        log.debug('%s saved rows were applied to Table: %s', len(rows), self.eid)
+
+    def bulk_upsert(
+        self,
+        rows: Union[pd.DataFrame, Iterable[UpsertRow]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = 1,
+        on_batch: Optional[Callable[[BatchResult], None]] = None,
+    ) -> List[BatchResult]:
+        """Create and update many rows in batches
+
+        Rows are converted to requests lazily and sent in batches limited by number of rows and body size.
+        Row with UUID index or row ID updates existing row, any other row is created.
+        Failure of one batch does not stop the others. Rows loaded before are dropped,
+        so table data is loaded again on next access. Unsaved changes of rows should be saved before,
+        otherwise ValueError is raised and nothing is sent.
 
-        api.call(
-            method='PATCH',
-            path=(self._get_adt_endpoint(), self.eid),
-            params={
-                'digest': None if force else self.digest,
-                'force': json.dumps(force),
-            },
-            data=request.json(exclude_none=True, by_alias=True),
+        Args:
+            rows: DataFrame or iterable of rows. Row is a dictionary of values of new row or (row ID, values) pair.
+                Values are mapped by column title or key to plain values or cell content dictionaries
+            batch_size: maximum number of rows in one request
+            max_batch_bytes: maximum size of one request body in bytes
+            max_workers: number of batches sent concurrently
+            on_batch: (optional) function called with result of every batch in order of batches
+
+        Returns:
+            list of BatchResult
+        """
+        if self._dirty_rows:
+            raise ValueError(f'Table {self.eid} has unsaved changes of {len(self._dirty_rows)} rows, save it first')
+
+        column_definitions_map = self.get_column_definitions_map()
+        row_requests = (
+            build_row_request(row_id, values, column_definitions_map) for row_id, values in iter_upsert_rows(rows)
+        )
+        serialized_rows = (
+            request.json(exclude_none=True, by_alias=True) if request else None for request in row_requests
+        )
+        results = self._send_batches(
+            iter_batches(serialized_rows, batch_size, max_batch_bytes), max_workers=max_workers, on_batch=on_batch
         )
 
-        self._reload_data()
+        self._drop_rows()
+        return results
+
+    def _send_batches(
+        self,
+        batches: Iterator[Batch],
+        max_workers: int = 1,
+        on_batch: Optional[Callable[[BatchResult], None]] = None,
+    ) -> List[BatchResult]:
+        results: List[BatchResult] = []
+        while True:
+            window = list(islice(batches, max(max_workers, 1)))
+            if not window:
+                break
+
+            if len(window) > 1:
+                window_results = cast(List[BatchResult], map_concurrently(self._send_batch, window, max_workers))
+            else:
+                window_results = [self._send_batch(window[0])]
+
+            for result in window_results:
+                results.append(result)
+                if on_batch:
+                    on_batch(result)
+
+        log.debug(
+            '%s of %s batches were saved to Table: %s', sum(result.ok for result in results), len(results), self.eid
+        )
+        return results
+
+    def _send_batch(self, batch: Batch) -> BatchResult:
+        api = SignalsNotebookApi.get_default_api()
+        self._invalidate_digest()
+
+        try:
+            api.call(
+                method='PATCH',
+                path=(self._get_adt_endpoint(), self.eid),
+                params={
+                    'digest': None,
+                    'force': 'true',
+                },
+                data=batch.body,
+            )
+        except Exception as e:
+            log.error('Batch %s of Table: %s failed: %s', batch.index, self.eid, e)
+            return BatchResult(batch.index, batch.first_row, len(batch.rows), batch.size, error=e)
+
+        log.info('Batch %s of %s rows was saved to Table: %s', batch.index, len(batch.rows), self.eid)
+        return BatchResult(batch.index, batch.first_row, len(batch.rows), batch.size)
+
+    def _drop_rows(self) -> None:
+        self._rows = []
+        self._rows_by_id = {}
+        self._dirty_rows = {}
 
     def get(self, value: Union[str, UUID], default: Any = None) -> Union[Row, Any]:
         """Get Row
@@ -307,6 +591,7 @@ class Table(Entity):
             params={
                 'format': None,
             },
+            cache_validator=self._get_cache_validator(),
         )
 
         content_disposition = response.headers.get('content-disposition', '')
@@ -383,6 +668,132 @@ class Table(Entity):
             force=force,
         )
 
+    @classmethod
+    def create_from_dataframe(
+        cls,
+        *,
+        container: Container,
+        name: str,
+        dataframe: pd.DataFrame,
+        template: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = 1,
+        on_batch: Optional[Callable[[BatchResult], None]] = None,
+    ) -> Entity:
+        """Create Table Entity from data table
+
+        Columns are mapped to column definitions of template by title or key. If template is not given,
+        template with the same set of columns is looked up. Cell contents are converted column by column
+        to types of mapped column definitions, e.g. numbers of unit columns get default unit, and rows are sent
+        in batches, the same way as in bulk_upsert. If some batches fail, BatchUpsertError with created Table
+        and results of all batches is raised. Without matching template data table is uploaded as *.json File,
+        which is streamed from a temporary file.
+
+        Args:
+            container: Container where create new Table
+            name: file name
+            dataframe: data table. Numbers, booleans, date/times, categories, texts and lists are supported
+            template: (optional) template for table creation
+            batch_size: maximum number of rows in one request
+            max_batch_bytes: maximum size of one request body in bytes
+            max_workers: number of batches sent concurrently
+            on_batch: (optional) function called with result of every batch in order of batches
+
+        Returns:
+            Table
+        """
+        names = [str(column) for column in dataframe.columns]
+        if template is None:
+            found_template = TemplateIndex.get_default().find_by_columns(
+                EntityType.GRID, names, cls._get_template_columns
+            )
+            template = found_template.eid if found_template else None
+
+        if template is None:
+            return cls._upload_columns(container, name, names, serialize_columns(dataframe))
+
+        table = cast(Table, cls.create(container=container, name=name, template=template))
+        column_definitions_map = table.get_column_definitions_map()
+
+        positions = []
+        column_definitions = []
+        for position, column in enumerate(names):
+            column_definition = column_definitions_map.get(column)
+            if column_definition is None:
+                log.warning('Column %s is not in Table: %s. It is skipped', column, table.eid)
+                continue
+            positions.append(position)
+            column_definitions.append(column_definition)
+
+        columns = serialize_columns(dataframe.iloc[:, positions], column_definitions)
+        rows = iter_create_rows([str(column_definition.key) for column_definition in column_definitions], columns)
+        results = table._send_batches(
+            iter_batches(rows, batch_size, max_batch_bytes), max_workers=max_workers, on_batch=on_batch
+        )
+        if not all(result.ok for result in results):
+            raise BatchUpsertError(table, results)
+
+        return table
+
+    @classmethod
+    def _upload_columns(
+        cls, container: Container, name: str, names: List[str], columns: List[List[Optional[str]]]
+    ) -> Entity:
+        log.debug('There is no needful template. Table will be uploaded as *.json File...')
+        with tempfile.SpooledTemporaryFile(max_size=DEFAULT_MAX_BATCH_BYTES) as f:
+            for chunk in iter_json_document(names, columns):
+                f.write(chunk.encode('utf-8'))
+            f.seek(0)
+
+            return container.add_child(
+                name=name,
+                content=cast(BinaryIO, f),
+                content_type=cls.ContentType.JSON,
+                force=True,
+            )
+
+    @classmethod
+    def create_from_arrow(
+        cls,
+        *,
+        container: Container,
+        name: str,
+        arrow_table: 'pyarrow.Table',
+        template: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        max_workers: int = 1,
+        on_batch: Optional[Callable[[BatchResult], None]] = None,
+    ) -> Entity:
+        """Create Table Entity from Arrow table
+
+        Arrow table is converted to data table with pyarrow, dictionary columns become categorical.
+
+        Args:
+            container: Container where create new Table
+            name: file name
+            arrow_table: pyarrow.Table
+            template: (optional) template for table creation
+            batch_size: maximum number of rows in one request
+            max_batch_bytes: maximum size of one request body in bytes
+            max_workers: number of batches sent concurrently
+            on_batch: (optional) function called with result of every batch in order of batches
+
+        Returns:
+            Table
+        """
+        return cls.create_from_dataframe(
+            container=container,
+            name=name,
+            dataframe=arrow_table.to_pandas(),
+            template=template,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            max_workers=max_workers,
+            on_batch=on_batch,
+        )
+
     def get_html(self) -> str:
         """Get in HTML format
 
@@ -472,29 +883,27 @@ class Table(Entity):
         content = json.loads(content_bytes)
         rows = content['data']
         column_definitions = metadata.get('columns')
-        templates = EntityStore.get_list(
-            include_types=[EntityType.GRID], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
-
-        file_creation = True
-        for item in templates:
-            template = cast('Table', item)
-            template_column_definitions = template.get_column_definitions_list()
-            template_columns = [item.title for item in template_column_definitions]
-            if set(template_columns) == set(column_definitions):
-                file_creation = False
-                cls.create(
-                    container=parent,
-                    name=metadata['name'],
-                    template=template.eid,
-                    content=rows,
-                )
-                break
+        template = None
+        if column_definitions is not None:
+            template = TemplateIndex.get_default().find_by_columns(
+                EntityType.GRID, column_definitions, cls._get_template_columns
+            )
 
-        if file_creation:
+        if template:
+            cls.create(
+                container=parent,
+                name=metadata['name'],
+                template=template.eid,
+                content=rows,
+            )
+        else:
             cls.create(container=parent, name=metadata['name'], content=rows, force=True)
         log.debug('Table was loaded to Container: %s', parent.eid)
 
+    @staticmethod
+    def _get_template_columns(template: Entity) -> List[str]:
+        return [item.title for item in cast('Table', template).get_column_definitions_list()]
+
     @classmethod
     def dump_templates(cls, base_path: str, fs_handler: FSHandler) -> None:
         """Dump Table templates
@@ -506,13 +915,9 @@ class Table(Entity):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
-
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
 
         try:
             for item in templates:
@@ -0,0 +1,141 @@
+import logging
+import threading
+from collections import deque
+from typing import Callable, ClassVar, Deque, Dict, FrozenSet, Iterable, List, Optional
+
+from signals_notebook.api import SignalsNotebookApi
+from signals_notebook.common_types import EntityType
+from signals_notebook.entities.entity import Entity
+from signals_notebook.entities.entity_store import EntityStore
+
+log = logging.getLogger(__name__)
+
+
+class TemplateIndex:
+    _default_index: ClassVar[Optional['TemplateIndex']] = None
+    _default_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, api: Optional[SignalsNotebookApi] = None):
+        """Index of entity templates which are fetched once per session
+
+        Templates of each entity type are listed on first use. Columns of every template are fetched
+        at most once: lookup by column titles is a dictionary lookup, and templates which have not been
+        indexed yet are scanned only until the matching one is found.
+
+        Args:
+            api: (optional) API session the templates belong to
+        """
+        self.api = api
+        self._lock = threading.Lock()
+        self._indexed = threading.Condition(self._lock)
+        self._indexing: Dict[EntityType, int] = {}
+        self._templates: Dict[EntityType, List[Entity]] = {}
+        self._templates_by_columns: Dict[EntityType, Dict[FrozenSet[str], Entity]] = {}
+        self._unindexed_templates: Dict[EntityType, Deque[Entity]] = {}
+
+    @classmethod
+    def get_default(cls) -> 'TemplateIndex':
+        """Get index of the default API session
+
+        A new index is started when the default API is changed.
+
+        Returns:
+            TemplateIndex
+        """
+        api = SignalsNotebookApi.get_default_api()
+        with cls._default_lock:
+            if cls._default_index is None or cls._default_index.api is not api:
+                cls._default_index = cls(api)
+            return cls._default_index
+
+    def get_templates(self, entity_type: EntityType) -> List[Entity]:
+        """Get templates of entity type
+
+        Args:
+            entity_type: type of templates
+
+        Returns:
+            list of templates
+        """
+        with self._lock:
+            templates = self._templates.get(entity_type)
+        if templates is not None:
+            return templates
+
+        log.debug('Fetching %s templates...', entity_type)
+        templates = list(
+            EntityStore.get_list(include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE])
+        )
+        with self._lock:
+            return self._templates.setdefault(entity_type, templates)
+
+    def find_by_columns(
+        self,
+        entity_type: EntityType,
+        columns: Iterable[str],
+        get_columns: Callable[[Entity], Iterable[str]],
+    ) -> Optional[Entity]:
+        """Find template which has the same set of columns
+
+        Columns of templates are fetched without holding the lock, so lookups running in other threads
+        are not blocked by network calls.
+
+        Args:
+            entity_type: type of template
+            columns: column titles
+            get_columns: function returning column titles of template. It is called once per template,
+                template is indexed again on next lookup if the call fails
+
+        Returns:
+            the first matching template or None
+        """
+        key = frozenset(columns)
+        templates = self.get_templates(entity_type)
+        with self._lock:
+            templates_by_columns = self._templates_by_columns.setdefault(entity_type, {})
+            if entity_type not in self._unindexed_templates:
+                self._unindexed_templates[entity_type] = deque(templates)
+            unindexed_templates = self._unindexed_templates[entity_type]
+
+            while key not in templates_by_columns:
+                if unindexed_templates:
+                    self._index(entity_type, unindexed_templates, get_columns, templates_by_columns)
+                elif self._indexing.get(entity_type):
+                    self._indexed.wait()
+                else:
+                    break
+
+            return templates_by_columns.get(key)
+
+    def _index(
+        self,
+        entity_type: EntityType,
+        unindexed_templates: Deque[Entity],
+        get_columns: Callable[[Entity], Iterable[str]],
+        templates_by_columns: Dict[FrozenSet[str], Entity],
+    ) -> None:
+        template = unindexed_templates.popleft()
+        template_columns = None
+        self._indexing[entity_type] = self._indexing.get(entity_type, 0) + 1
+        self._lock.release()
+        try:
+            template_columns = frozenset(get_columns(template))
+        finally:
+            self._lock.acquire()
+            self._indexing[entity_type] -= 1
+            if template_columns is None:
+                unindexed_templates.appendleft(template)
+            self._indexed.notify_all()
+
+        templates_by_columns.setdefault(template_columns, template)
+
+    def clear(self) -> None:
+        """Forget fetched templates, so they are fetched again on next use
+
+        Returns:
+
+        """
+        with self._lock:
+            self._templates.clear()
+            self._templates_by_columns.clear()
+            self._unindexed_templates.clear()
@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -32,7 +32,7 @@ class Text(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = ContentType.TXT,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create Text entity
@@ -41,7 +41,7 @@ class Text(ContentfulEntity):
             container: Container where create new Text
             name: file name
             content_type: content type of Text entity
-            content: Text content
+            content: Text content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
@@ -102,6 +102,7 @@ class Task(Entity):
         if not request_body:
             return
 
+        self._invalidate_digest()
         api.call(
             method='PATCH',
             path=(self._get_tasks_endpoint(), self.eid, 'properties'),
@@ -161,13 +162,11 @@ class Task(Entity):
         Returns:
 
         """
-        from signals_notebook.entities import EntityStore
+        from signals_notebook.entities import TemplateIndex
 
         entity_type = cls._get_entity_type()
 
-        templates = EntityStore.get_list(
-            include_types=[entity_type], include_options=[EntityStore.IncludeOptions.TEMPLATE]
-        )
+        templates = TemplateIndex.get_default().get_templates(entity_type)
 
         try:
             for item in templates:
@@ -77,6 +77,7 @@ class TodoList(ContentfulEntity):
         log.debug('Saving TodoList: %s...', self.eid)
         for item in self._tasks:
             item.save(force=force)
+        self._invalidate_digest()
         self._reload_tasks()
         log.debug('TodoList: %s was saved successfully', self.eid)
 
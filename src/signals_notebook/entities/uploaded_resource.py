@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -29,7 +29,7 @@ class UploadedResource(ContentfulEntity):
         *,
         container: Container,
         name: str,
-        content: bytes = b'',
+        content: UploadContent = b'',
         content_type: str = ContentType.BINARY,
         force: bool = True,
     ) -> Entity:
@@ -38,7 +38,7 @@ class UploadedResource(ContentfulEntity):
         Args:
             container: Container where create new UploadedResource
             name: file name
-            content: UploadedResource content
+            content: UploadedResource content as bytes, binary file object or path of local file
             content_type: UploadedResource content type
             force: Force to post attachment
 
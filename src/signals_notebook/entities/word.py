@@ -4,7 +4,7 @@ from typing import ClassVar, Literal
 
 from pydantic import Field
 
-from signals_notebook.common_types import EntityType, File
+from signals_notebook.common_types import EntityType, File, UploadContent
 from signals_notebook.entities import Entity
 from signals_notebook.entities.container import Container
 from signals_notebook.entities.contentful_entity import ContentfulEntity
@@ -34,7 +34,7 @@ class Word(ContentfulEntity):
         container: Container,
         name: str,
         content_type: str = ContentType.DOCX,
-        content: bytes = b'',
+        content: UploadContent = b'',
         force: bool = True,
     ) -> Entity:
         """Create Word Entity
@@ -43,7 +43,7 @@ class Word(ContentfulEntity):
             container: Container where create new Word
             name: file name
             content_type: content type of Word entity
-            content: Word content
+            content: Word content as bytes, binary file object or path of local file
             force: Force to post attachment
 
         Returns:
@@ -1,8 +1,13 @@
-from typing import List
+from typing import Any, List, TYPE_CHECKING, Union
 
 import requests
 from pydantic import BaseModel, parse_obj_as, PydanticValueError
 
+if TYPE_CHECKING:
+    import httpx
+
+    from signals_notebook.entities.tables.bulk import BatchResult
+
 
 class ErrorBody(BaseModel):
     status: str
@@ -16,7 +21,7 @@ class ErrorResponse(BaseModel):
 
 
 class SignalsNotebookError(Exception):
-    def __init__(self, response: requests.Response):
+    def __init__(self, response: Union[requests.Response, 'httpx.Response']):
         """Handle Signals Notebook API errors
 
         Args:
@@ -41,3 +46,23 @@ class BulkExportJobAlreadyRunningError(Exception):
 
     def __str__(self) -> str:
         return 'Only one Bulk Export job can be processed at a time'
+
+
+class BatchUpsertError(Exception):
+    def __init__(self, table: Any, results: List['BatchResult']):
+        """Some batches of rows were not saved to created Table
+
+        Args:
+            table: created Table
+            results: results of all batches
+        """
+        super().__init__(table, results)
+        self.table = table
+        self.results = results
+
+    @property
+    def failed_results(self) -> List['BatchResult']:
+        return [result for result in self.results if not result.ok]
+
+    def __str__(self) -> str:
+        return f'{len(self.failed_results)} of {len(self.results)} batches were not saved to Table: {self.table.eid}'
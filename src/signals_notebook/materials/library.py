@@ -12,12 +12,21 @@ import requests
 from pydantic import BaseModel, Field, PrivateAttr
 
 from signals_notebook.api import SignalsNotebookApi
-from signals_notebook.common_types import File, Links, MaterialType, MID, Response, ResponseData
+from signals_notebook.common_types import (
+    DEFAULT_CHUNK_SIZE,
+    File,
+    FileStream,
+    Links,
+    MaterialType,
+    MID,
+    Response,
+    ResponseData,
+)
 from signals_notebook.materials.asset import Asset
 from signals_notebook.materials.base_entity import BaseMaterialEntity
 from signals_notebook.materials.batch import Batch
 from signals_notebook.materials.field import AssetConfig, BatchConfig
-from signals_notebook.utils.fs_handler import FSHandler
+from signals_notebook.utils.fs_handler import FSHandler, write_chunks
 from signals_notebook.exceptions import SignalsNotebookError, BulkExportJobAlreadyRunningError
 
 MAX_MATERIAL_FILE_SIZE = 52428800
@@ -386,13 +395,14 @@ class Library(BaseMaterialEntity):
 
         return result
 
-    def _download_file(self, file_id: str) -> requests.Response:
+    def _download_file(self, file_id: str, stream: bool = False) -> requests.Response:
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get file content for: %s| %s', self.__class__.__name__, self.eid)
 
         return api.call(
             method='GET',
             path=(self._get_endpoint(), 'bulkExport', 'download', file_id),
+            stream=stream,
         )
 
     def get_content(self, timeout: int = 600, period: int = 5) -> File:
@@ -406,6 +416,39 @@ class Library(BaseMaterialEntity):
         Returns:
             File
         """
+        response = self._export(timeout, period)
+
+        content_disposition = response.headers.get('content-disposition', '')
+        _, params = cgi.parse_header(content_disposition)
+
+        return File(
+            name=params['filename'], content=response.content, content_type=response.headers.get('content-type')
+        )
+
+    def get_content_stream(self, timeout: int = 600, period: int = 5) -> FileStream:
+        """Get library content which is downloaded chunk by chunk.
+        Compounds/Reagents (SNB) will be exported to SD file, others will be exported to CSV file.
+
+        Args:
+            timeout: max available time(seconds) to get file
+            period: each n seconds(default value=5) api call
+
+        Returns:
+            FileStream
+        """
+        response = self._export(timeout, period, stream=True)
+
+        content_disposition = response.headers.get('content-disposition', '')
+        _, params = cgi.parse_header(content_disposition)
+
+        return FileStream(
+            name=params['filename'],
+            content_type=response.headers.get('content-type'),
+            chunks=response.iter_content(DEFAULT_CHUNK_SIZE),
+            on_close=response.close,
+        )
+
+    def _export(self, timeout: int, period: int, stream: bool = False) -> requests.Response:
         bulk_export_response = None
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get content for: %s| %s', self.__class__.__name__, self.eid)
@@ -435,7 +478,7 @@ class Library(BaseMaterialEntity):
             if result['error'] == EXPORT_ERROR_LIBRARY_EMPTY:
                 raise FileNotFoundError('Library is empty')
             if result['success'] and not result['error']:
-                response = self._download_file(file_id)
+                response = self._download_file(file_id, stream=stream)
                 break
             else:
                 time.sleep(period)
@@ -443,12 +486,7 @@ class Library(BaseMaterialEntity):
         if not response:
             raise TimeoutError('Time is over to get file')
 
-        content_disposition = response.headers.get('content-disposition', '')
-        _, params = cgi.parse_header(content_disposition)
-
-        return File(
-            name=params['filename'], content=response.content, content_type=response.headers.get('content-type')
-        )
+        return response
 
     def _get_import_job_completed_response(self, job_id: str) -> requests.Response:
         api = SignalsNotebookApi.get_default_api()
@@ -570,15 +608,15 @@ class Library(BaseMaterialEntity):
         metadata = {
             **{k: v for k, v in self.dict().items() if k in ('library_name', 'asset_type_id', 'eid', 'name')},
         }
-        content = self.get_content(timeout=600)
-        metadata['file_name'] = content.name
-        file_name = content.name
-        data = content.content
-        fs_handler.write(
-            fs_handler.join_path(base_path, self.eid, file_name),
-            data,
-            base_alias=alias + [metadata['name'], file_name] if alias else None,
-        )
+        with self.get_content_stream(timeout=600) as content:
+            metadata['file_name'] = content.name
+            file_name = content.name
+            write_chunks(
+                fs_handler,
+                fs_handler.join_path(base_path, self.eid, file_name),
+                content,
+                base_alias=alias + [metadata['name'], file_name] if alias else None,
+            )
 
         fs_handler.write(
             fs_handler.join_path(base_path, self.eid, 'metadata.json'),
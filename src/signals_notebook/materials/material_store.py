@@ -1,5 +1,5 @@
 import logging
-from typing import cast, Union
+from typing import cast, Iterable, List, Optional, Union
 
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import MID, Response, ResponseData
@@ -7,6 +7,9 @@ from signals_notebook.materials.asset import Asset
 from signals_notebook.materials.batch import Batch
 from signals_notebook.materials.library import Library
 from signals_notebook.materials.material import Material
+from signals_notebook.utils import map_concurrently
+from signals_notebook.utils.concurrency import DEFAULT_MAX_WORKERS
+from signals_notebook.utils.identity_map import IdentityMap
 
 log = logging.getLogger(__name__)
 
@@ -16,20 +19,47 @@ class MaterialResponse(Response[Union[Library, Asset, Batch]]):
 
 
 class MaterialStore:
+    _identity_map: Optional[IdentityMap] = None
+
     @classmethod
     def _get_endpoint(cls) -> str:
         return 'materials'
 
+    @classmethod
+    def set_identity_map(cls, identity_map: Optional[IdentityMap]) -> None:
+        """Enable in-process cache of materials.
+
+        Args:
+            identity_map: IdentityMap used to cache materials. None disables caching
+
+        Returns:
+
+        """
+        cls._identity_map = identity_map
+
     @classmethod
     def get(cls, eid: MID) -> Material:
         """Fetch material by entity ID.
 
+        If identity map is enabled, cached Material is returned while it is fresh.
+
         Args:
             eid: Unique material identifier
 
         Returns:
             Material
         """
+        identity_map = cls._identity_map
+        if identity_map is not None:
+            cached_material = identity_map.get(eid)
+            if cached_material is not None:
+                return cached_material
+
+        material = cls._fetch(eid)
+        return identity_map.merge(material) if identity_map is not None else material
+
+    @classmethod
+    def _fetch(cls, eid: MID) -> Material:
         api = SignalsNotebookApi.get_default_api()
         log.debug('Get Material Store for %s', eid)
 
@@ -41,3 +71,18 @@ class MaterialStore:
         result = MaterialResponse(**response.json())
 
         return cast(ResponseData, result.data).body
+
+    @classmethod
+    def get_many(cls, eids: Iterable[MID], max_workers: int = DEFAULT_MAX_WORKERS) -> List[Union[Material, Exception]]:
+        """Fetch several materials by entity ID concurrently.
+
+        Args:
+            eids: Unique material identifiers
+            max_workers: maximum number of requests sent at the same time
+
+        Returns:
+            list of Materials in the order of eids. If Material can not be fetched,
+            the raised exception is returned at its position instead.
+        """
+        log.debug('Get several Materials from Material Store using %s workers', max_workers)
+        return map_concurrently(cls.get, eids, max_workers=max_workers)
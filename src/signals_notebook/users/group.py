@@ -8,6 +8,8 @@ from pydantic import BaseModel, Field
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import ObjectType, Response, ResponseData
 from signals_notebook.users.user import User
+from signals_notebook.utils import Paginator
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 
 log = logging.getLogger(__name__)
@@ -32,30 +34,25 @@ class Group(BaseModel):
         return 'groups'
 
     @classmethod
-    def get_list(cls) -> Generator['Group', None, None]:
+    def get_list(cls, prefetch: int = DEFAULT_PREFETCH) -> Generator['Group', None, None]:
         """Get all groups
 
+        Args:
+            prefetch: Number of pages fetched in background ahead of consumer. 0 disables prefetching.
+
         Returns:
             Group
         """
         log.debug('Get List of Groups')
 
         api = SignalsNotebookApi.get_default_api()
-        response = api.call(
-            method='GET',
+        pages = Paginator(
+            api,
+            GroupResponse,
+            prefetch=prefetch,
             path=(cls._get_endpoint(),),
         )
-        result = GroupResponse(**response.json())
-        yield from [cast(ResponseData, item).body for item in result.data]
-
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
-
-            result = GroupResponse(**response.json())
-            yield from [cast(ResponseData, item).body for item in result.data]
+        yield from (cast(ResponseData, item).body for item in pages)
 
         log.debug('List of Groups were got successfully.')
 
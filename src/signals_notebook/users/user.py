@@ -10,6 +10,8 @@ from pydantic import BaseModel, Field, PrivateAttr
 from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import File, Response, ResponseData
 from signals_notebook.users.role import Role
+from signals_notebook.utils import Paginator
+from signals_notebook.utils.paginator import DEFAULT_PREFETCH
 
 log = logging.getLogger(__name__)
 
@@ -103,7 +105,9 @@ class User(BaseUser):
         return user
 
     @staticmethod
-    def get_list(q: str = '', enabled: bool = True, offset: int = 0, limit: int = 20) -> Generator['User', None, None]:
+    def get_list(
+        q: str = '', enabled: bool = True, offset: int = 0, limit: int = 20, prefetch: int = DEFAULT_PREFETCH
+    ) -> Generator['User', None, None]:
         """Get all users from the scope
 
         Parameter 'q' is a String and it is used to filter users.
@@ -120,6 +124,7 @@ class User(BaseUser):
             enabled: filter activated and deactivated users
             offset: Number of items to skip before returning the results.
             limit: Maximum number of items to return.
+            prefetch: Number of pages fetched in background ahead of consumer. 0 disables prefetching.
 
         Returns:
             User
@@ -128,8 +133,10 @@ class User(BaseUser):
 
         log.debug('Get List of Users')
 
-        response = api.call(
-            method='GET',
+        pages = Paginator(
+            api,
+            UserResponse,
+            prefetch=prefetch,
             path=('users',),
             params={
                 'q': q,
@@ -138,28 +145,12 @@ class User(BaseUser):
                 'limit': limit,
             },
         )
-        result = UserResponse(**response.json())
-
-        for item in result.data:
+        for item in pages:
             user = cast(ResponseData, item).body
             user.set_relationships(item.relationships)  # type: ignore
 
             yield user
 
-        while result.links and result.links.next:
-            response = api.call(
-                method='GET',
-                path=result.links.next,
-            )
-
-            result = UserResponse(**response.json())
-
-            for item in result.data:
-                user = cast(ResponseData, item).body
-                user.set_relationships(item.relationships)  # type: ignore
-
-                yield user
-
         log.debug('List of Users was got successfully.')
 
     @staticmethod
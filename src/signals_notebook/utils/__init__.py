@@ -1 +1,12 @@
-from signals_notebook.utils.fs_handler import FSHandler  # noqa
+from signals_notebook.utils.fs_handler import FSHandler, open_read, StreamingFSHandler, write_chunks  # noqa
+from signals_notebook.utils.concurrency import map_concurrently  # noqa
+from signals_notebook.utils.retry import RetryPolicy, RetryStatistics  # noqa
+from signals_notebook.utils.rate_limiter import RateLimiter  # noqa
+from signals_notebook.utils.paginator import AsyncPaginator, Paginator  # noqa
+from signals_notebook.utils.identity_map import IdentityMap  # noqa
+from signals_notebook.utils.http_cache import HttpCache  # noqa
+from signals_notebook.utils.json_decoder import get_json_decoder  # noqa
+from signals_notebook.utils.dump_manifest import DumpManifest  # noqa
+from signals_notebook.utils.load_journal import LoadJournal  # noqa
+from signals_notebook.utils.local_fs_handler import LocalFSHandler  # noqa
+from signals_notebook.utils.archive_fs_handler import TarFSHandler, ZipFSHandler  # noqa
@@ -0,0 +1,266 @@
+import abc
+import logging
+import posixpath
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Any, BinaryIO, cast, Dict, Iterable, List, Literal, Optional, Set, Union
+
+from signals_notebook.utils.local_fs_handler import DEFAULT_BUFFER_SIZE
+
+log = logging.getLogger(__name__)
+
+
+class _ArchiveFSHandler(abc.ABC):
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self._subfolders: Optional[Dict[str, Set[str]]] = None
+
+    def __enter__(self) -> '_ArchiveFSHandler':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Finish writing and close archive
+
+        Returns:
+
+        """
+
+    def write(self, path: str, data: Union[bytes, str], base_alias: Optional[Iterable[str]] = None) -> None:
+        """Write file content into given path
+
+        Args:
+            path: file path inside archive
+            data: file content. String is encoded as UTF-8
+            base_alias: (optional) Backup alias. It is ignored
+
+        Returns:
+
+        """
+        self.write_stream(path, [data.encode('utf-8') if isinstance(data, str) else data], base_alias)
+
+    def write_stream(self, path: str, chunks: Iterable[bytes], base_alias: Optional[Iterable[str]] = None) -> None:
+        """Write file content into given path chunk by chunk
+
+        Content is spooled to a temporary file which is kept in memory while it is smaller than buffer size.
+        The archive is locked only while the spooled content is copied into it,
+        so several files can be downloaded concurrently.
+
+        Args:
+            path: file path inside archive
+            chunks: iterable of content chunks
+            base_alias: (optional) Backup alias. It is ignored
+
+        Returns:
+
+        """
+        name = self._normalize(path)
+        with tempfile.SpooledTemporaryFile(max_size=self.buffer_size) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            size = f.tell()
+            f.seek(0)
+
+            with self._lock:
+                self._add(name, cast(BinaryIO, f), size)
+                self._subfolders = None
+
+        log.debug('%s was written to archive', name)
+
+    def read(self, path: str) -> bytes:
+        """Return file content from given path
+
+        Args:
+            path: file path inside archive
+
+        Returns:
+            bytes
+        """
+        with self.open_read(path) as f:
+            return f.read()
+
+    @abc.abstractmethod
+    def open_read(self, path: str) -> BinaryIO:
+        """Return file object reading content from given path
+
+        Args:
+            path: file path inside archive
+
+        Returns:
+            binary file object
+        """
+
+    def list_subfolders(self, path: str) -> List[str]:
+        """Return subfolders names from given path
+
+        Args:
+            path: folder path inside archive
+
+        Returns:
+            sorted list of names
+        """
+        with self._lock:
+            if self._subfolders is None:
+                self._subfolders = self._index_subfolders(self._get_names())
+            return sorted(self._subfolders.get(self._normalize(path), ()))
+
+    @classmethod
+    def join_path(cls, *paths: str) -> str:
+        """Concatenate file paths
+
+        Args:
+            paths: parts of path
+
+        Returns:
+            str
+        """
+        return posixpath.join(*paths)
+
+    @abc.abstractmethod
+    def _add(self, name: str, fileobj: BinaryIO, size: int) -> None:
+        pass
+
+    @abc.abstractmethod
+    def _get_names(self) -> List[str]:
+        pass
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        name = posixpath.normpath(path).lstrip('/')
+        return '' if name == '.' else name
+
+    @staticmethod
+    def _index_subfolders(names: Iterable[str]) -> Dict[str, Set[str]]:
+        subfolders: Dict[str, Set[str]] = {}
+        for name in names:
+            parts = name.rstrip('/').split('/')
+            depth = len(parts) if name.endswith('/') else len(parts) - 1
+            for i in range(depth):
+                subfolders.setdefault('/'.join(parts[:i]), set()).add(parts[i])
+        return subfolders
+
+
+class ZipFSHandler(_ArchiveFSHandler):
+    def __init__(
+        self,
+        path: str,
+        mode: Literal['r', 'w', 'x', 'a'] = 'r',
+        compression: int = zipfile.ZIP_DEFLATED,
+        compresslevel: Optional[int] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """FSHandler storing files in a single zip archive
+
+        Backup alias is ignored. Archive should be closed when dump is finished, e.g. by using it as context manager.
+
+        Args:
+            path: path of zip archive
+            mode: 'r' to read, 'w' to create or 'a' to append to existing archive
+            compression: zipfile compression method, e.g. zipfile.ZIP_STORED to store files uncompressed
+            compresslevel: (optional) compression level
+            buffer_size: size in bytes up to which written file is spooled in memory
+        """
+        super().__init__(buffer_size)
+        self.path = path
+        self._zip_file = zipfile.ZipFile(path, mode, compression=compression, compresslevel=compresslevel)
+
+    def close(self) -> None:
+        """Finish writing and close archive
+
+        Returns:
+
+        """
+        self._zip_file.close()
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Return file object reading content from given path
+
+        Args:
+            path: file path inside archive
+
+        Returns:
+            binary file object
+        """
+        return self._zip_file.open(self._normalize(path))  # type: ignore
+
+    def _add(self, name: str, fileobj: BinaryIO, size: int) -> None:
+        info = zipfile.ZipInfo(name, time.localtime()[:6])
+        info.compress_type = self._zip_file.compression
+        with self._zip_file.open(info, 'w', force_zip64=size > zipfile.ZIP64_LIMIT) as f:
+            shutil.copyfileobj(fileobj, f, self.buffer_size)
+
+    def _get_names(self) -> List[str]:
+        return self._zip_file.namelist()
+
+
+class TarFSHandler(_ArchiveFSHandler):
+    def __init__(
+        self,
+        path: str,
+        mode: str = 'r',
+        compression: Optional[str] = None,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """FSHandler storing files in a single tar archive
+
+        Backup alias is ignored. Archive should be closed when dump is finished, e.g. by using it as context manager.
+        Compressed archive is read sequentially, so reading files in the order they were written is the fastest.
+
+        Args:
+            path: path of tar archive
+            mode: 'r' to read or 'w' to create archive
+            compression: (optional) 'gz', 'bz2' or 'xz' to compress written archive.
+                Compression of read archive is detected automatically
+            buffer_size: size in bytes up to which written or read file is spooled in memory
+        """
+        super().__init__(buffer_size)
+        self.path = path
+        self._tar_file = tarfile.open(path, f'{mode}:{compression or ("*" if mode == "r" else "")}')
+
+    def close(self) -> None:
+        """Finish writing and close archive
+
+        Returns:
+
+        """
+        self._tar_file.close()
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Return file object reading content from given path
+
+        Member of tar archive can not be read concurrently with others, so it is spooled to a temporary file.
+
+        Args:
+            path: file path inside archive
+
+        Returns:
+            binary file object
+        """
+        name = self._normalize(path)
+        spooled_file = tempfile.SpooledTemporaryFile(max_size=self.buffer_size)
+        with self._lock:
+            member = self._tar_file.extractfile(name)
+            if member is None:
+                raise FileNotFoundError(name)
+            with member:
+                shutil.copyfileobj(member, spooled_file, self.buffer_size)
+
+        spooled_file.seek(0)
+        return spooled_file  # type: ignore
+
+    def _add(self, name: str, fileobj: BinaryIO, size: int) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(time.time())
+        self._tar_file.addfile(info, fileobj)
+
+    def _get_names(self) -> List[str]:
+        return self._tar_file.getnames()
@@ -0,0 +1,44 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, cast, Iterable, List, TypeVar, Union
+
+log = logging.getLogger(__name__)
+
+ItemType = TypeVar('ItemType')
+ResultType = TypeVar('ResultType')
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def map_concurrently(
+    func: Callable[[ItemType], ResultType],
+    items: Iterable[ItemType],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> List[Union[ResultType, Exception]]:
+    """Call func for every item using a bounded pool of worker threads
+
+    Args:
+        func: function to call with each item
+        items: items to process
+        max_workers: maximum number of concurrent calls
+
+    Returns:
+        list of results in the order of items. Item that failed is represented by the raised exception
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+
+    results: List[Union[ResultType, Exception]] = []
+    for item, future in zip(items, futures):
+        exception = future.exception()
+        if exception is not None:
+            log.error('Failed to process %s: %s', item, exception)
+            results.append(cast(Exception, exception))
+        else:
+            results.append(future.result())
+
+    return results
@@ -0,0 +1,157 @@
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import AbstractSet, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from signals_notebook.utils.fs_handler import FSHandler
+
+if TYPE_CHECKING:
+    from signals_notebook.entities import Entity
+
+log = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+
+class ManifestEntry(BaseModel):
+    eid: str
+    digest: Optional[str] = None
+    edited_at: Optional[datetime] = None
+    path: str
+    parent: Optional[str] = None
+
+
+class _ManifestContent(BaseModel):
+    created_at: datetime
+    entries: List[ManifestEntry]
+
+
+class DumpManifest:
+    def __init__(
+        self,
+        previous: Optional['DumpManifest'] = None,
+        changed_eids: Optional[AbstractSet[str]] = None,
+        created_at: Optional[datetime] = None,
+    ):
+        """Manifest of entities written by incremental dump
+
+        Entity is considered unchanged if the previous manifest has the same digest for it
+        and neither it nor any of its previously dumped descendants is among entities modified since the previous dump.
+        Unchanged entities are not exported again: their previous entries, including entries of their
+        descendants, are carried forward and keep pointing to the location of the previous dump.
+
+        Args:
+            previous: manifest of the previous dump. Every entity is dumped if it is not passed
+            changed_eids: IDs of entities modified since the previous dump
+            created_at: time when the dump started. Current time is used by default
+        """
+        self.created_at = created_at or datetime.now(timezone.utc)
+        self.entries: Dict[str, ManifestEntry] = {}
+        self._previous = previous
+        self._changed_eids = changed_eids
+        self._lock = threading.Lock()
+
+        self._previous_children: Dict[Optional[str], List[ManifestEntry]] = {}
+        for entry in previous.entries.values() if previous else ():
+            self._previous_children.setdefault(entry.parent, []).append(entry)
+
+    def is_unchanged(self, entity: 'Entity') -> bool:
+        """Check if entity was dumped before and has not changed since then
+
+        Args:
+            entity: Entity
+
+        Returns:
+            bool
+        """
+        if self._previous is None or entity.digest is None:
+            return False
+
+        entry = self._previous.entries.get(entity.eid)
+        if entry is None or entry.digest != entity.digest:
+            return False
+
+        if self._changed_eids is None:
+            return True
+
+        return entity.eid not in self._changed_eids and not any(
+            descendant.eid in self._changed_eids for descendant in self._iter_previous_descendants(entity.eid)
+        )
+
+    def _iter_previous_descendants(self, eid: str) -> Iterator[ManifestEntry]:
+        pending = list(self._previous_children.get(eid, []))
+        while pending:
+            entry = pending.pop()
+            yield entry
+            pending.extend(self._previous_children.get(entry.eid, []))
+
+    def record(self, entity: 'Entity', path: str, parent: Optional[str] = None) -> None:
+        """Add dumped entity to the manifest
+
+        Args:
+            entity: dumped Entity
+            path: location of entity dump
+            parent: ID of parent entity
+
+        Returns:
+
+        """
+        entry = ManifestEntry(
+            eid=entity.eid,
+            digest=entity.digest,
+            edited_at=entity.edited_at,
+            path=path,
+            parent=parent,
+        )
+        with self._lock:
+            self.entries[entry.eid] = entry
+
+    def carry_forward(self, eid: str) -> None:
+        """Copy entry of unchanged entity and its descendants from the previous manifest
+
+        Args:
+            eid: ID of unchanged entity
+
+        Returns:
+
+        """
+        assert self._previous is not None
+
+        with self._lock:
+            self.entries[eid] = self._previous.entries[eid]
+            for entry in self._iter_previous_descendants(eid):
+                self.entries[entry.eid] = entry
+
+        log.debug('%s has not changed since %s. Its previous dump is reused', eid, self._previous.created_at)
+
+    def save(self, fs_handler: FSHandler, path: str) -> None:
+        """Write manifest as JSON
+
+        Args:
+            fs_handler: FSHandler
+            path: path of manifest file
+
+        Returns:
+
+        """
+        content = _ManifestContent(created_at=self.created_at, entries=list(self.entries.values()))
+        fs_handler.write(path, content.json())
+
+    @classmethod
+    def load(cls, fs_handler: FSHandler, path: str) -> 'DumpManifest':
+        """Read manifest written by save
+
+        Args:
+            fs_handler: FSHandler
+            path: path of manifest file
+
+        Returns:
+            DumpManifest
+        """
+        content = _ManifestContent(**json.loads(fs_handler.read(path)))
+        manifest = cls(created_at=content.created_at)
+        manifest.entries = {entry.eid: entry for entry in content.entries}
+        return manifest
@@ -1,4 +1,5 @@
-from typing import Iterable, List, Optional, Protocol, Union
+import io
+from typing import BinaryIO, Iterable, List, Optional, Protocol, runtime_checkable, Union
 
 
 class FSHandler(Protocol):
@@ -14,3 +15,55 @@ class FSHandler(Protocol):
     @classmethod
     def join_path(cls, *paths: str) -> str:
         """Concatenate file paths."""
+
+
+@runtime_checkable
+class StreamingFSHandler(FSHandler, Protocol):
+    """FSHandler which writes and reads files without loading them to memory"""
+
+    def write_stream(self, path: str, chunks: Iterable[bytes], base_alias: Optional[Iterable[str]] = None):
+        """Write file content into given path chunk by chunk."""
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Return file object reading content from given path."""
+
+
+def write_chunks(
+    fs_handler: FSHandler, path: str, chunks: Iterable[bytes], base_alias: Optional[Iterable[str]] = None
+) -> None:
+    """Write file content chunk by chunk
+
+    Content is passed to write_stream if FSHandler is StreamingFSHandler.
+    Otherwise it is joined and written with write.
+
+    Args:
+        fs_handler: FSHandler
+        path: file path
+        chunks: iterable of content chunks
+        base_alias: (optional) Backup alias
+
+    Returns:
+
+    """
+    if isinstance(fs_handler, StreamingFSHandler):
+        fs_handler.write_stream(path, chunks, base_alias=base_alias)
+    else:
+        fs_handler.write(path, b''.join(chunks), base_alias=base_alias)
+
+
+def open_read(fs_handler: FSHandler, path: str) -> BinaryIO:
+    """Open file for reading
+
+    File object of open_read is returned if FSHandler is StreamingFSHandler.
+    Otherwise content is read with read and wrapped into file object.
+
+    Args:
+        fs_handler: FSHandler
+        path: file path
+
+    Returns:
+        binary file object
+    """
+    if isinstance(fs_handler, StreamingFSHandler):
+        return fs_handler.open_read(path)
+    return io.BytesIO(fs_handler.read(path))
@@ -0,0 +1,335 @@
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE = 1024**3
+_METADATA_SUFFIX = '.json'
+_BODY_SUFFIX = '.body'
+_TEMPORARY_BODY_SUFFIX = '.tmp' + _BODY_SUFFIX
+_TEMPORARY_METADATA_SUFFIX = _METADATA_SUFFIX + '.tmp'
+_CHUNK_SIZE = 1024 * 1024
+_CACHED_HEADERS = ('content-type', 'content-disposition', 'content-encoding', 'etag', 'last-modified')
+
+
+class _TemporaryFile(io.FileIO):
+    """Binary file which is removed when it is read to the end or closed"""
+
+    def __init__(self, path: str):
+        super().__init__(path, 'rb')
+        self._path = path
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        if not data and size != 0:
+            self.close()
+        return data
+
+    def close(self) -> None:
+        super().close()
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
+
+
+class CacheEntry:
+    def __init__(self, path: str, metadata: Dict[str, Any], size: int, accessed_at: float, temporary: bool = False):
+        """Response stored in HttpCache
+
+        Args:
+            path: path of the entry without suffix
+            metadata: url, headers and validators of the response
+            size: size of response body in bytes
+            accessed_at: time of last access
+            temporary: body is not kept in the cache, its file is removed when response built from entry is closed
+        """
+        self.path = path
+        self.metadata = metadata
+        self.size = size
+        self.accessed_at = accessed_at
+        self.temporary = temporary
+
+    @property
+    def body_path(self) -> str:
+        return self.path + _BODY_SUFFIX
+
+    @property
+    def metadata_path(self) -> str:
+        return self.path + _METADATA_SUFFIX
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.metadata['headers'].get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.metadata['headers'].get('last-modified')
+
+    @property
+    def validator(self) -> Optional[str]:
+        return self.metadata.get('validator')
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """Get headers which ask server to answer 304 Not Modified if response is still valid
+
+        Returns:
+            dict of headers
+        """
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def discard(self) -> None:
+        """Remove body of temporary entry if response is not built from it
+
+        Returns:
+
+        """
+        if not self.temporary:
+            return
+
+        try:
+            os.remove(self.body_path)
+        except FileNotFoundError:
+            pass
+
+    def to_response(self) -> requests.Response:
+        """Build response from cached data
+
+        Body is not loaded to memory until it is accessed.
+
+        Returns:
+            requests.Response
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = self.metadata['url']
+        response.headers = CaseInsensitiveDict(self.metadata['headers'])
+        response.encoding = self.metadata.get('encoding')
+        response.raw = _TemporaryFile(self.body_path) if self.temporary else open(self.body_path, 'rb')
+        return response
+
+
+class HttpCache:
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE):
+        """Persistent cache of GET responses stored on disk
+
+        Every response is kept in two files: the body as is and its metadata as JSON,
+        so large exports are never held in memory by the cache.
+        Cached responses are revalidated with ETag / Last-Modified headers or entity digest.
+        The least recently used responses are removed when total size of bodies exceeds max_size.
+
+        Args:
+            directory: path of directory where responses are stored. It is created if it does not exist
+            max_size: maximum total size of cached response bodies in bytes
+        """
+        self.directory = directory
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CacheEntry] = {}
+        self._size = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Total size of cached response bodies in bytes
+
+        Returns:
+            int
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """Get cache key of GET request
+
+        Args:
+            url: request url
+            params: request query parameters. Parameters with None value are ignored as requests does
+
+        Returns:
+            str
+        """
+        query = sorted((str(key), str(value)) for key, value in (params or {}).items() if value is not None)
+        return hashlib.sha256(json.dumps([url, query]).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get cached entry and mark it as recently used
+
+        Args:
+            key: cache key
+
+        Returns:
+            CacheEntry or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            entry.accessed_at = time.time()
+            try:
+                os.utime(entry.metadata_path, (entry.accessed_at, entry.accessed_at))
+            except OSError:
+                log.warning('Cached response %s was removed from disk', key)
+                self._remove(key)
+                return None
+
+            return entry
+
+    def put(self, key: str, response: requests.Response, validator: Optional[str] = None) -> Optional[CacheEntry]:
+        """Store response if it can be revalidated later
+
+        Body is written chunk by chunk without holding the cache lock, so streamed response is never loaded
+        to memory and other requests are not blocked by the download.
+        Streamed response can not be read again after it is stored, use the returned entry instead.
+        Body larger than max_size is not cached: the returned entry is temporary, its body is removed
+        when response built from it is read or closed, or when the entry is discarded.
+
+        Args:
+            key: cache key
+            response: successful response of GET request
+            validator: (optional) value which identifies version of the content, for example entity digest
+
+        Returns:
+            stored CacheEntry or None if response can not be revalidated
+        """
+        headers = {name: response.headers[name] for name in _CACHED_HEADERS if name in response.headers}
+        if not (validator or 'etag' in headers or 'last-modified' in headers):
+            return None
+
+        metadata = {
+            'url': response.url,
+            'encoding': response.encoding,
+            'headers': headers,
+            'validator': validator,
+        }
+        body_path, size = self._write_temporary(response.iter_content(_CHUNK_SIZE), _TEMPORARY_BODY_SUFFIX)
+        if size > self.max_size:
+            log.debug('Response of %s is larger than %s bytes and was not cached', response.url, self.max_size)
+            return CacheEntry(body_path[: -len(_BODY_SUFFIX)], metadata, size, time.time(), temporary=True)
+
+        try:
+            metadata_path, _ = self._write_temporary([json.dumps(metadata).encode('utf-8')], _TEMPORARY_METADATA_SUFFIX)
+        except BaseException:
+            os.remove(body_path)
+            raise
+
+        path = os.path.join(self.directory, key)
+        with self._lock:
+            self._remove(key)
+            os.replace(body_path, path + _BODY_SUFFIX)
+            os.replace(metadata_path, path + _METADATA_SUFFIX)
+            entry = CacheEntry(path, metadata, size, time.time())
+            self._entries[key] = entry
+            self._size += size
+            self._evict()
+
+        log.debug('Response of %s was cached', response.url)
+        return entry
+
+    def invalidate(self, key: str) -> None:
+        """Remove cached response
+
+        Args:
+            key: cache key
+
+        Returns:
+
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all cached responses
+
+        Returns:
+
+        """
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _load(self) -> None:
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith((_TEMPORARY_BODY_SUFFIX, _TEMPORARY_METADATA_SUFFIX)):
+                log.debug('Temporary file %s is left from previous session and will be removed', file_name)
+                os.remove(os.path.join(self.directory, file_name))
+                continue
+            if not file_name.endswith(_METADATA_SUFFIX):
+                continue
+
+            key = file_name[: -len(_METADATA_SUFFIX)]
+            path = os.path.join(self.directory, key)
+            try:
+                with open(path + _METADATA_SUFFIX, 'rb') as f:
+                    metadata = json.load(f)
+                size = os.path.getsize(path + _BODY_SUFFIX)
+                accessed_at = os.path.getmtime(path + _METADATA_SUFFIX)
+            except (OSError, ValueError):
+                log.warning('Cached response %s is corrupted and will be removed', key)
+                self._remove_files(path)
+                continue
+
+            self._entries[key] = CacheEntry(path, metadata, size, accessed_at)
+            self._size += size
+
+        self._evict()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_size:
+            return
+
+        for entry_key in sorted(self._entries, key=lambda key: self._entries[key].accessed_at):
+            if self._size <= self.max_size:
+                break
+            log.debug('Cached response %s was evicted', entry_key)
+            self._remove(entry_key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+            self._remove_files(entry.path)
+
+    @staticmethod
+    def _remove_files(path: str) -> None:
+        for suffix in (_METADATA_SUFFIX, _BODY_SUFFIX):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def _write_temporary(self, chunks: Iterable[bytes], suffix: str) -> Tuple[str, int]:
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=suffix)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        return tmp_path, size
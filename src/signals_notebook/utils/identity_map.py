@@ -0,0 +1,177 @@
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, cast, Optional, TypeVar
+
+from pydantic import BaseModel
+
+log = logging.getLogger(__name__)
+
+ModelType = TypeVar('ModelType', bound=BaseModel)
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL = 60.0
+
+
+def _estimate_size(obj: BaseModel) -> int:
+    try:
+        return len(obj.json())
+    except (TypeError, ValueError):
+        return sys.getsizeof(obj)
+
+
+def _update_instance(target: BaseModel, source: BaseModel) -> None:
+    for name, value in source.__dict__.items():
+        object.__setattr__(target, name, value)
+    object.__setattr__(target, '__fields_set__', set(source.__fields_set__))
+    for name in source.__private_attributes__:
+        object.__setattr__(target, name, getattr(source, name))
+
+
+class _Entry:
+    __slots__ = ('obj', 'size', 'validated_at')
+
+    def __init__(self, obj: BaseModel, size: int):
+        self.obj = obj
+        self.size = size
+        self.validated_at = time.monotonic()
+
+
+class IdentityMap:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: Optional[float] = DEFAULT_TTL,
+        max_memory: Optional[int] = None,
+        sizeof: Callable[[BaseModel], int] = _estimate_size,
+    ):
+        """In-process cache which keeps one Python object per entity ID
+
+        Cached object is returned without request while it is younger than ttl.
+        After that it is revalidated: the object is fetched again and its digest is compared with the cached one.
+        If digest has changed, the cached instance is updated in place, so it stays the same Python object.
+        The least recently used objects are evicted when max_entries or max_memory is exceeded.
+
+        Args:
+            max_entries: maximum number of cached objects
+            ttl: time in seconds during which cached object is used without revalidation.
+                None means objects are never revalidated
+            max_memory: approximate limit of memory used by cached objects in bytes. None means no limit
+            sizeof: function which estimates memory used by an object. It is called only if max_memory is set
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_memory = max_memory
+        self._sizeof = sizeof
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._memory = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def memory(self) -> int:
+        """Approximate memory used by cached objects in bytes. It is tracked only if max_memory is set
+
+        Returns:
+            int
+        """
+        return self._memory
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get cached object if it does not need revalidation
+
+        Args:
+            key: entity ID
+
+        Returns:
+            cached object or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.obj
+
+    def merge(self, obj: ModelType) -> ModelType:
+        """Put fetched object to the map
+
+        If object with the same ID is already cached, the cached instance is returned.
+        It is updated in place with values of fetched object when digests differ.
+
+        Args:
+            obj: fetched object. It must have eid and digest fields
+
+        Returns:
+            cached instance
+        """
+        key = obj.eid  # type: ignore
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(obj, self._get_size(obj))
+                self._entries[key] = entry
+                self._memory += entry.size
+            else:
+                digest = getattr(obj, 'digest', None)
+                if digest is None or digest != getattr(entry.obj, 'digest', None):
+                    log.debug('Digest of %s has changed. Updating cached instance', key)
+                    _update_instance(entry.obj, obj)
+                    size = self._get_size(entry.obj)
+                    self._memory += size - entry.size
+                    entry.size = size
+                entry.validated_at = time.monotonic()
+                self._entries.move_to_end(key)
+
+            self._evict()
+            return cast(ModelType, entry.obj)
+
+    def invalidate(self, key: str) -> None:
+        """Remove object from the map
+
+        Args:
+            key: entity ID
+
+        Returns:
+
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._memory -= entry.size
+
+    def clear(self) -> None:
+        """Remove all objects from the map
+
+        Returns:
+
+        """
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+
+    def _get_size(self, obj: BaseModel) -> int:
+        return self._sizeof(obj) if self.max_memory is not None else 0
+
+    def _is_expired(self, entry: _Entry) -> bool:
+        return self.ttl is not None and time.monotonic() - entry.validated_at > self.ttl
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_memory is not None and self._memory > self.max_memory and len(self._entries) > 1
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self._memory -= entry.size
+            log.debug('%s was evicted from identity map', key)
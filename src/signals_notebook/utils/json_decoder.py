@@ -0,0 +1,76 @@
+import importlib
+import json
+import logging
+from typing import Any, Callable, Optional, Union
+
+log = logging.getLogger(__name__)
+
+JsonLoads = Callable[[bytes], Any]
+
+AUTO = 'auto'
+_BACKENDS = {
+    'orjson': ('orjson', 'loads'),
+    'msgspec': ('msgspec.json', 'decode'),
+    'ujson': ('ujson', 'loads'),
+    'json': ('json', 'loads'),
+}
+_AUTO_ORDER = ('orjson', 'msgspec', 'ujson', 'json')
+
+
+def get_json_decoder(backend: Union[str, JsonLoads] = AUTO) -> JsonLoads:
+    """Get function decoding JSON from bytes
+
+    Args:
+        backend: name of JSON library ('orjson', 'msgspec', 'ujson' or 'json'), a decoding function,
+            or 'auto' to use the fastest installed library
+
+    Returns:
+        function which takes bytes and returns decoded object
+    """
+    if callable(backend):
+        return backend
+
+    if backend == AUTO:
+        for name in _AUTO_ORDER:
+            loads = _import_backend(name)
+            if loads is not None:
+                log.debug('%s is used to decode JSON', name)
+                return loads
+
+    if backend not in _BACKENDS:
+        raise ValueError(f'Unknown JSON backend: {backend}')
+
+    loads = _import_backend(backend)
+    if loads is None:
+        raise ImportError(f'{backend} is required to use it as JSON backend. Install it with `pip install {backend}`')
+
+    return loads
+
+
+def _import_backend(name: str) -> Optional[JsonLoads]:
+    module_name, function_name = _BACKENDS[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+    return getattr(module, function_name)
+
+
+def bind_json_decoder(response: Any, loads: JsonLoads) -> None:
+    """Make response.json() decode response body with given function
+
+    Args:
+        response: requests or httpx response
+        loads: function which takes bytes and returns decoded object
+
+    Returns:
+
+    """
+
+    def _json(**kwargs: Any) -> Any:
+        if kwargs:
+            return json.loads(response.content, **kwargs)
+        return loads(response.content)
+
+    response.json = _json
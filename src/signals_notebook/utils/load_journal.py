@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional, Set
+
+log = logging.getLogger(__name__)
+
+
+class LoadJournal:
+    def __init__(self, path: str):
+        """Local checkpoint file of dump restore
+
+        Every restored entity is appended to the file as soon as it is created, and every dump folder
+        is marked as completed when it is loaded together with all its children.
+        When restore is started again with the same journal, completed folders are skipped and
+        entities which were already created are reused instead of being created again.
+
+        Args:
+            path: path of local journal file. It is created if it does not exist
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._created: Dict[str, str] = {}
+        self._completed: Set[str] = set()
+
+        if os.path.exists(path):
+            self._read()
+
+    def get_created(self, source_path: str) -> Optional[str]:
+        """Get ID of entity which was created from dump folder
+
+        Args:
+            source_path: path of dump folder
+
+        Returns:
+            entity ID or None
+        """
+        return self._created.get(source_path)
+
+    def is_completed(self, source_path: str) -> bool:
+        """Check if dump folder has been loaded with all its children
+
+        Args:
+            source_path: path of dump folder
+
+        Returns:
+            bool
+        """
+        return source_path in self._completed
+
+    def record_created(self, source_path: str, eid: str) -> None:
+        """Checkpoint entity created from dump folder
+
+        Args:
+            source_path: path of dump folder
+            eid: ID of created entity
+
+        Returns:
+
+        """
+        with self._lock:
+            self._created[source_path] = eid
+            self._append({'path': source_path, 'eid': eid})
+
+    def mark_completed(self, source_path: str) -> None:
+        """Checkpoint dump folder loaded with all its children
+
+        Args:
+            source_path: path of dump folder
+
+        Returns:
+
+        """
+        with self._lock:
+            self._completed.add(source_path)
+            self._append({'path': source_path, 'completed': True})
+
+    def _read(self) -> None:
+        line = '\n'
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    log.warning('Incomplete record of %s is ignored', self.path)
+                    continue
+
+                if record.get('completed'):
+                    self._completed.add(record['path'])
+                else:
+                    self._created[record['path']] = record['eid']
+
+        if not line.endswith('\n'):
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write('\n')
+
+        log.info(
+            'Restore is resumed from %s: %s entities created, %s folders completed',
+            self.path,
+            len(self._created),
+            len(self._completed),
+        )
+
+    def _append(self, record: Dict[str, object]) -> None:
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,114 @@
+import logging
+import os
+import tempfile
+from typing import BinaryIO, Iterable, List, Optional, Union
+
+log = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+class LocalFSHandler:
+    def __init__(self, root: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """FSHandler storing files in local directory
+
+        Every file is written to a temporary file first and then moved to its place,
+        so interrupted dump never leaves partially written files. Backup alias is ignored.
+
+        Args:
+            root: directory where files are stored. It is created if it does not exist
+            buffer_size: size of write buffer in bytes
+        """
+        self.root = root
+        self.buffer_size = buffer_size
+        os.makedirs(root, exist_ok=True)
+
+    def write(self, path: str, data: Union[bytes, str], base_alias: Optional[Iterable[str]] = None) -> None:
+        """Write file content into given path
+
+        Args:
+            path: file path relative to root directory
+            data: file content. String is encoded as UTF-8
+            base_alias: (optional) Backup alias. It is ignored
+
+        Returns:
+
+        """
+        self.write_stream(path, [data.encode('utf-8') if isinstance(data, str) else data], base_alias)
+
+    def write_stream(self, path: str, chunks: Iterable[bytes], base_alias: Optional[Iterable[str]] = None) -> None:
+        """Write file content into given path chunk by chunk
+
+        Args:
+            path: file path relative to root directory
+            chunks: iterable of content chunks
+            base_alias: (optional) Backup alias. It is ignored
+
+        Returns:
+
+        """
+        full_path = self._get_full_path(path)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb', buffering=self.buffer_size) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+        log.debug('%s was written', full_path)
+
+    def read(self, path: str) -> bytes:
+        """Return file content from given path
+
+        Args:
+            path: file path relative to root directory
+
+        Returns:
+            bytes
+        """
+        with self.open_read(path) as f:
+            return f.read()
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Return file object reading content from given path
+
+        Args:
+            path: file path relative to root directory
+
+        Returns:
+            binary file object
+        """
+        return open(self._get_full_path(path), 'rb', buffering=self.buffer_size)
+
+    def list_subfolders(self, path: str) -> List[str]:
+        """Return subfolders names from given path
+
+        Args:
+            path: folder path relative to root directory
+
+        Returns:
+            sorted list of names
+        """
+        with os.scandir(self._get_full_path(path)) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+
+    @classmethod
+    def join_path(cls, *paths: str) -> str:
+        """Concatenate file paths
+
+        Args:
+            paths: parts of path
+
+        Returns:
+            str
+        """
+        return os.path.join(*paths)
+
+    def _get_full_path(self, path: str) -> str:
+        return os.path.join(self.root, path)
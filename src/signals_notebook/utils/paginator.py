@@ -0,0 +1,190 @@
+import logging
+import threading
+from queue import Queue
+from typing import Any, AsyncIterator, Dict, Generator, Iterator, List, Optional, Type, TYPE_CHECKING
+
+from signals_notebook.common_types import Links, Response, ResponseData
+
+if TYPE_CHECKING:
+    from signals_notebook.api import AsyncSignalsNotebookApi, SignalsNotebookApi
+
+log = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH = 0
+_ACQUIRE_TIMEOUT = 0.1
+
+
+class _Page:
+    def __init__(self, payload: Dict[str, Any]):
+        """Raw page of paginated response
+
+        Only the link to the next page and the list of not yet validated items are kept.
+        Items are stored in reversed order, so they can be popped one by one.
+
+        Args:
+            payload: decoded JSON of response
+        """
+        links = payload.get('links')
+        self.next: Optional[str] = Links(**links).next if links else None
+
+        data = payload.get('data', [])
+        self.pending: List[Dict[str, Any]] = data[::-1] if isinstance(data, list) else [data]
+
+
+class _EndOfPages:
+    pass
+
+
+class _Failure:
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class Paginator:
+    def __init__(
+        self,
+        api: 'SignalsNotebookApi',
+        response_class: Type[Response],
+        prefetch: int = DEFAULT_PREFETCH,
+        **call_kwargs: Any,
+    ):
+        """Iterate over paginated API response following links.next
+
+        Items are validated one at a time when they are requested, and the raw JSON of an item is released
+        as soon as it is handed out. If prefetch is positive, next pages are downloaded and decoded
+        in a background thread while the current one is consumed, at most prefetch pages ahead of the consumer.
+        Prefetching is disabled by default.
+
+        Args:
+            api: SignalsNotebookApi used to fetch pages
+            response_class: Response model describing each page
+            prefetch: number of pages fetched ahead of the consumer. 0 disables prefetching
+            **call_kwargs: arguments of api.call for the first page
+        """
+        self.api = api
+        self.response_class = response_class
+        self.prefetch = prefetch
+        self.call_kwargs = call_kwargs
+
+    def __iter__(self) -> Iterator[ResponseData]:
+        item_class = self.response_class.get_item_class()
+
+        for item in self.iter_raw():
+            yield item_class(**item)
+
+    def iter_raw(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over decoded JSON of items without validating them
+
+        Returns:
+            decoded JSON of item. It must not be modified
+        """
+        for page in self._pages():
+            pending = page.pending
+            del page
+            while pending:
+                yield pending.pop()
+
+    def _pages(self) -> Generator[_Page, None, None]:
+        if self.prefetch < 1:
+            yield from self._fetch_pages()
+            return
+
+        pages: Queue = Queue()
+        slots = threading.Semaphore(self.prefetch)
+        stopped = threading.Event()
+        producer = threading.Thread(target=self._produce, args=(pages, slots, stopped), daemon=True)
+        producer.start()
+
+        try:
+            while True:
+                page = pages.get()
+                if isinstance(page, _EndOfPages):
+                    break
+                if isinstance(page, _Failure):
+                    raise page.exception
+                slots.release()
+                yield page
+        finally:
+            stopped.set()
+
+    def _fetch_pages(self) -> Generator[_Page, None, None]:
+        response = self.api.call(method='GET', **self.call_kwargs)
+
+        while True:
+            page = _Page(response.json())
+            del response
+
+            next_link = page.next
+            yield page
+            del page
+
+            if not next_link:
+                break
+
+            log.debug('Fetching next page: %s', next_link)
+            response = self.api.call(
+                method='GET',
+                path=next_link,
+            )
+
+    def _produce(self, pages: Queue, slots: threading.Semaphore, stopped: threading.Event) -> None:
+        try:
+            fetched_pages = self._fetch_pages()
+            while True:
+                if not self._acquire(slots, stopped):
+                    return
+                page = next(fetched_pages, None)
+                if page is None:
+                    break
+                pages.put(page)
+                del page
+        except Exception as e:
+            pages.put(_Failure(e))
+            return
+
+        pages.put(_EndOfPages())
+
+    @staticmethod
+    def _acquire(slots: threading.Semaphore, stopped: threading.Event) -> bool:
+        while not stopped.is_set():
+            if slots.acquire(timeout=_ACQUIRE_TIMEOUT):
+                return True
+
+        log.debug('Consumer stopped. Prefetching of pages was cancelled')
+        return False
+
+
+class AsyncPaginator:
+    def __init__(self, api: 'AsyncSignalsNotebookApi', response_class: Type[Response], **call_kwargs: Any):
+        """Iterate over paginated API response following links.next using AsyncSignalsNotebookApi
+
+        Items are validated one at a time when they are requested.
+
+        Args:
+            api: AsyncSignalsNotebookApi used to fetch pages
+            response_class: Response model describing each page
+            **call_kwargs: arguments of api.call for the first page
+        """
+        self.api = api
+        self.response_class = response_class
+        self.call_kwargs = call_kwargs
+
+    async def __aiter__(self) -> AsyncIterator[ResponseData]:
+        item_class = self.response_class.get_item_class()
+        response = await self.api.call(method='GET', **self.call_kwargs)
+
+        while True:
+            page = _Page(response.json())
+            del response
+
+            while page.pending:
+                yield item_class(**page.pending.pop())
+
+            if not page.next:
+                break
+
+            log.debug('Fetching next page: %s', page.next)
+            response = await self.api.call(
+                method='GET',
+                path=page.next,
+            )
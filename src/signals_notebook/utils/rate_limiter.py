@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Optional
+
+log = logging.getLogger(__name__)
+
+_ASYNC_POLL_INTERVAL = 0.01
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        """Token bucket limiter of request rate and number of in-flight requests
+
+        One instance can be shared between several threads, event loops and api instances.
+
+        Args:
+            requests_per_second: sustained number of requests per second. None means no rate limit
+            burst: number of requests which can be sent at once after idle period. Default is requests_per_second
+            max_concurrent: maximum number of requests in flight. None means no limit
+        """
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError('requests_per_second must be positive')
+        if max_concurrent is not None and max_concurrent <= 0:
+            raise ValueError('max_concurrent must be positive')
+
+        self.requests_per_second = requests_per_second
+        self.burst = max(1, burst if burst is not None else int(requests_per_second or 1))
+        self.max_concurrent = max_concurrent
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._slot_released = threading.Condition(self._lock)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests which are currently sent
+
+        Returns:
+            int
+        """
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until request can be sent
+
+        Returns:
+
+        """
+        with self._lock:
+            while not self._has_free_slot():
+                self._slot_released.wait()
+            self._in_flight += 1
+
+        try:
+            delay = self._take_token()
+            while delay:
+                time.sleep(delay)
+                delay = self._take_token()
+        except BaseException:
+            self.release()
+            raise
+
+    async def acquire_async(self) -> None:
+        """Wait until request can be sent without blocking the event loop
+
+        Returns:
+
+        """
+        while not self._try_take_slot():
+            await asyncio.sleep(_ASYNC_POLL_INTERVAL)
+
+        try:
+            delay = self._take_token()
+            while delay:
+                await asyncio.sleep(delay)
+                delay = self._take_token()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Mark request as finished
+
+        Returns:
+
+        """
+        with self._lock:
+            self._in_flight -= 1
+            self._slot_released.notify()
+
+    def __enter__(self) -> 'RateLimiter':
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    async def __aenter__(self) -> 'RateLimiter':
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.release()
+
+    def _has_free_slot(self) -> bool:
+        return self.max_concurrent is None or self._in_flight < self.max_concurrent
+
+    def _try_take_slot(self) -> bool:
+        with self._lock:
+            if not self._has_free_slot():
+                return False
+            self._in_flight += 1
+            return True
+
+    def _take_token(self) -> float:
+        """Take token from the bucket
+
+        Returns:
+            0 if token was taken, otherwise time in seconds until next token is available
+        """
+        if self.requests_per_second is None:
+            return 0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.requests_per_second)
+            self._updated_at = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+
+            delay = (1 - self._tokens) / self.requests_per_second
+            log.debug('Request rate limit reached. Waiting for %.3f seconds', delay)
+            return delay
@@ -0,0 +1,153 @@
+import logging
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, Dict, Mapping, Optional
+
+log = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+
+class RetryStatistics:
+    """Thread-safe counters of retries made by RetryPolicy"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.total_backoff = 0.0
+        self.retries_by_status: Dict[int, int] = {}
+
+    def record(self, status_code: Optional[int], backoff: float) -> None:
+        """Register one retry
+
+        Args:
+            status_code: status code of the failed response. None if connection failed
+            backoff: time in seconds waited before the retry
+
+        Returns:
+
+        """
+        with self._lock:
+            self.retries += 1
+            self.total_backoff += backoff
+            if status_code is not None:
+                self.retries_by_status[status_code] = self.retries_by_status.get(status_code, 0) + 1
+
+    def reset(self) -> None:
+        """Reset all counters
+
+        Returns:
+
+        """
+        with self._lock:
+            self.retries = 0
+            self.total_backoff = 0.0
+            self.retries_by_status = {}
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: float = 0.5,
+        status_codes_by_method: Optional[Mapping[str, Collection[int]]] = None,
+        retry_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+    ):
+        """Retry policy with exponential backoff used by SignalsNotebookApi
+
+        By default idempotent methods (GET, HEAD, OPTIONS, PUT, DELETE) are retried on 429, 502, 503 and 504.
+        Other methods are retried only on 429, because the server rejects such request before processing it.
+
+        Args:
+            total: maximum number of retries for one call. 0 disables retries
+            backoff_factor: delay in seconds before the first retry. It doubles with every next retry
+            max_backoff: upper bound of exponential delay in seconds
+            jitter: fraction of the delay added at random to spread retries of concurrent clients
+            status_codes_by_method: mapping of HTTP method to status codes which should be retried
+            retry_connection_errors: retry idempotent methods if connection fails
+            respect_retry_after: wait as long as Retry-After response header asks
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_connection_errors = retry_connection_errors
+        self.respect_retry_after = respect_retry_after
+        if status_codes_by_method is None:
+            status_codes_by_method = {
+                **{method: RETRYABLE_STATUS_CODES for method in IDEMPOTENT_METHODS},
+                'POST': {429},
+                'PATCH': {429},
+            }
+        self.status_codes_by_method = {
+            method.upper(): frozenset(status_codes) for method, status_codes in status_codes_by_method.items()
+        }
+        self.statistics = RetryStatistics()
+
+    def is_retryable_status(self, method: str, status_code: int, attempt: int) -> bool:
+        """Check if response with given status code should be retried
+
+        Args:
+            method: HTTP method name
+            status_code: response status code
+            attempt: number of retries already made
+
+        Returns:
+            bool
+        """
+        return attempt < self.total and status_code in self.status_codes_by_method.get(method.upper(), ())
+
+    def is_retryable_error(self, method: str, attempt: int) -> bool:
+        """Check if call failed with connection error should be retried
+
+        Args:
+            method: HTTP method name
+            attempt: number of retries already made
+
+        Returns:
+            bool
+        """
+        return attempt < self.total and self.retry_connection_errors and method.upper() in IDEMPOTENT_METHODS
+
+    def get_backoff(self, attempt: int, headers: Optional[Mapping[str, str]] = None) -> float:
+        """Get time in seconds to wait before next retry
+
+        Args:
+            attempt: number of retries already made
+            headers: headers of the failed response
+
+        Returns:
+            delay in seconds
+        """
+        retry_after = self._parse_retry_after(headers) if self.respect_retry_after else None
+        if retry_after is not None:
+            backoff = retry_after
+        else:
+            backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+
+        return backoff + random.uniform(0, self.jitter * backoff)
+
+    @staticmethod
+    def _parse_retry_after(headers: Optional[Mapping[str, str]]) -> Optional[float]:
+        value = (headers or {}).get('Retry-After')
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            log.warning('Cannot parse Retry-After header: %s', value)
+            return None
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,23 @@
+from unittest.mock import Mock
+
+from signals_notebook.common_types import FileStream
+
+
+def test_save_writes_chunks_to_directory(tmp_path):
+    on_close = Mock()
+
+    with FileStream('file.txt', 'text/plain', iter([b'first ', b'', b'second']), on_close=on_close) as stream:
+        stream.save(str(tmp_path))
+
+    assert (tmp_path / 'file.txt').read_bytes() == b'first second'
+    on_close.assert_called_once_with()
+
+
+def test_to_file():
+    stream = FileStream('file.txt', 'text/plain', [b'first ', b'second'])
+
+    result = stream.to_file()
+
+    assert result.name == 'file.txt'
+    assert result.content == b'first second'
+    assert result.content_type == 'text/plain'
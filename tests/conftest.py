@@ -9,3 +9,11 @@ def api_mock(mocker):
 @pytest.fixture(autouse=True)
 def signals_notebook_api_mock(mocker, api_mock):
     return mocker.patch('signals_notebook.entities.entity.SignalsNotebookApi.get_default_api', return_value=api_mock)
+
+
+@pytest.fixture()
+def async_api_mock(mocker):
+    api = mocker.Mock()
+    api.call = mocker.AsyncMock(return_value=mocker.Mock())
+    mocker.patch('signals_notebook.api.AsyncSignalsNotebookApi.get_default_api', return_value=api)
+    return api
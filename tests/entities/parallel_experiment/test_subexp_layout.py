@@ -21,6 +21,7 @@ def test_get_content(sub_experiment_layout_factory, api_mock):
         params={
             'format': 'csv',
         },
+        cache_validator=sub_experiment_layout.digest,
     )
 
     assert isinstance(result, File)
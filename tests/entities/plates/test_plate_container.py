@@ -159,6 +159,7 @@ def test_get_content(api_mock, plate_container_factory, plate_container_content)
         params={
             'format': None,
         },
+        cache_validator=plate_container.digest,
     )
 
     assert isinstance(result, File)
@@ -110,6 +110,7 @@ def test_get_content(
         params={
             'format': format,
         },
+        cache_validator=samples_container.digest,
     )
 
     assert isinstance(result, File)
@@ -305,6 +306,7 @@ def test_dump(
 
     content_response = get_response_object({})
     content_response.content = samples_container_csv_content
+    content_response.iter_content.return_value = [samples_container_csv_content]
     content_response.headers = {
         'content-type': content_type,
         'content-disposition': f'attachment; filename={file_name}',
@@ -347,10 +349,11 @@ def test_dump(
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(sample_container_metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), content_response.content, base_alias=None),
             mocker.call(fs_handler_mock.join_path(), json.dumps(sample_metadata), base_alias=None),
             mocker.call(
                 fs_handler_mock.join_path(), json.dumps({'data': data}, default=str).encode('utf-8'), base_alias=None
             ),
         ],
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [content_response.content]
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os.path
 from uuid import UUID
@@ -5,11 +6,13 @@ from uuid import UUID
 import arrow
 import pandas as pd
 import pytest
+import requests
 
 from signals_notebook.common_types import EntityType, File, ObjectType
 from signals_notebook.entities import Table, UploadedResource
 from signals_notebook.entities.tables.cell import Cell, ColumnDataType, ColumnDefinition, DateTimeCell
 from signals_notebook.entities.tables.row import Row
+from signals_notebook.exceptions import BatchUpsertError
 
 DIGEST = '123'
 
@@ -246,6 +249,22 @@ def test_reload_data(api_mock, reload_data_response, table):
         assert isinstance(row, Row)
 
 
+def test_as_dataframe_async(async_api_mock, reload_data_response, table):
+    async_api_mock.call.return_value.json.return_value = reload_data_response
+
+    result = asyncio.run(table.as_dataframe_async())
+
+    async_api_mock.call.assert_awaited_once_with(
+        method='GET',
+        path=('adt', table.eid),
+        params={
+            'value': 'normalized',
+        },
+    )
+    assert isinstance(result, pd.DataFrame)
+    assert result.shape[0] == len(reload_data_response['data'])
+
+
 def test_get_column_definitions_list(api_mock, all_column_types_definitions_response, table):
     api_mock.call.return_value.json.return_value = all_column_types_definitions_response
 
@@ -296,6 +315,106 @@ def test_as_dataframe(api_mock, reload_data_response, table):
     assert len(columns) == result.shape[1]
 
 
+@pytest.mark.parametrize('use_labels', [True, False])
+def test_as_dataframe_columnar(
+    mocker,
+    api_mock,
+    reload_data_response,
+    all_column_types_definitions_response,
+    get_response_object,
+    table,
+    use_labels,
+):
+    api_mock.call.side_effect = [
+        get_response_object(reload_data_response),
+        get_response_object(all_column_types_definitions_response),
+    ]
+
+    result = table.as_dataframe(use_labels=use_labels, columnar=True)
+
+    api_mock.call.assert_has_calls(
+        [
+            mocker.call(method='GET', path=('adt', table.eid), params={'value': 'normalized'}),
+            mocker.call(method='GET', path=('adt', table.eid, '_column')),
+        ]
+    )
+    assert not table._rows
+    assert list(result.index) == [UUID('945e5287-1e1f-4310-b42a-43ed0405a4b4')]
+    assert result.shape == (1, 14)
+
+    if not use_labels:
+        assert result.columns[0] == UUID('49b2cf34-b4bb-4868-af67-931f31b46581')
+        return
+
+    assert result['Col. Text'].dtype == object
+    assert str(result['Col. Date/Time'].dtype) == 'datetime64[ns, UTC]'
+    assert result['Col. Number'].dtype == 'float64'
+    assert result['Col. Number w/Unit'].dtype == 'float64'
+    assert result['Col. Integer'].dtype == 'Int64'
+    assert result['Col. Integer'][0] == 123
+    assert result['Col. Checkbox'].dtype == 'boolean'
+    assert result['Col. List'].dtype == 'category'
+    assert list(result['Col. List'].cat.categories) == ['Option 1', 'Option 2', 'Option 3']
+    assert result['Col. Multi Attribute List'][0] == ['Option 1', 'Option 2']
+    assert result['Col. Date'][0] == '16/06/2001'
+
+
+@pytest.fixture()
+def paged_data_responses(reload_data_response, get_response_object):
+    row = reload_data_response['data'][0]
+
+    def _row(row_id):
+        return {**row, 'id': row_id, 'attributes': {**row['attributes'], 'id': row_id}}
+
+    next_link = 'https://example.com/api/rest/v1.0/adt/grid:1?page[offset]=2&page[limit]=2'
+    first_page = {
+        'links': {'self': 'https://example.com/api/rest/v1.0/adt/grid:1', 'next': next_link},
+        'data': [row, _row('1f3a6c4e-7a34-4ddf-8f2f-1cfd5ac1e6a1')],
+    }
+    second_page = {
+        'links': {'self': next_link},
+        'data': [_row('5a0c1ad6-bfa4-4c7e-9c9f-3c8b1d1b8f2e')],
+    }
+    return [get_response_object(first_page), get_response_object(second_page)]
+
+
+def test_iter_rows(mocker, api_mock, paged_data_responses, table):
+    api_mock.call.side_effect = paged_data_responses
+
+    result = list(table.iter_rows(page_size=2, prefetch=0))
+
+    api_mock.call.assert_has_calls(
+        [
+            mocker.call(
+                method='GET',
+                path=('adt', table.eid),
+                params={'value': 'normalized', 'page[offset]': 0, 'page[limit]': 2},
+            ),
+            mocker.call(method='GET', path='https://example.com/api/rest/v1.0/adt/grid:1?page[offset]=2&page[limit]=2'),
+        ]
+    )
+    assert [str(row.id) for row in result] == [
+        '945e5287-1e1f-4310-b42a-43ed0405a4b4',
+        '1f3a6c4e-7a34-4ddf-8f2f-1cfd5ac1e6a1',
+        '5a0c1ad6-bfa4-4c7e-9c9f-3c8b1d1b8f2e',
+    ]
+    assert all(isinstance(row, Row) for row in result)
+    assert not table._rows
+
+
+def test_iter_dataframes(
+    api_mock, paged_data_responses, all_column_types_definitions_response, get_response_object, table
+):
+    api_mock.call.side_effect = [get_response_object(all_column_types_definitions_response), *paged_data_responses]
+
+    result = list(table.iter_dataframes(chunk_rows=2, prefetch=0))
+
+    assert [chunk.shape for chunk in result] == [(2, 14), (1, 14)]
+    assert list(result[1].index) == [UUID('5a0c1ad6-bfa4-4c7e-9c9f-3c8b1d1b8f2e')]
+    assert result[0]['Col. Number'].dtype == 'float64'
+    assert not table._rows
+
+
 def test_as_raw_data(api_mock, reload_data_response, table):
     api_mock.call.return_value.json.return_value = reload_data_response
 
@@ -501,13 +620,122 @@ def test_save_after_change_cell_and_delete_row(
         ),
     )
 
-    api_mock.call.assert_called_with(
-        method='GET',
-        path=('adt', table_with_digest.eid),
-        params={
-            'value': 'normalized',
-        },
+    assert api_mock.call.call_args.kwargs['method'] == 'PATCH'
+    assert len(table_with_digest._rows) == len(reload_data) - 1
+    assert reload_data[1]['id'] not in {str(row_id) for row_id in table_with_digest._rows_by_id}
+    assert not table_with_digest._rows[0].is_changed
+    assert not table_with_digest._rows[0].cells[0].is_changed
+    assert table_with_digest._rows[0].cells[0].value == 'Updated Text 1'
+
+
+def test_save_sends_only_dirty_rows(mocker, api_mock, reload_data_response_square_table, table):
+    mocker.patch.object(Table, 'get_column_definitions_map', return_value={})
+    api_mock.call.return_value.json.return_value = reload_data_response_square_table
+    reload_data = reload_data_response_square_table['data']
+    table._reload_data()
+    table._rows[1].cells[0].set_value('Updated')
+    table.add_row({})
+    table._rows[-1].delete()
+    api_mock.call.reset_mock()
+
+    table.save()
+
+    adt_calls = [call for call in api_mock.call.call_args_list if call.kwargs['path'][0] == 'adt']
+    assert len(adt_calls) == 1
+    assert [row['id'] for row in json.loads(adt_calls[0].kwargs['data'])['data']] == [reload_data[1]['id']]
+    assert len(table._rows) == len(reload_data)
+    api_mock.call.reset_mock()
+
+    table.save()
+
+    assert all(call.kwargs['path'][0] != 'adt' for call in api_mock.call.call_args_list)
+
+
+def test_bulk_upsert_dataframe(mocker, api_mock, column_definitions_response, get_response_object, table):
+    api_mock.call.side_effect = [get_response_object(column_definitions_response), mocker.Mock(), mocker.Mock()]
+    row_id = UUID('945e5287-1e1f-4310-b42a-43ed0405a4b4')
+    dataframe = pd.DataFrame(
+        {'Column 1': ['Updated', 'New'], 'Column 2': [None, 'Text'], 'Unknown': [1, 2]},
+        index=[row_id, 1],
     )
+    on_batch = mocker.Mock()
+
+    result = table.bulk_upsert(dataframe, batch_size=1, on_batch=on_batch)
+
+    assert [call.kwargs['data'] for call in api_mock.call.call_args_list[1:]] == [
+        json.dumps(
+            {
+                'data': [
+                    {
+                        'type': 'adtRow',
+                        'id': str(row_id),
+                        'attributes': {
+                            'action': 'update',
+                            'cells': [{'key': 'fac1b3c0-c262-4b47-92c2-5f6535536ca3', 'content': {'value': 'Updated'}}],
+                        },
+                    }
+                ]
+            }
+        ),
+        json.dumps(
+            {
+                'data': [
+                    {
+                        'type': 'adtRow',
+                        'attributes': {
+                            'action': 'create',
+                            'cells': [
+                                {'key': 'fac1b3c0-c262-4b47-92c2-5f6535536ca3', 'content': {'value': 'New'}},
+                                {'key': '15c9d0ef-3873-481f-bb1b-5d719bde0598', 'content': {'value': 'Text'}},
+                            ],
+                        },
+                    }
+                ]
+            }
+        ),
+    ]
+    assert api_mock.call.call_args.kwargs['params'] == {'digest': None, 'force': 'true'}
+    assert [(item.index, item.first_row, item.rows, item.ok) for item in result] == [(0, 0, 1, True), (1, 1, 1, True)]
+    on_batch.assert_has_calls([mocker.call(result[0]), mocker.call(result[1])])
+
+
+def test_bulk_upsert_rejects_unsaved_rows(api_mock, column_definitions_response, get_response_object, table):
+    api_mock.call.return_value = get_response_object(column_definitions_response)
+    table.add_row({'Column 1': {'value': 'Unsaved'}})
+    api_mock.call.reset_mock()
+
+    with pytest.raises(ValueError, match='unsaved changes'):
+        table.bulk_upsert([{'Column 1': 'New'}])
+
+    api_mock.call.assert_not_called()
+
+
+@pytest.mark.parametrize('max_workers', [1, 2])
+def test_bulk_upsert_splits_by_size_and_reports_failures(
+    mocker, api_mock, column_definitions_response, get_response_object, table, max_workers
+):
+    error = requests.ConnectionError('reset')
+
+    def _call(**kwargs):
+        if kwargs['method'] == 'GET':
+            return get_response_object(column_definitions_response)
+        if 'Row 2' in kwargs['data']:
+            raise error
+        return mocker.Mock()
+
+    api_mock.call.side_effect = _call
+    rows = [{'Column 1': f'Row {i}'} for i in range(4)]
+    row_size = len(
+        '{"type": "adtRow", "attributes": {"action": "create", "cells": '
+        '[{"key": "fac1b3c0-c262-4b47-92c2-5f6535536ca3", "content": {"value": "Row 0"}}]}}'
+    )
+
+    result = table.bulk_upsert(rows, max_batch_bytes=len('{"data": []}') + 2 * row_size + 2, max_workers=max_workers)
+
+    assert [(item.first_row, item.rows) for item in result] == [(0, 2), (2, 2)]
+    assert result[0].ok
+    assert result[1].error is error
+    assert api_mock.call.call_count == 3
 
 
 @pytest.fixture()
@@ -667,6 +895,192 @@ def test_create_with_template_full_table(
     )
 
 
+def test_create_from_dataframe_with_template(
+    mocker, api_mock, experiment_factory, column_definitions_response, get_response_object, table
+):
+    create_mock = mocker.patch.object(Table, 'create', return_value=table)
+    api_mock.call.side_effect = [get_response_object(column_definitions_response), mocker.Mock()]
+    dataframe = pd.DataFrame(
+        {
+            'Column 1': ['Text 1', None],
+            '15c9d0ef-3873-481f-bb1b-5d719bde0598': pd.to_datetime(['2021-12-31T20:00:00', '2022-01-01T10:30:00']),
+            'Unknown': [1, 2],
+        }
+    )
+    experiment = experiment_factory()
+
+    result = Table.create_from_dataframe(
+        container=experiment, name='My table', dataframe=dataframe, template='grid:template'
+    )
+
+    assert result is table
+    create_mock.assert_called_once_with(container=experiment, name='My table', template='grid:template')
+    api_mock.call.assert_called_with(
+        method='PATCH',
+        path=('adt', table.eid),
+        params={'digest': None, 'force': 'true'},
+        data=json.dumps(
+            {
+                'data': [
+                    {
+                        'type': 'adtRow',
+                        'attributes': {
+                            'action': 'create',
+                            'cells': [
+                                {'key': 'fac1b3c0-c262-4b47-92c2-5f6535536ca3', 'content': {'value': 'Text 1'}},
+                                {
+                                    'key': '15c9d0ef-3873-481f-bb1b-5d719bde0598',
+                                    'content': {'value': '2021-12-31T20:00:00.000Z'},
+                                },
+                            ],
+                        },
+                    },
+                    {
+                        'type': 'adtRow',
+                        'attributes': {
+                            'action': 'create',
+                            'cells': [
+                                {
+                                    'key': '15c9d0ef-3873-481f-bb1b-5d719bde0598',
+                                    'content': {'value': '2022-01-01T10:30:00.000Z'},
+                                },
+                            ],
+                        },
+                    },
+                ]
+            }
+        ),
+    )
+
+
+def test_create_from_dataframe_converts_values_to_column_types(
+    mocker, api_mock, experiment_factory, all_column_types_definitions_response, get_response_object, table
+):
+    mocker.patch.object(Table, 'create', return_value=table)
+    api_mock.call.side_effect = [get_response_object(all_column_types_definitions_response), mocker.Mock()]
+    dataframe = pd.DataFrame(
+        {
+            'Col. Number w/Unit': [36.6, 37.2],
+            'Col. Integer': [1, None],
+            'Col. Text': [12, 13],
+            'Col. Date/Time': ['2021-12-31T20:00:00', None],
+        }
+    )
+
+    Table.create_from_dataframe(
+        container=experiment_factory(), name='My table', dataframe=dataframe, template='grid:template'
+    )
+
+    assert json.loads(api_mock.call.call_args.kwargs['data']) == {
+        'data': [
+            {
+                'type': 'adtRow',
+                'attributes': {
+                    'action': 'create',
+                    'cells': [
+                        {'key': 'f0eb0e49-0460-4f84-8616-b17cebac69a3', 'content': {'value': 36.6, 'units': 'C'}},
+                        {'key': '6ed558b6-7ba7-41a3-8f5e-0e16acb71f1c', 'content': {'value': 1}},
+                        {'key': '49b2cf34-b4bb-4868-af67-931f31b46581', 'content': {'value': '12'}},
+                        {
+                            'key': 'dff966b1-ed21-4f94-9446-78b00b01bdf8',
+                            'content': {'value': '2021-12-31T20:00:00.000Z'},
+                        },
+                    ],
+                },
+            },
+            {
+                'type': 'adtRow',
+                'attributes': {
+                    'action': 'create',
+                    'cells': [
+                        {'key': 'f0eb0e49-0460-4f84-8616-b17cebac69a3', 'content': {'value': 37.2, 'units': 'C'}},
+                        {'key': '49b2cf34-b4bb-4868-af67-931f31b46581', 'content': {'value': '13'}},
+                    ],
+                },
+            },
+        ]
+    }
+
+
+def test_create_from_dataframe_raises_if_batches_fail(
+    mocker, api_mock, experiment_factory, column_definitions_response, get_response_object, table
+):
+    mocker.patch.object(Table, 'create', return_value=table)
+    error = requests.ConnectionError('reset')
+    api_mock.call.side_effect = [get_response_object(column_definitions_response), mocker.Mock(), error]
+    dataframe = pd.DataFrame({'Column 1': ['Text 1', 'Text 2']})
+
+    with pytest.raises(BatchUpsertError) as exc_info:
+        Table.create_from_dataframe(
+            container=experiment_factory(), name='My table', dataframe=dataframe, template='grid:template', batch_size=1
+        )
+
+    assert exc_info.value.table is table
+    assert [result.ok for result in exc_info.value.results] == [True, False]
+    assert exc_info.value.failed_results[0].error is error
+
+
+def test_create_from_dataframe_without_template(mocker, experiment_factory):
+    mocker.patch('signals_notebook.entities.TemplateIndex.find_by_columns', return_value=None)
+    experiment = experiment_factory()
+    uploaded = []
+
+    def _add_child(**kwargs):
+        uploaded.append((kwargs['name'], kwargs['content_type'], kwargs['content'].read()))
+        return mocker.sentinel.table
+
+    mocker.patch.object(type(experiment), 'add_child', side_effect=_add_child)
+    dataframe = pd.DataFrame(
+        {
+            'Number': [1.5, None],
+            'List': [['a', 'b'], None],
+            'Flag': pd.Categorical(['yes', 'no']),
+        }
+    )
+
+    result = Table.create_from_dataframe(container=experiment, name='My table', dataframe=dataframe)
+
+    assert result is mocker.sentinel.table
+    assert uploaded == [
+        (
+            'My table',
+            Table.ContentType.JSON,
+            json.dumps(
+                {
+                    'data': [
+                        {
+                            'Number': {'value': 1.5},
+                            'List': {'value': 'a, b', 'values': ['a', 'b']},
+                            'Flag': {'value': 'yes'},
+                        },
+                        {'Flag': {'value': 'no'}},
+                    ]
+                }
+            ).encode('utf-8'),
+        )
+    ]
+
+
+def test_create_from_arrow(mocker, experiment_factory):
+    create_mock = mocker.patch.object(Table, 'create_from_dataframe')
+    arrow_table = mocker.Mock()
+    experiment = experiment_factory()
+
+    result = Table.create_from_arrow(container=experiment, name='My table', arrow_table=arrow_table, max_workers=4)
+
+    assert result is create_mock.return_value
+    create_mock.assert_called_once_with(
+        container=experiment,
+        name='My table',
+        dataframe=arrow_table.to_pandas.return_value,
+        template=None,
+        batch_size=500,
+        max_batch_bytes=4 * 1024 * 1024,
+        max_workers=4,
+        on_batch=None,
+    )
+
+
 def test_create_table_file(api_mock, experiment_factory, eid_factory, table_json_content):
     container = experiment_factory()
     eid = eid_factory(type=EntityType.UPLOADED_RESOURCE)
@@ -732,6 +1146,7 @@ def test_get_content_csv(api_mock, table_factory, table_csv_content):
         params={
             'format': None,
         },
+        cache_validator=table.digest,
     )
 
     assert isinstance(result, File)
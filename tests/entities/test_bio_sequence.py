@@ -1,3 +1,4 @@
+import io
 import json
 import os
 
@@ -84,6 +85,7 @@ def test_get_content(biological_sequence_factory, api_mock, bio_seq_content):
         params={
             'format': None,
         },
+        cache_validator=bio_sequence.digest,
     )
 
     assert isinstance(result, File)
@@ -119,6 +121,7 @@ def test_dump(biological_sequence_factory, mocker, api_mock, bio_seq_content):
         'content-disposition': f'attachment; filename={file_name}',
     }
     api_mock.call.return_value.content = bio_seq_content
+    api_mock.call.return_value.iter_content.return_value = [bio_seq_content]
     fs_handler_mock = mocker.MagicMock()
     base_path = './'
     metadata = {
@@ -141,10 +144,11 @@ def test_dump(biological_sequence_factory, mocker, api_mock, bio_seq_content):
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), bio_seq_content, base_alias=None),
         ],
         any_order=True,
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [bio_seq_content]
 
 
 def test_load(api_mock, experiment_factory, eid_factory, mocker, bio_seq_content):
@@ -175,7 +179,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, bio_seq_content
         'name': file_name,
     }
     api_mock.call.return_value.json.return_value = response
-    fs_handler_mock.read.side_effect = [json.dumps(metadata), bio_seq_content]
+    fs_handler_mock.read.return_value = json.dumps(metadata)
+    fs_handler_mock.open_read.return_value = io.BytesIO(bio_seq_content)
     fs_handler_mock.join_path.side_effect = [base_path + 'metadata.json', base_path + file_name]
 
     BiologicalSequence.load(path=base_path, fs_handler=fs_handler_mock, parent=container)
@@ -188,13 +193,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, bio_seq_content
         any_order=True,
     )
 
-    fs_handler_mock.read.assert_has_calls(
-        [
-            mocker.call(base_path + 'metadata.json'),
-            mocker.call(base_path + file_name),
-        ],
-        any_order=True,
-    )
+    fs_handler_mock.read.assert_called_once_with(base_path + 'metadata.json')
+    fs_handler_mock.open_read.assert_called_once_with(base_path + file_name)
 
     api_mock.call.assert_called_once_with(
         method='POST',
@@ -206,5 +206,5 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, bio_seq_content
         headers={
             'Content-Type': 'biosequence/genbank',
         },
-        data=bio_seq_content,
+        data=fs_handler_mock.open_read.return_value,
     )
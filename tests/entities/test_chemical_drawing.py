@@ -1,3 +1,4 @@
+import io
 import json
 
 import arrow
@@ -273,6 +274,7 @@ def test_get_content(chemical_drawing_factory, api_mock):
         params={
             'format': ChemicalDrawingFormat.CDXML,
         },
+        cache_validator=chemical_drawing.digest,
     )
 
     assert isinstance(result, File)
@@ -467,7 +469,8 @@ def test_load(
         'content_type': content_type,
     }
     api_mock.call.return_value.json.return_value = response
-    fs_handler_mock.read.side_effect = [json.dumps(metadata), content]
+    fs_handler_mock.read.return_value = json.dumps(metadata)
+    fs_handler_mock.open_read.return_value = io.BytesIO(content)
     fs_handler_mock.join_path.side_effect = [base_path + 'metadata.json', base_path + file_name]
 
     ChemicalDrawing.load(path=base_path, fs_handler=fs_handler_mock, parent=container)
@@ -480,13 +483,8 @@ def test_load(
         any_order=True,
     )
 
-    fs_handler_mock.read.assert_has_calls(
-        [
-            mocker.call(base_path + 'metadata.json'),
-            mocker.call(base_path + file_name),
-        ],
-        any_order=True,
-    )
+    fs_handler_mock.read.assert_called_once_with(base_path + 'metadata.json')
+    fs_handler_mock.open_read.assert_called_once_with(base_path + file_name)
 
     api_mock.call.assert_called_once_with(
         method='POST',
@@ -498,7 +496,7 @@ def test_load(
         headers={
             'Content-Type': content_type,
         },
-        data=content,
+        data=fs_handler_mock.open_read.return_value,
     )
 
 
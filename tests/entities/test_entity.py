@@ -2,12 +2,14 @@
 This file contains common tests for all entity types.
 """
 import datetime
+import gc
 
 import arrow
 import pytest
+from pydantic import ValidationError
 
 from signals_notebook.common_types import EID, EntityType, ObjectType
-from signals_notebook.entities.entity import Property
+from signals_notebook.entities.entity import _registry, Entity, EntityResponse, Property
 from signals_notebook.entities.notebook import Notebook
 
 
@@ -283,3 +285,71 @@ def test_iter(api_mock, entity_factory, properties):
         assert isinstance(item, Property)
 
     assert entity._properties != []
+
+
+def test_get_entity_class():
+    assert Entity.get_entity_class(EntityType.NOTEBOOK) is Notebook
+    assert Entity.get_entity_class('journal') is Notebook
+
+    with pytest.raises(KeyError):
+        Entity.get_entity_class('unknown')
+
+
+@pytest.fixture()
+def clean_registry():
+    yield
+    _registry.clear()
+    gc.collect()
+
+
+def test_registry_is_updated_with_new_subclasses(clean_registry):
+    subclasses = Entity.get_subclasses()
+    assert Entity.get_subclasses() is subclasses
+    assert Entity.get_response_class() is Entity.get_response_class()
+
+    class _NewEntity(Notebook):
+        pass
+
+    assert _NewEntity in Entity.get_subclasses()
+    assert _NewEntity in Notebook.get_subclasses()
+    assert Entity.get_entity_class(EntityType.NOTEBOOK) is _NewEntity
+
+    del _NewEntity
+
+
+@pytest.mark.parametrize('entity_type, expected_class', [(EntityType.NOTEBOOK, Notebook), ('unknownType', Entity)])
+def test_entity_response_dispatches_on_type(entity_type, expected_class):
+    eid = 'journal:3b2f5a86-0b9e-4a2e-8a7b-4e2f4b2c8b9d'
+    response = EntityResponse(
+        data={
+            'type': ObjectType.ENTITY,
+            'id': eid,
+            'attributes': {
+                'eid': eid,
+                'name': 'name',
+                'type': entity_type,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+            },
+        }
+    )
+
+    assert type(response.data.body) is expected_class
+
+
+def test_entity_response_without_type_is_validated_as_entity():
+    eid = 'journal:3b2f5a86-0b9e-4a2e-8a7b-4e2f4b2c8b9d'
+
+    with pytest.raises(ValidationError, match='type'):
+        EntityResponse(
+            data={
+                'type': ObjectType.ENTITY,
+                'id': eid,
+                'attributes': {
+                    'eid': eid,
+                    'name': 'name',
+                    'createdAt': '2019-09-06T03:12:35.129Z',
+                    'editedAt': '2019-09-06T15:22:47.309Z',
+                },
+            }
+        )
@@ -0,0 +1,66 @@
+import pytest
+
+from signals_notebook.common_types import EntityType
+from signals_notebook.entities import Entity, EntityRef, EntityStore, Notebook
+from signals_notebook.utils import IdentityMap
+
+
+@pytest.fixture()
+def attributes(eid_factory):
+    eid = eid_factory(type=EntityType.NOTEBOOK)
+    return {
+        'eid': eid,
+        'name': 'My notebook',
+        'description': 'description',
+        'type': 'journal',
+        'createdAt': '2019-09-06T03:12:35.129Z',
+        'editedAt': '2019-09-06T15:22:47.309Z',
+        'digest': '123144',
+    }
+
+
+def test_ref_is_not_hydrated(attributes):
+    ref = EntityRef(attributes)
+
+    assert ref.eid == attributes['eid']
+    assert ref.type == EntityType.NOTEBOOK
+    assert ref.name == 'My notebook'
+    assert ref.short_description.id == attributes['eid']
+    assert not ref.is_hydrated
+    assert not hasattr(ref, '__dict__')
+
+
+def test_ref_is_hydrated_on_attribute_access(attributes):
+    ref = EntityRef(attributes)
+
+    assert ref.digest == '123144'
+    assert ref.is_hydrated
+    assert isinstance(ref.hydrate(), Notebook)
+    assert ref.hydrate() is ref.hydrate()
+
+
+def test_setattr_updates_hydrated_entity(attributes):
+    ref = EntityRef(attributes)
+
+    ref.name = 'New name'
+
+    assert ref.name == 'New name'
+    assert ref.hydrate().name == 'New name'
+
+
+def test_unknown_type_is_hydrated_to_entity(attributes):
+    ref = EntityRef({**attributes, 'type': 'unknownType'})
+
+    assert ref.type == 'unknownType'
+    assert type(ref.hydrate()) is Entity
+
+
+def test_ref_is_hydrated_through_identity_map(mocker, attributes):
+    identity_map = IdentityMap()
+    mocker.patch.object(EntityStore, '_identity_map', identity_map)
+    notebook = identity_map.merge(Notebook(**attributes))
+
+    ref = EntityRef({**attributes, 'name': 'New name', 'digest': 'changed'})
+
+    assert ref.hydrate() is notebook
+    assert notebook.name == 'New name'
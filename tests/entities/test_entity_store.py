@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 import arrow
@@ -6,6 +7,7 @@ import pytest
 from signals_notebook.common_types import EID, EntityType, ObjectType
 from signals_notebook.entities import Experiment, Notebook
 from signals_notebook.entities.entity_store import EntityStore
+from signals_notebook.utils import IdentityMap
 
 
 @pytest.fixture()
@@ -58,6 +60,51 @@ def test_get(api_mock, eid, entity_type, expected_class):
     assert result.edited_at == arrow.get(response['data']['attributes']['editedAt'])
 
 
+def test_get_many(api_mock, mocker, get_response_object):
+    eid1 = EID('experiment:878a87ca-3777-4692-8561-a4a81ccfd85d')
+    eid2 = EID('journal:52062e1d-7e03-464f-8caf-d7ed93261213')
+    eid3 = EID('experiment:e360eea6-b331-4c6f-b340-6d0eaa7eb070')
+
+    def _response(eid, entity_type):
+        return get_response_object(
+            {
+                'links': {'self': f'https://example.com/{eid}'},
+                'data': {
+                    'type': ObjectType.ENTITY,
+                    'id': eid,
+                    'attributes': {
+                        'eid': eid,
+                        'name': 'name',
+                        'type': entity_type,
+                        'createdAt': '2019-09-06T03:12:35.129Z',
+                        'editedAt': '2019-09-06T15:22:47.309Z',
+                    },
+                },
+            }
+        )
+
+    responses = {
+        eid1: _response(eid1, EntityType.EXPERIMENT),
+        eid2: _response(eid2, EntityType.NOTEBOOK),
+    }
+
+    def _call(method, path):
+        if path[1] not in responses:
+            raise ValueError('not found')
+        return responses[path[1]]
+
+    api_mock.call.side_effect = _call
+
+    result = EntityStore.get_many([eid1, eid3, eid2], max_workers=2)
+
+    assert api_mock.call.call_count == 3
+    assert isinstance(result[0], Experiment)
+    assert result[0].eid == eid1
+    assert isinstance(result[1], ValueError)
+    assert isinstance(result[2], Notebook)
+    assert result[2].eid == eid2
+
+
 @pytest.mark.parametrize('digest, force', [('1234234', False), (None, True)])
 def test_delete(api_mock, digest, force):
     eid = EID('experiment:e360eea6-b331-4c6f-b340-6d0eaa7eb070')
@@ -286,6 +333,91 @@ def test_get_several_pages(api_mock, mocker, get_response_object):
         assert item.edited_at == arrow.get(raw_item['attributes']['editedAt'])
 
 
+def test_get_async(async_api_mock):
+    eid = EID('experiment:878a87ca-3777-4692-8561-a4a81ccfd85d')
+    response = {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.ENTITY,
+            'id': eid,
+            'links': {'self': f'https://example.com/{eid}'},
+            'attributes': {
+                'eid': eid,
+                'name': 'My experiment',
+                'description': 'test description',
+                'type': EntityType.EXPERIMENT,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': '1234234',
+            },
+        },
+    }
+    async_api_mock.call.return_value.json.return_value = response
+
+    result = asyncio.run(EntityStore.get_async(eid))
+
+    async_api_mock.call.assert_awaited_once_with(method='GET', path=('entities', eid))
+
+    assert isinstance(result, Experiment)
+    assert result.eid == eid
+    assert result.digest == response['data']['attributes']['digest']
+
+
+def test_get_list_async_several_pages(async_api_mock, mocker, get_response_object):
+    eid1 = EID('experiment:878a87ca-3777-4692-8561-a4a81ccfd85d')
+    eid2 = EID('journal:52062e1d-7e03-464f-8caf-d7ed93261213')
+    response1 = {
+        'links': {
+            'self': 'https://example.com/entities?page[offset]=0&page[limit]=20',
+            'next': 'https://example.com/entities?page[offset]=20&page[limit]=20',
+        },
+        'data': [
+            {
+                'type': ObjectType.ENTITY,
+                'id': eid1,
+                'attributes': {
+                    'eid': eid1,
+                    'name': 'My experiment 1',
+                    'type': EntityType.EXPERIMENT,
+                    'createdAt': '2020-09-06T03:12:35.129Z',
+                    'editedAt': '2020-09-06T15:22:47.309Z',
+                },
+            },
+        ],
+    }
+    response2 = {
+        'links': {'self': 'https://example.com/entities?page[offset]=20&page[limit]=20'},
+        'data': [
+            {
+                'type': ObjectType.ENTITY,
+                'id': eid2,
+                'attributes': {
+                    'eid': eid2,
+                    'name': 'My notebook',
+                    'type': EntityType.NOTEBOOK,
+                    'createdAt': '2021-09-06T03:12:35.129Z',
+                    'editedAt': '2021-09-06T15:22:47.309Z',
+                },
+            },
+        ],
+    }
+    async_api_mock.call.side_effect = [get_response_object(response1), get_response_object(response2)]
+
+    async def _collect():
+        return [item async for item in EntityStore.get_list_async(include_types=[EntityType.EXPERIMENT])]
+
+    result = asyncio.run(_collect())
+
+    async_api_mock.call.assert_has_awaits(
+        [
+            mocker.call(method='GET', path=('entities',), params={'includeTypes': 'experiment'}),
+            mocker.call(method='GET', path=response1['links']['next']),
+        ]
+    )
+    assert [type(item) for item in result] == [Experiment, Notebook]
+    assert [item.eid for item in result] == [eid1, eid2]
+
+
 def test_refresh(api_mock, notebook_factory):
     notebook = notebook_factory(name='My notebook')
 
@@ -316,3 +448,56 @@ def test_refresh(api_mock, notebook_factory):
     )
     assert notebook.name == response['data']['attributes']['name']
     assert notebook.description == response['data']['attributes']['description']
+
+
+@pytest.fixture()
+def identity_map(mocker):
+    identity_map = IdentityMap()
+    mocker.patch.object(EntityStore, '_identity_map', identity_map)
+    return identity_map
+
+
+def _experiment_response(eid, name='My experiment', digest='1234234'):
+    return {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.ENTITY,
+            'id': eid,
+            'links': {'self': f'https://example.com/{eid}'},
+            'attributes': {
+                'eid': eid,
+                'name': name,
+                'description': 'test description',
+                'type': EntityType.EXPERIMENT,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': digest,
+            },
+        },
+    }
+
+
+def test_get_with_identity_map(api_mock, identity_map):
+    eid = EID('experiment:878a87ca-3777-4692-8561-a4a81ccfd85d')
+    api_mock.call.return_value.json.return_value = _experiment_response(eid)
+
+    first = EntityStore.get(eid)
+    second = EntityStore.get(eid)
+
+    api_mock.call.assert_called_once_with(method='GET', path=('entities', eid))
+    assert second is first
+
+
+def test_refresh_updates_cached_instance(api_mock, identity_map):
+    eid = EID('experiment:878a87ca-3777-4692-8561-a4a81ccfd85d')
+    api_mock.call.return_value.json.return_value = _experiment_response(eid)
+    cached = EntityStore.get(eid)
+    copy = Experiment(**_experiment_response(eid, name='Local name')['data']['attributes'])
+
+    api_mock.call.return_value.json.return_value = _experiment_response(eid, name='New name', digest='new digest')
+    EntityStore.refresh(copy)
+
+    assert copy.name == 'New name'
+    assert cached.name == 'New name'
+    assert cached.digest == 'new digest'
+    assert EntityStore.get(eid) is cached
@@ -1,3 +1,4 @@
+import io
 import json
 
 import arrow
@@ -74,6 +75,7 @@ def test_get_content(excel_factory, api_mock):
         params={
             'format': None,
         },
+        cache_validator=excel.digest,
     )
 
     assert isinstance(result, File)
@@ -110,6 +112,7 @@ def test_dump(excel_factory, mocker, api_mock):
         'content-disposition': f'attachment; filename={file_name}',
     }
     api_mock.call.return_value.content = content
+    api_mock.call.return_value.iter_content.return_value = [content]
     fs_handler_mock = mocker.MagicMock()
     base_path = './'
     metadata = {
@@ -132,10 +135,11 @@ def test_dump(excel_factory, mocker, api_mock):
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), content, base_alias=None),
         ],
         any_order=True,
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [content]
 
 
 def test_load(api_mock, experiment_factory, eid_factory, mocker):
@@ -166,7 +170,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         'name': file_name,
     }
     api_mock.call.return_value.json.return_value = response
-    fs_handler_mock.read.side_effect = [json.dumps(metadata), content]
+    fs_handler_mock.read.return_value = json.dumps(metadata)
+    fs_handler_mock.open_read.return_value = io.BytesIO(content)
     fs_handler_mock.join_path.side_effect = [base_path + 'metadata.json', base_path + file_name]
 
     Excel.load(path=base_path, fs_handler=fs_handler_mock, parent=container)
@@ -179,13 +184,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         any_order=True,
     )
 
-    fs_handler_mock.read.assert_has_calls(
-        [
-            mocker.call(base_path + 'metadata.json'),
-            mocker.call(base_path + file_name),
-        ],
-        any_order=True,
-    )
+    fs_handler_mock.read.assert_called_once_with(base_path + 'metadata.json')
+    fs_handler_mock.open_read.assert_called_once_with(base_path + file_name)
 
     api_mock.call.assert_called_once_with(
         method='POST',
@@ -197,5 +197,5 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         headers={
             'Content-Type': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
         },
-        data=content,
+        data=fs_handler_mock.open_read.return_value,
     )
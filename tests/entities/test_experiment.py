@@ -282,6 +282,44 @@ def test_add_children(api_mock, experiment_factory, force, eid_factory):
     assert result.edited_at == arrow.get(response['data']['attributes']['editedAt'])
 
 
+def test_add_child_from_path(api_mock, experiment_factory, eid_factory, tmp_path):
+    experiment = experiment_factory()
+    eid = eid_factory(type=EntityType.TEXT)
+    file_path = tmp_path / 'My text.txt'
+    file_path.write_bytes(b'Some text')
+    uploaded = []
+
+    def _call(**kwargs):
+        uploaded.append(kwargs['data'].read())
+        return mocker_response
+
+    mocker_response = api_mock.call.return_value
+    mocker_response.json.return_value = {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.ENTITY,
+            'id': eid,
+            'links': {'self': f'https://example.com/{eid}'},
+            'attributes': {
+                'eid': eid,
+                'name': 'My text',
+                'description': '',
+                'type': EntityType.TEXT,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': '123144',
+            },
+        },
+    }
+    api_mock.call.side_effect = _call
+
+    result = experiment.add_child(name='My text.txt', content=file_path)
+
+    assert uploaded == [b'Some text']
+    assert api_mock.call.call_args.kwargs['data'].closed
+    assert isinstance(result, Text)
+
+
 def test_get_children__one_page(api_mock, experiment_factory, eid_factory):
     experiment = experiment_factory()
     text_eid = eid_factory(type=EntityType.TEXT)
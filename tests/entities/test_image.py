@@ -1,4 +1,5 @@
 import base64 as b64
+import io
 import json
 
 import arrow
@@ -76,6 +77,7 @@ def test_get_content(image_factory, api_mock, base64):
         params={
             'format': None,
         },
+        cache_validator=image.digest,
     )
 
     assert isinstance(result, File)
@@ -115,6 +117,7 @@ def test_dump(image_factory, mocker, api_mock):
         'content-disposition': f'attachment; filename={file_name}',
     }
     api_mock.call.return_value.content = content
+    api_mock.call.return_value.iter_content.return_value = [content]
     fs_handler_mock = mocker.MagicMock()
     base_path = './'
     metadata = {
@@ -137,10 +140,11 @@ def test_dump(image_factory, mocker, api_mock):
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), content, base_alias=None),
         ],
         any_order=True,
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [content]
 
 
 @pytest.mark.parametrize(
@@ -176,7 +180,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, content_type, f
     base_path = './'
     metadata = {'file_name': file_name, 'name': file_name, 'content_type': content_type}
     api_mock.call.return_value.json.return_value = response
-    fs_handler_mock.read.side_effect = [json.dumps(metadata), content]
+    fs_handler_mock.read.return_value = json.dumps(metadata)
+    fs_handler_mock.open_read.return_value = io.BytesIO(content)
     fs_handler_mock.join_path.side_effect = [base_path + 'metadata.json', base_path + file_name]
 
     Image.load(path=base_path, fs_handler=fs_handler_mock, parent=container)
@@ -189,13 +194,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, content_type, f
         any_order=True,
     )
 
-    fs_handler_mock.read.assert_has_calls(
-        [
-            mocker.call(base_path + 'metadata.json'),
-            mocker.call(base_path + file_name),
-        ],
-        any_order=True,
-    )
+    fs_handler_mock.read.assert_called_once_with(base_path + 'metadata.json')
+    fs_handler_mock.open_read.assert_called_once_with(base_path + file_name)
 
     api_mock.call.assert_called_once_with(
         method='POST',
@@ -207,5 +207,5 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker, content_type, f
         headers={
             'Content-Type': content_type,
         },
-        data=content,
+        data=fs_handler_mock.open_read.return_value,
     )
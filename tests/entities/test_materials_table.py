@@ -21,6 +21,7 @@ def test_get_content(material_table_factory, api_mock):
         params={
             'format': None,
         },
+        cache_validator=materials_table.digest,
     )
 
     assert isinstance(result, File)
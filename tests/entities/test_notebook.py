@@ -1,9 +1,13 @@
+import asyncio
+import json
+
 import arrow
 import pytest
 
 from signals_notebook.common_types import EID, EntityType, ObjectType
-from signals_notebook.entities import Experiment
+from signals_notebook.entities import EntityRef, Experiment, Text
 from signals_notebook.entities.notebook import Notebook
+from signals_notebook.utils import DumpManifest, LoadJournal
 
 
 @pytest.fixture()
@@ -133,3 +137,226 @@ def test_get_children__one_page(api_mock, notebook_factory, eid_factory):
 
     assert isinstance(result[0], Experiment)
     assert result[0].eid == experiment_eid
+
+
+def test_get_children_refs(api_mock, notebook_factory, eid_factory):
+    notebook = notebook_factory()
+    experiment_eid = eid_factory(type=EntityType.EXPERIMENT)
+
+    response = {
+        'links': {'self': f'https://example.com/{notebook.eid}/children'},
+        'data': [
+            {
+                'type': ObjectType.ENTITY,
+                'id': experiment_eid,
+                'links': {'self': f'https://example.com/{experiment_eid}'},
+                'attributes': {
+                    'eid': experiment_eid,
+                    'name': 'Experiment',
+                    'description': 'description',
+                    'type': EntityType.EXPERIMENT,
+                    'createdAt': '2019-09-06T03:12:35.129Z',
+                    'editedAt': '2019-09-06T15:22:47.309Z',
+                    'digest': '123144',
+                },
+            },
+        ],
+    }
+    api_mock.call.return_value.json.return_value = response
+
+    result = list(notebook.get_children_refs())
+
+    assert isinstance(result[0], EntityRef)
+    assert result[0].eid == experiment_eid
+    assert result[0].type == EntityType.EXPERIMENT
+    assert result[0].name == 'Experiment'
+    assert not result[0].is_hydrated
+
+    assert result[0].description == 'description'
+    assert isinstance(result[0].hydrate(), Experiment)
+
+
+def test_get_children_async(async_api_mock, notebook_factory, eid_factory):
+    notebook = notebook_factory()
+    experiment_eid = eid_factory(type=EntityType.EXPERIMENT)
+
+    response = {
+        'links': {'self': f'https://example.com/{notebook.eid}/children'},
+        'data': [
+            {
+                'type': ObjectType.ENTITY,
+                'id': experiment_eid,
+                'links': {'self': f'https://example.com/{experiment_eid}'},
+                'attributes': {
+                    'eid': experiment_eid,
+                    'name': 'Experiment',
+                    'description': '',
+                    'type': EntityType.EXPERIMENT,
+                    'createdAt': '2019-09-06T03:12:35.129Z',
+                    'editedAt': '2019-09-06T15:22:47.309Z',
+                    'digest': '123144',
+                },
+            },
+        ],
+    }
+    async_api_mock.call.return_value.json.return_value = response
+
+    async def _collect():
+        return [item async for item in notebook.get_children_async()]
+
+    result = asyncio.run(_collect())
+
+    async_api_mock.call.assert_awaited_once_with(
+        method='GET',
+        path=('entities', notebook.eid, 'children'),
+        params={},
+    )
+
+    assert isinstance(result[0], Experiment)
+    assert result[0].eid == experiment_eid
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_dump_children(notebook_factory, mocker, max_workers):
+    notebook = notebook_factory()
+    children = [mocker.Mock() for _ in range(5)]
+    mocker.patch.object(Notebook, 'get_children', return_value=children)
+    mocker.patch.object(Notebook, '_reload_properties')
+    fs_handler_mock = mocker.MagicMock()
+
+    notebook.dump('base', fs_handler_mock, alias=['Backup'], max_workers=max_workers)
+
+    fs_handler_mock.write.assert_called_once()
+    for child in children:
+        child.dump.assert_called_once_with(f'base/{notebook.eid}', fs_handler_mock, ['Backup', notebook.name])
+
+
+def test_dump_children_concurrently_raises_after_dumping_others(notebook_factory, mocker):
+    notebook = notebook_factory()
+    children = [mocker.Mock() for _ in range(3)]
+    children[0].dump.side_effect = ValueError('failed')
+    mocker.patch.object(Notebook, 'get_children', return_value=children)
+    mocker.patch.object(Notebook, '_reload_properties')
+
+    with pytest.raises(ValueError, match='failed'):
+        notebook.dump('base', mocker.MagicMock(), max_workers=2)
+
+    for child in children:
+        child.dump.assert_called_once()
+
+
+class _MemoryFSHandler:
+    def __init__(self):
+        self.files = {}
+
+    def write(self, path, data, base_alias=None):
+        self.files[path] = data
+
+    def read(self, path):
+        return self.files[path]
+
+    @classmethod
+    def join_path(cls, *paths):
+        return '/'.join(paths)
+
+
+def test_dump_incremental(notebook_factory, experiment_factory, text_factory, mocker):
+    notebook = notebook_factory()
+    experiment = experiment_factory()
+    text, experiment_text = text_factory(), text_factory()
+    mocker.patch.object(Notebook, '_reload_properties')
+    mocker.patch.object(Experiment, '_reload_properties')
+    mocker.patch.object(Experiment, 'get_children', return_value=[experiment_text])
+    notebook_children_mock = mocker.patch.object(Notebook, 'get_children', return_value=[experiment, text])
+    text_dump_mock = mocker.patch.object(Text, 'dump')
+    get_list_mock = mocker.patch('signals_notebook.entities.EntityStore.get_list_refs', return_value=[])
+    fs_handler = _MemoryFSHandler()
+
+    manifest = notebook.dump_incremental('backup', fs_handler)
+
+    assert set(manifest.entries) == {notebook.eid, experiment.eid, text.eid, experiment_text.eid}
+    assert manifest.entries[experiment_text.eid].path == f'backup/{notebook.eid}/{experiment.eid}/{experiment_text.eid}'
+    assert text_dump_mock.call_count == 2
+    get_list_mock.assert_not_called()
+
+    changed_text = text_factory(eid=text.eid, digest='changed')
+    notebook_children_mock.return_value = [experiment, changed_text]
+    text_dump_mock.reset_mock()
+    previous_manifest = DumpManifest.load(fs_handler, f'backup/{notebook.eid}/manifest.json')
+
+    manifest = notebook.dump_incremental('next', fs_handler, previous_manifest=previous_manifest)
+
+    get_list_mock.assert_called_once_with(
+        include_types=list(EntityType), modified_after=previous_manifest.created_at
+    )
+    text_dump_mock.assert_called_once_with(f'next/{notebook.eid}', fs_handler, None)
+    assert manifest.entries[text.eid].digest == 'changed'
+    assert manifest.entries[text.eid].path == f'next/{notebook.eid}/{text.eid}'
+    assert manifest.entries[experiment_text.eid].path == f'backup/{notebook.eid}/{experiment.eid}/{experiment_text.eid}'
+    assert f'next/{notebook.eid}/{experiment.eid}/metadata.json' not in fs_handler.files
+
+
+def test_dump_incremental_redumps_unchanged_container_with_changed_grandchild(
+    notebook_factory, experiment_factory, text_factory, mocker
+):
+    notebook = notebook_factory()
+    experiment = experiment_factory()
+    experiment_text = text_factory()
+    mocker.patch.object(Notebook, '_reload_properties')
+    mocker.patch.object(Experiment, '_reload_properties')
+    mocker.patch.object(Experiment, 'get_children', return_value=[experiment_text])
+    mocker.patch.object(Notebook, 'get_children', return_value=[experiment])
+    text_dump_mock = mocker.patch.object(Text, 'dump')
+    mocker.patch(
+        'signals_notebook.entities.EntityStore.get_list_refs', return_value=[mocker.Mock(eid=experiment_text.eid)]
+    )
+    fs_handler = _MemoryFSHandler()
+    notebook.dump_incremental('backup', fs_handler)
+    text_dump_mock.reset_mock()
+    previous_manifest = DumpManifest.load(fs_handler, f'backup/{notebook.eid}/manifest.json')
+
+    manifest = notebook.dump_incremental('next', fs_handler, previous_manifest=previous_manifest)
+
+    text_dump_mock.assert_called_once_with(f'next/{notebook.eid}/{experiment.eid}', fs_handler, None)
+    assert manifest.entries[experiment.eid].path == f'next/{notebook.eid}/{experiment.eid}'
+    assert manifest.entries[experiment_text.eid].path == f'next/{notebook.eid}/{experiment.eid}/{experiment_text.eid}'
+
+
+@pytest.mark.parametrize('max_workers', [1, 4])
+def test_load_resumes_from_journal(notebook_factory, mocker, tmp_path, max_workers):
+    notebook = notebook_factory()
+    journal_path = str(tmp_path / 'restore.journal')
+    journal = LoadJournal(journal_path)
+    journal.record_created('dump/notebook', notebook.eid)
+    journal.mark_completed('dump/notebook/text:1')
+
+    fs_handler = mocker.MagicMock()
+    fs_handler.join_path.side_effect = lambda *paths: '/'.join(paths)
+    fs_handler.read.return_value = json.dumps({'name': 'name', 'description': '', 'Organization': ''})
+    fs_handler.list_subfolders.return_value = ['text:1', 'text:2', 'text:3']
+    create_mock = mocker.patch.object(Notebook, 'create')
+    get_mock = mocker.patch('signals_notebook.entities.EntityStore.get', return_value=notebook)
+
+    def _load_text(path, fs_handler, parent):
+        if path == 'dump/notebook/text:2':
+            raise RuntimeError('Failed')
+
+    text_load_mock = mocker.patch.object(Text, '_load', side_effect=_load_text)
+
+    with pytest.raises(RuntimeError):
+        Notebook.load('dump/notebook', fs_handler, max_workers=max_workers, journal=LoadJournal(journal_path))
+
+    create_mock.assert_not_called()
+    get_mock.assert_called_once_with(notebook.eid)
+    assert isinstance(get_mock.call_args.args[0], EID)
+    assert text_load_mock.call_count == (1 if max_workers == 1 else 2)
+
+    text_load_mock.reset_mock(side_effect=True)
+    journal = LoadJournal(journal_path)
+    Notebook.load('dump/notebook', fs_handler, max_workers=max_workers, journal=journal)
+
+    assert {call.args[0] for call in text_load_mock.call_args_list} == (
+        {'dump/notebook/text:2', 'dump/notebook/text:3'} if max_workers == 1 else {'dump/notebook/text:2'}
+    )
+    assert journal.is_completed('dump/notebook')
+    create_mock.assert_not_called()
@@ -491,6 +491,7 @@ def test_dump(api_mock, request_container_factory, eid_factory, mocker):
         'content-disposition': 'attachment; filename=Some reactions',
     }
     api_mock.call.return_value.content = content
+    api_mock.call.return_value.iter_content.return_value = [content]
 
     fs_handler_mock = mocker.MagicMock()
     base_path = './'
@@ -516,7 +517,8 @@ def test_dump(api_mock, request_container_factory, eid_factory, mocker):
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), content, base_alias=None),
         ],
         any_order=True,
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [content]
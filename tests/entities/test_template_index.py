@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from signals_notebook.common_types import EntityType
+from signals_notebook.entities import EntityStore, TemplateIndex
+
+
+def test_find_by_columns_fetches_templates_once(mocker):
+    templates = [mocker.MagicMock(columns=['a', 'b']), mocker.MagicMock(columns=['c']), mocker.MagicMock(columns=['d'])]
+    get_list_mock = mocker.patch.object(EntityStore, 'get_list', return_value=iter(templates))
+    get_columns_mock = mocker.MagicMock(side_effect=lambda template: template.columns)
+    template_index = TemplateIndex()
+
+    assert template_index.find_by_columns(EntityType.GRID, ['b', 'a'], get_columns_mock) is templates[0]
+    assert get_columns_mock.call_count == 1
+
+    assert template_index.find_by_columns(EntityType.GRID, ['d'], get_columns_mock) is templates[2]
+    assert template_index.find_by_columns(EntityType.GRID, ['c'], get_columns_mock) is templates[1]
+    assert template_index.find_by_columns(EntityType.GRID, ['e'], get_columns_mock) is None
+
+    assert get_columns_mock.call_count == 3
+    get_list_mock.assert_called_once_with(
+        include_types=[EntityType.GRID], include_options=[EntityStore.IncludeOptions.TEMPLATE]
+    )
+
+
+def test_find_by_columns_fetches_columns_without_lock(mocker):
+    templates = [mocker.MagicMock(columns=['a']), mocker.MagicMock(columns=['b'])]
+    mocker.patch.object(EntityStore, 'get_list', return_value=iter(templates))
+    template_index = TemplateIndex()
+    lock_states = []
+
+    def _try_lock():
+        acquired = template_index._lock.acquire(blocking=False)
+        if acquired:
+            template_index._lock.release()
+        lock_states.append(acquired)
+
+    def _get_columns(template):
+        thread = threading.Thread(target=_try_lock)
+        thread.start()
+        thread.join()
+        return template.columns
+
+    assert template_index.find_by_columns(EntityType.GRID, ['b'], _get_columns) is templates[1]
+    assert lock_states == [True, True]
+
+
+def test_find_by_columns_waits_for_template_being_indexed(mocker):
+    template = mocker.MagicMock(columns=['a'])
+    mocker.patch.object(EntityStore, 'get_list', return_value=iter([template]))
+    template_index = TemplateIndex()
+    started, release = threading.Event(), threading.Event()
+
+    def _get_columns(template):
+        started.set()
+        release.wait(5)
+        return template.columns
+
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(template_index.find_by_columns(EntityType.GRID, ['a'], _get_columns))
+    )
+    thread.start()
+    started.wait(5)
+    waiting_thread = threading.Thread(
+        target=lambda: results.append(template_index.find_by_columns(EntityType.GRID, ['a'], _get_columns))
+    )
+    waiting_thread.start()
+    release.set()
+    thread.join(5)
+    waiting_thread.join(5)
+
+    assert results == [template, template]
+
+
+def test_find_by_columns_keeps_template_if_columns_are_not_fetched(mocker):
+    template = mocker.MagicMock(columns=['a'])
+    mocker.patch.object(EntityStore, 'get_list', return_value=iter([template]))
+    get_columns_mock = mocker.MagicMock(side_effect=[ConnectionError('reset'), ['a']])
+    template_index = TemplateIndex()
+
+    with pytest.raises(ConnectionError):
+        template_index.find_by_columns(EntityType.GRID, ['a'], get_columns_mock)
+
+    assert template_index.find_by_columns(EntityType.GRID, ['a'], get_columns_mock) is template
+    assert get_columns_mock.call_count == 2
+
+
+def test_default_index_is_bound_to_default_api(api_mock, mocker):
+    template_index = TemplateIndex.get_default()
+
+    assert TemplateIndex.get_default() is template_index
+    assert template_index.api is api_mock
+
+    mocker.patch('signals_notebook.api.SignalsNotebookApi.get_default_api', return_value=mocker.MagicMock())
+
+    assert TemplateIndex.get_default() is not template_index
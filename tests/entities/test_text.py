@@ -1,10 +1,14 @@
+import io
 import json
 
 import arrow
 import pytest
+import requests
 
+from signals_notebook.api import SignalsNotebookApi
 from signals_notebook.common_types import EntityType, File, ObjectType
 from signals_notebook.entities import Text
+from signals_notebook.utils import HttpCache
 
 
 @pytest.mark.parametrize('digest, force', [('111', False), (None, True)])
@@ -74,6 +78,7 @@ def test_get_content(text_factory, api_mock):
         params={
             'format': None,
         },
+        cache_validator=text.digest,
     )
 
     assert isinstance(result, File)
@@ -82,6 +87,48 @@ def test_get_content(text_factory, api_mock):
     assert result.content_type == content_type
 
 
+def test_get_content_after_save_is_not_served_from_cache(mocker, text_factory, tmp_path):
+    text = text_factory()
+    exports = iter([b'Old text', b'New text'])
+
+    def request(method, url, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        if url.endswith('/export'):
+            response.headers.update(
+                {'content-type': 'text/plain', 'content-disposition': 'attachment; filename=Text.txt'}
+            )
+            response._content = next(exports)
+        else:
+            response._content = b'{"data": []}'
+        response._content_consumed = True
+        return response
+
+    session = mocker.Mock()
+    session.request.side_effect = request
+    api = SignalsNotebookApi(session, http_cache=HttpCache(str(tmp_path)))
+    mocker.patch.object(SignalsNotebookApi, 'get_default_api', return_value=api)
+
+    assert text.get_content().content == b'Old text'
+    text.save()
+    assert text.get_content().content == b'New text'
+
+
+def test_get_content_revalidates_outdated_digest(mocker, text_factory, api_mock):
+    text = text_factory()
+    mocker.patch('signals_notebook.entities.entity.time.monotonic', return_value=text._digest_fetched_at + 61)
+    api_mock.call.return_value.headers = {
+        'content-type': 'text/plain',
+        'content-disposition': 'attachment; filename=Text.txt',
+    }
+    api_mock.call.return_value.content = b'Some text'
+
+    text.get_content()
+
+    assert api_mock.call.call_args.kwargs['cache_validator'] is None
+
+
 def test_get_html(text_factory, snapshot, api_mock):
     text = text_factory(name='name')
     file_name = 'Text.txt'
@@ -110,6 +157,7 @@ def test_dump(text_factory, mocker, api_mock):
         'content-disposition': f'attachment; filename={file_name}',
     }
     api_mock.call.return_value.content = content
+    api_mock.call.return_value.iter_content.return_value = [content]
     fs_handler_mock = mocker.MagicMock()
     base_path = './'
     metadata = {
@@ -132,10 +180,11 @@ def test_dump(text_factory, mocker, api_mock):
     fs_handler_mock.write.assert_has_calls(
         [
             mocker.call(fs_handler_mock.join_path(), json.dumps(metadata), base_alias=None),
-            mocker.call(fs_handler_mock.join_path(), content, base_alias=None),
         ],
         any_order=True,
     )
+    fs_handler_mock.write_stream.assert_called_once_with(fs_handler_mock.join_path(), mocker.ANY, base_alias=None)
+    assert list(fs_handler_mock.write_stream.call_args.args[1]) == [content]
 
 
 def test_load(api_mock, experiment_factory, eid_factory, mocker):
@@ -167,7 +216,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         'name': file_name,
     }
     api_mock.call.return_value.json.return_value = response
-    fs_handler_mock.read.side_effect = [json.dumps(metadata), content]
+    fs_handler_mock.read.return_value = json.dumps(metadata)
+    fs_handler_mock.open_read.return_value = io.BytesIO(content)
     fs_handler_mock.join_path.side_effect = [base_path + 'metadata.json', base_path + file_name]
 
     Text.load(path=base_path, fs_handler=fs_handler_mock, parent=container)
@@ -180,13 +230,8 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         any_order=True,
     )
 
-    fs_handler_mock.read.assert_has_calls(
-        [
-            mocker.call(base_path + 'metadata.json'),
-            mocker.call(base_path + file_name),
-        ],
-        any_order=True,
-    )
+    fs_handler_mock.read.assert_called_once_with(base_path + 'metadata.json')
+    fs_handler_mock.open_read.assert_called_once_with(base_path + file_name)
 
     api_mock.call.assert_called_once_with(
         method='POST',
@@ -198,5 +243,28 @@ def test_load(api_mock, experiment_factory, eid_factory, mocker):
         headers={
             'Content-Type': 'text/plain',
         },
-        data=content,
+        data=fs_handler_mock.open_read.return_value,
+    )
+
+
+def test_get_content_stream(text_factory, api_mock):
+    text = text_factory(name='name')
+    api_mock.call.return_value.headers = {
+        'content-type': 'text/plain',
+        'content-disposition': 'attachment; filename=Text.txt',
+    }
+    api_mock.call.return_value.iter_content.return_value = [b'Some ', b'text']
+
+    with text.get_content_stream() as result:
+        assert result.name == 'Text.txt'
+        assert result.content_type == 'text/plain'
+        assert result.read() == b'Some text'
+
+    api_mock.call.assert_called_once_with(
+        method='GET',
+        path=('entities', text.eid, 'export'),
+        params={'format': None},
+        cache_validator=text.digest,
+        stream=True,
     )
+    api_mock.call.return_value.close.assert_called_once_with()
@@ -75,6 +75,7 @@ def test_get_content(task_container_factory, api_mock, task_container_content):
         params={
             'format': None,
         },
+        cache_validator=task_container.digest,
     )
     assert isinstance(result, File)
     assert result.name == file_name
@@ -140,6 +141,7 @@ def test_reload_tasks(api_mock, task_container_factory, task_properties, task_co
                 method='GET',
                 path=('entities', task_container.eid, 'export'),
                 params={'format': None},
+                cache_validator=task_container.digest,
             ),
             mocker.call(
                 method='GET',
@@ -233,6 +235,7 @@ def test_save(
                 method='GET',
                 path=('entities', task_container.eid, 'export'),
                 params={'format': None},
+                cache_validator=task_container.digest,
             ),
             mocker.call(
                 method='GET',
@@ -75,6 +75,7 @@ def test_get_content(todo_list_factory, api_mock, todo_list_content):
         params={
             'format': None,
         },
+        cache_validator=todo_list.digest,
     )
     assert isinstance(result, File)
     assert result.name == file_name
@@ -140,6 +141,7 @@ def test_reload_tasks(api_mock, todo_list_factory, task_properties, todo_list_co
                 method='GET',
                 path=('entities', todo_list.eid, 'export'),
                 params={'format': None},
+                cache_validator=todo_list.digest,
             ),
             mocker.call(
                 method='GET',
@@ -231,6 +233,7 @@ def test_save(api_mock, todo_list_factory, task_properties, todo_list_content, g
                 method='GET',
                 path=('entities', todo_list.eid, 'export'),
                 params={'format': None},
+                cache_validator=todo_list.digest,
             ),
             mocker.call(
                 method='GET',
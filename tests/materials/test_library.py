@@ -586,6 +586,7 @@ def test_get_content(library_factory, api_mock, mocker, get_response):
             mocker.call(
                 method='GET',
                 path=('materials', 'bulkExport', 'download', file_id),
+                stream=False,
             ),
         ],
         any_order=False,
@@ -3,6 +3,7 @@ import pytest
 
 from signals_notebook.common_types import MaterialType, ObjectType
 from signals_notebook.materials import Asset, Batch, Library, MaterialStore
+from signals_notebook.utils import IdentityMap
 
 
 @pytest.mark.parametrize(
@@ -107,3 +108,70 @@ def test_get_library(api_mock, mid_factory):
     assert result.name == response['data']['attributes']['name']
     assert result.created_at == arrow.get(response['data']['attributes']['createdAt'])
     assert result.edited_at == arrow.get(response['data']['attributes']['editedAt'])
+
+
+def test_get_many(api_mock, mid_factory, mocker):
+    mid1 = mid_factory(type=MaterialType.LIBRARY)
+    mid2 = mid_factory(type=MaterialType.LIBRARY)
+
+    def _call(method, path):
+        eid = path[1]
+        if eid == mid2:
+            raise ValueError('not found')
+
+        response = mocker.Mock()
+        response.json.return_value = {
+            'links': {'self': f'https://example.com/{eid}'},
+            'data': {
+                'type': ObjectType.MATERIAL,
+                'id': eid,
+                'attributes': {
+                    'assetTypeId': eid.id,
+                    'library': 'Plasmids',
+                    'eid': eid,
+                    'name': 'Plasmids',
+                    'type': MaterialType.LIBRARY,
+                    'createdAt': '2019-09-06T03:12:35.129Z',
+                    'editedAt': '2019-09-06T15:22:47.309Z',
+                    'fields': {},
+                },
+            },
+        }
+        return response
+
+    api_mock.call.side_effect = _call
+
+    result = MaterialStore.get_many([mid1, mid2])
+
+    assert isinstance(result[0], Library)
+    assert result[0].eid == mid1
+    assert isinstance(result[1], ValueError)
+
+
+def test_get_with_identity_map(api_mock, mid_factory, mocker):
+    mocker.patch.object(MaterialStore, '_identity_map', IdentityMap())
+    eid = mid_factory(type=MaterialType.LIBRARY)
+    api_mock.call.return_value.json.return_value = {
+        'links': {'self': f'https://example.com/{eid}'},
+        'data': {
+            'type': ObjectType.MATERIAL,
+            'id': eid,
+            'attributes': {
+                'assetTypeId': eid.id,
+                'library': 'Plasmids',
+                'eid': eid,
+                'name': 'Plasmids',
+                'type': MaterialType.LIBRARY,
+                'createdAt': '2019-09-06T03:12:35.129Z',
+                'editedAt': '2019-09-06T15:22:47.309Z',
+                'digest': '1234234',
+                'fields': {},
+            },
+        },
+    }
+
+    first = MaterialStore.get(eid)
+    second = MaterialStore.get(eid)
+
+    api_mock.call.assert_called_once_with(method='GET', path=('materials', eid))
+    assert second is first
@@ -0,0 +1,339 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+import requests
+
+from signals_notebook.api import AsyncSignalsNotebookApi, SignalsNotebookApi
+from signals_notebook.exceptions import SignalsNotebookError
+from signals_notebook.utils import HttpCache, RetryPolicy
+
+
+@pytest.fixture()
+def async_api(mocker):
+    def _f(handler):
+        mocker.patch.object(AsyncSignalsNotebookApi, '_api_host', 'https://example.com')
+        return AsyncSignalsNotebookApi(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    return _f
+
+
+def test_async_call(async_api):
+    sent_requests = []
+
+    def handler(request):
+        sent_requests.append(request)
+        return httpx.Response(200, json={'data': []})
+
+    api = async_api(handler)
+
+    response = asyncio.run(
+        api.call(method='GET', path=('entities', 'journal:1'), params={'digest': None, 'force': 'true'})
+    )
+
+    assert response.json() == {'data': []}
+    assert len(sent_requests) == 1
+    assert str(sent_requests[0].url) == 'https://example.com/api/rest/v1.0/entities/journal:1?force=true'
+    assert sent_requests[0].headers['Content-Type'] == 'application/vnd.api+json'
+
+
+def test_async_call_with_data(async_api):
+    sent_requests = []
+
+    def handler(request):
+        sent_requests.append(request)
+        return httpx.Response(201, json={'data': []})
+
+    api = async_api(handler)
+
+    asyncio.run(api.call(method='POST', path=('entities',), data=b'content', headers={'Content-Type': 'text/plain'}))
+
+    assert sent_requests[0].content == b'content'
+    assert sent_requests[0].headers['Content-Type'] == 'text/plain'
+
+
+def test_async_call_error(async_api):
+    def handler(request):
+        return httpx.Response(
+            404, json={'errors': [{'status': '404', 'code': 'NotFound', 'title': 'Not found', 'detail': 'missing'}]}
+        )
+
+    api = async_api(handler)
+
+    with pytest.raises(SignalsNotebookError) as e:
+        asyncio.run(api.call(method='GET', path=('entities', 'journal:1')))
+
+    assert e.value.parsed_response.errors[0].code == 'NotFound'
+
+
+def test_get_default_api_not_initialized(mocker):
+    mocker.patch.object(AsyncSignalsNotebookApi, '_default_api_instance', None)
+
+    with pytest.raises(AttributeError):
+        AsyncSignalsNotebookApi.get_default_api()
+
+
+def test_init_mounts_pooled_adapter(mocker):
+    mocker.patch.object(SignalsNotebookApi, '_default_api_instance', None)
+    mocker.patch.object(SignalsNotebookApi, '_api_host', '')
+
+    api = SignalsNotebookApi.init('https://example.com', 'key', pool_connections=2, pool_maxsize=50, pool_block=True)
+
+    adapter = api._session.get_adapter('https://example.com')
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_block is True
+    assert api._session.headers['x-api-key'] == 'key'
+
+
+def test_init_with_shared_adapter(mocker):
+    mocker.patch.object(SignalsNotebookApi, '_default_api_instance', None)
+    mocker.patch.object(SignalsNotebookApi, '_api_host', '')
+    adapter = SignalsNotebookApi.create_http_adapter(pool_maxsize=64)
+
+    api1 = SignalsNotebookApi.init('https://example.com', 'key1', http_adapter=adapter)
+    api2 = SignalsNotebookApi.init('https://example.com', 'key2', http_adapter=adapter)
+
+    assert api1._session.get_adapter('https://example.com') is adapter
+    assert api2._session.get_adapter('https://example.com') is adapter
+    assert SignalsNotebookApi._default_api_instance is api2
+
+
+def _response(mocker, status_code, headers=None):
+    response = mocker.Mock(status_code=status_code, ok=status_code < 400, headers=headers or {}, reason='reason')
+    response.json.return_value = {'errors': [{'status': str(status_code), 'code': 'Error'}]}
+    return response
+
+
+def test_call_retries(mocker):
+    sleep_mock = mocker.patch('signals_notebook.api.time.sleep')
+    session = mocker.Mock()
+    session.request.side_effect = [
+        _response(mocker, 503),
+        _response(mocker, 429, {'Retry-After': '3'}),
+        _response(mocker, 200),
+    ]
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy(backoff_factor=1, jitter=0))
+
+    response = api.call(method='GET', path='https://example.com/entities')
+
+    assert response.status_code == 200
+    assert session.request.call_count == 3
+    sleep_mock.assert_has_calls([mocker.call(1), mocker.call(3)])
+    assert api.retry_policy.statistics.retries == 2
+    assert api.retry_policy.statistics.total_backoff == 4
+
+
+def test_call_retries_exhausted(mocker):
+    mocker.patch('signals_notebook.api.time.sleep')
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 503)
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy(total=2))
+
+    with pytest.raises(SignalsNotebookError):
+        api.call(method='GET', path='https://example.com/entities')
+
+    assert session.request.call_count == 3
+
+
+def test_call_does_not_retry_non_idempotent(mocker):
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 503)
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy())
+
+    with pytest.raises(SignalsNotebookError):
+        api.call(method='POST', path='https://example.com/entities', json={'data': {}})
+
+    assert session.request.call_count == 1
+
+
+def test_call_retries_connection_error(mocker):
+    mocker.patch('signals_notebook.api.time.sleep')
+    session = mocker.Mock()
+    session.request.side_effect = [requests.ConnectionError('reset'), _response(mocker, 200)]
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy())
+
+    api.call(method='GET', path='https://example.com/entities')
+
+    assert session.request.call_count == 2
+    assert api.retry_policy.statistics.retries == 1
+
+
+def test_call_rewinds_file_before_retry(mocker):
+    mocker.patch('signals_notebook.api.time.sleep')
+    uploaded = []
+
+    def _request(**kwargs):
+        uploaded.append(kwargs['data'].read())
+        return _response(mocker, 429 if len(uploaded) == 1 else 200)
+
+    session = mocker.Mock()
+    session.request.side_effect = _request
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy())
+
+    api.call(method='POST', path='https://example.com/entities', data=io.BytesIO(b'content'))
+
+    assert uploaded == [b'content', b'content']
+
+
+def test_call_does_not_retry_unseekable_file(mocker):
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 429)
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy())
+    data = mocker.Mock(spec=['read', 'seekable'])
+    data.seekable.return_value = False
+
+    with pytest.raises(SignalsNotebookError):
+        api.call(method='POST', path='https://example.com/entities', data=data)
+
+    assert session.request.call_count == 1
+
+
+def test_call_does_not_retry_generator(mocker):
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 503)
+    api = SignalsNotebookApi(session, retry_policy=RetryPolicy())
+    data = (chunk for chunk in [b'con', b'tent'])
+
+    with pytest.raises(SignalsNotebookError):
+        api.call(method='PUT', path='https://example.com/entities', data=data)
+
+    assert session.request.call_count == 1
+
+
+def test_call_without_retry_policy(mocker):
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 503)
+    api = SignalsNotebookApi(session)
+
+    with pytest.raises(SignalsNotebookError):
+        api.call(method='GET', path='https://example.com/entities')
+
+    assert session.request.call_count == 1
+
+
+def test_async_call_retries(mocker):
+    sleep_mock = mocker.patch('signals_notebook.api.asyncio.sleep', new=mocker.AsyncMock())
+    mocker.patch.object(AsyncSignalsNotebookApi, '_api_host', 'https://example.com')
+    responses = [httpx.Response(503), httpx.Response(200, json={'data': []})]
+
+    def handler(request):
+        return responses.pop(0)
+
+    api = AsyncSignalsNotebookApi(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)), retry_policy=RetryPolicy(jitter=0)
+    )
+
+    response = asyncio.run(api.call(method='GET', path=('entities',)))
+
+    assert response.status_code == 200
+    sleep_mock.assert_awaited_once_with(0.5)
+    assert api.retry_policy.statistics.retries == 1
+
+
+def test_call_waits_for_rate_limiter(mocker):
+    session = mocker.Mock()
+    session.request.return_value = _response(mocker, 200)
+    rate_limiter = mocker.MagicMock()
+    api = SignalsNotebookApi(session, rate_limiter=rate_limiter)
+
+    api.call(method='GET', path='https://example.com/entities')
+
+    rate_limiter.__enter__.assert_called_once()
+    rate_limiter.__exit__.assert_called_once()
+
+
+def _cacheable_response(content, headers):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = 'https://example.com/entities/text:1/export'
+    response.headers.update(headers)
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def test_call_revalidates_cached_response(mocker, tmp_path):
+    session = mocker.Mock()
+    session.request.side_effect = [
+        _cacheable_response(b'content', {'ETag': '"v1"', 'Content-Type': 'text/plain'}),
+        _response(mocker, 304),
+    ]
+    api = SignalsNotebookApi(session, http_cache=HttpCache(str(tmp_path)))
+
+    first = api.call(method='GET', path='https://example.com/entities/text:1/export', params={'format': None})
+    second = api.call(method='GET', path='https://example.com/entities/text:1/export', params={'format': None})
+
+    assert first.content == b'content'
+    assert second.content == b'content'
+    assert second.headers['content-type'] == 'text/plain'
+    assert session.request.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+
+def test_call_uses_cached_response_with_same_validator(mocker, tmp_path):
+    session = mocker.Mock()
+    session.request.return_value = _cacheable_response(b'content', {})
+    api = SignalsNotebookApi(session, http_cache=HttpCache(str(tmp_path)))
+
+    api.call(method='GET', path='https://example.com/entities/text:1/export', cache_validator='digest')
+    response = api.call(method='GET', path='https://example.com/entities/text:1/export', cache_validator='digest')
+
+    assert response.content == b'content'
+    session.request.assert_called_once()
+
+
+def test_call_removes_body_of_response_larger_than_cache(mocker, tmp_path):
+    session = mocker.Mock()
+    session.request.return_value = _cacheable_response(b'x' * 100, {'ETag': '"v1"'})
+    api = SignalsNotebookApi(session, http_cache=HttpCache(str(tmp_path), max_size=10))
+
+    response = api.call(method='GET', path='https://example.com/entities/text:1/export')
+
+    assert response.content == b'x' * 100
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_streamed_call_is_served_from_cache_file(mocker, tmp_path):
+    streamed_response = _cacheable_response(False, {'ETag': '"v1"'})
+    streamed_response._content_consumed = False
+    streamed_response.raw = io.BytesIO(b'large content')
+    session = mocker.Mock()
+    session.request.return_value = streamed_response
+    api = SignalsNotebookApi(session, http_cache=HttpCache(str(tmp_path)))
+
+    response = api.call(method='GET', path='https://example.com/entities/text:1/export', stream=True)
+
+    assert session.request.call_args.kwargs['stream'] is True
+    assert response is not streamed_response
+    assert b''.join(response.iter_content(4)) == b'large content'
+    response.close()
+
+
+def test_call_uses_json_decoder(mocker):
+    session = mocker.Mock()
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"data": []}'
+    session.request.return_value = response
+    loads = mocker.Mock(return_value={'data': ['decoded']})
+    api = SignalsNotebookApi(session, json_decoder=loads)
+
+    result = api.call(method='GET', path='https://example.com/entities')
+
+    assert result.json() == {'data': ['decoded']}
+    loads.assert_called_once_with(b'{"data": []}')
+
+
+def test_async_call_uses_json_decoder(mocker):
+    mocker.patch.object(AsyncSignalsNotebookApi, '_api_host', 'https://example.com')
+    loads = mocker.Mock(return_value={'data': ['decoded']})
+    api = AsyncSignalsNotebookApi(
+        httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'{"data": []}'))),
+        json_decoder=loads,
+    )
+
+    response = asyncio.run(api.call(method='GET', path=('entities',)))
+
+    assert response.json() == {'data': ['decoded']}
+    loads.assert_called_once_with(b'{"data": []}')
@@ -0,0 +1,41 @@
+import zipfile
+
+import pytest
+
+from signals_notebook.utils import TarFSHandler, ZipFSHandler
+
+
+@pytest.mark.parametrize(
+    'create_fs_handler',
+    [
+        lambda path, mode: ZipFSHandler(path + '.zip', mode),
+        lambda path, mode: ZipFSHandler(path + '.zip', mode, compression=zipfile.ZIP_STORED),
+        lambda path, mode: TarFSHandler(path + '.tar', mode),
+        lambda path, mode: TarFSHandler(path + '.tar.gz', mode, compression='gz' if mode == 'w' else None),
+    ],
+)
+def test_write_and_read_archive(tmp_path, create_fs_handler):
+    path = str(tmp_path / 'dump')
+
+    with create_fs_handler(path, 'w') as fs_handler:
+        fs_handler.write(fs_handler.join_path('./', 'notebook:1', 'metadata.json'), '{"name": "notebook"}')
+        fs_handler.write_stream(fs_handler.join_path('./', 'notebook:1', 'text:1', 'Text.txt'), iter([b'a', b'b']))
+        fs_handler.write(fs_handler.join_path('notebook:1', 'text:2', 'metadata.json'), b'{}')
+
+    with create_fs_handler(path, 'r') as fs_handler:
+        assert fs_handler.read('notebook:1/metadata.json') == b'{"name": "notebook"}'
+        with fs_handler.open_read(fs_handler.join_path('notebook:1', 'text:1', 'Text.txt')) as f:
+            assert f.read() == b'ab'
+        assert fs_handler.list_subfolders('./') == ['notebook:1']
+        assert fs_handler.list_subfolders('notebook:1') == ['text:1', 'text:2']
+        assert fs_handler.list_subfolders('notebook:1/text:1') == []
+
+
+def test_zip_directory_entries_are_listed(tmp_path):
+    path = str(tmp_path / 'dump.zip')
+    with zipfile.ZipFile(path, 'w') as zip_file:
+        zip_file.writestr('notebook:1/', b'')
+        zip_file.writestr('notebook:1/text:1/', b'')
+
+    with ZipFSHandler(path) as fs_handler:
+        assert fs_handler.list_subfolders('notebook:1') == ['text:1']
@@ -0,0 +1,49 @@
+import threading
+import time
+
+from signals_notebook.utils import map_concurrently
+
+
+def test_map_concurrently_keeps_order():
+    def _f(item):
+        time.sleep(0.01 * (5 - item))
+        return item * 2
+
+    assert map_concurrently(_f, range(5), max_workers=5) == [0, 2, 4, 6, 8]
+
+
+def test_map_concurrently_isolates_failures():
+    def _f(item):
+        if item == 1:
+            raise ValueError('failed')
+        return item
+
+    result = map_concurrently(_f, [0, 1, 2], max_workers=2)
+
+    assert result[0] == 0
+    assert isinstance(result[1], ValueError)
+    assert result[2] == 2
+
+
+def test_map_concurrently_bounds_workers():
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def _f(item):
+        nonlocal active, max_active
+        with lock:
+            active += 1
+            max_active = max(max_active, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return item
+
+    map_concurrently(_f, range(20), max_workers=3)
+
+    assert max_active <= 3
+
+
+def test_map_concurrently_empty():
+    assert map_concurrently(lambda x: x, []) == []
@@ -0,0 +1,56 @@
+from typing import Optional
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+
+from signals_notebook.utils import DumpManifest
+
+
+class _Entity(BaseModel):
+    eid: str
+    digest: Optional[str]
+    edited_at: Optional[str] = None
+
+
+def _build_manifest():
+    manifest = DumpManifest()
+    manifest.record(_Entity(eid='a', digest='1'), 'dump/a')
+    manifest.record(_Entity(eid='b', digest='2'), 'dump/a/b', parent='a')
+    manifest.record(_Entity(eid='c', digest='3'), 'dump/a/b/c', parent='b')
+    manifest.record(_Entity(eid='d', digest='4'), 'dump/d')
+    return manifest
+
+
+def test_save_and_load():
+    manifest = _build_manifest()
+    fs_handler = MagicMock()
+
+    manifest.save(fs_handler, 'dump/manifest.json')
+    path, content = fs_handler.write.call_args.args
+    fs_handler.read.return_value = content
+    result = DumpManifest.load(fs_handler, path)
+
+    fs_handler.read.assert_called_once_with('dump/manifest.json')
+    assert result.created_at == manifest.created_at
+    assert result.entries == manifest.entries
+
+
+def test_is_unchanged():
+    previous = _build_manifest()
+    manifest = DumpManifest(previous=previous, changed_eids={'d'})
+
+    assert manifest.is_unchanged(_Entity(eid='a', digest='1'))
+    assert not manifest.is_unchanged(_Entity(eid='a', digest='changed'))
+    assert not manifest.is_unchanged(_Entity(eid='a', digest=None))
+    assert not manifest.is_unchanged(_Entity(eid='d', digest='4'))
+    assert not manifest.is_unchanged(_Entity(eid='new', digest='1'))
+    assert not DumpManifest().is_unchanged(_Entity(eid='a', digest='1'))
+
+
+def test_carry_forward_copies_descendants():
+    previous = _build_manifest()
+    manifest = DumpManifest(previous=previous)
+
+    manifest.carry_forward('b')
+
+    assert manifest.entries == {'b': previous.entries['b'], 'c': previous.entries['c']}
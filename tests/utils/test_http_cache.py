@@ -0,0 +1,117 @@
+import requests
+
+from signals_notebook.utils import HttpCache
+
+
+def _response(content, headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = 'https://example.com/entities'
+    response.headers.update(headers or {'ETag': '"v1"'})
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def test_get_key_ignores_none_params():
+    assert HttpCache.get_key('https://example.com', {'format': None}) == HttpCache.get_key('https://example.com')
+    assert HttpCache.get_key('https://example.com', {'format': 'pdf'}) != HttpCache.get_key('https://example.com')
+
+
+def test_put_and_get(tmp_path):
+    cache = HttpCache(str(tmp_path))
+
+    cache.put('key', _response(b'content', {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}))
+    entry = cache.get('key')
+
+    assert entry.get_conditional_headers() == {
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 21 Oct 2015 07:28:00 GMT',
+    }
+    assert entry.to_response().content == b'content'
+    assert cache.size == 7
+
+
+def test_put_skips_response_without_validators(tmp_path):
+    cache = HttpCache(str(tmp_path))
+
+    cache.put('key', _response(b'content', {'Content-Type': 'text/plain'}))
+
+    assert cache.get('key') is None
+
+
+def test_cache_is_persistent(tmp_path):
+    HttpCache(str(tmp_path)).put('key', _response(b'content'), validator='digest')
+
+    entry = HttpCache(str(tmp_path)).get('key')
+
+    assert entry.validator == 'digest'
+    assert entry.to_response().content == b'content'
+
+
+def test_least_recently_used_response_is_evicted(tmp_path, mocker):
+    now = mocker.patch('signals_notebook.utils.http_cache.time.time')
+    cache = HttpCache(str(tmp_path), max_size=10)
+
+    now.return_value = 1
+    cache.put('a', _response(b'aaaa'))
+    now.return_value = 2
+    cache.put('b', _response(b'bbbb'))
+    now.return_value = 3
+    cache.get('a')
+    now.return_value = 4
+    cache.put('c', _response(b'cccc'))
+
+    assert cache.get('a') is not None
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+    assert cache.size == 8
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['a.body', 'a.json', 'c.body', 'c.json']
+
+
+def test_response_larger_than_cache_is_not_cached(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=10)
+
+    response = cache.put('key', _response(b'x' * 100)).to_response()
+
+    assert response.content == b'x' * 100
+    assert cache.get('key') is None
+    assert cache.size == 0
+    response.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_discarded_temporary_entry_is_removed(tmp_path):
+    cache = HttpCache(str(tmp_path), max_size=10)
+
+    cache.put('key', _response(b'x' * 100)).discard()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_temporary_files_of_previous_session_are_removed(tmp_path):
+    HttpCache(str(tmp_path)).put('key', _response(b'content'), validator='digest')
+    (tmp_path / 'tmp1.tmp.body').write_bytes(b'content')
+    (tmp_path / 'tmp2.json.tmp').write_bytes(b'{}')
+
+    cache = HttpCache(str(tmp_path))
+
+    assert sorted(p.suffix for p in tmp_path.iterdir()) == ['.body', '.json']
+    assert cache.get('key').to_response().content == b'content'
+
+
+def test_put_downloads_body_without_lock(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    lock_states = []
+
+    def _iter_content(chunk_size):
+        lock_states.append(cache._lock.locked())
+        yield b'content'
+
+    response = _response(b'content')
+    response.iter_content = _iter_content
+
+    cache.put('key', response)
+
+    assert lock_states == [False]
+    assert cache.get('key').to_response().content == b'content'
@@ -0,0 +1,89 @@
+from typing import Optional
+
+from pydantic import BaseModel, PrivateAttr
+
+from signals_notebook.utils import IdentityMap
+
+
+class _Model(BaseModel):
+    eid: str
+    digest: Optional[str]
+    name: str
+    _extra: Optional[str] = PrivateAttr(default=None)
+
+
+def test_merge_keeps_one_instance_per_key():
+    identity_map = IdentityMap()
+    first = identity_map.merge(_Model(eid='a', digest='1', name='first'))
+
+    result = identity_map.merge(_Model(eid='a', digest='1', name='ignored'))
+
+    assert result is first
+    assert result.name == 'first'
+    assert identity_map.get('a') is first
+
+
+def test_merge_updates_cached_instance_when_digest_changed():
+    identity_map = IdentityMap()
+    cached = identity_map.merge(_Model(eid='a', digest='1', name='old'))
+    fresh = _Model(eid='a', digest='2', name='new')
+    fresh._extra = 'extra'
+
+    result = identity_map.merge(fresh)
+
+    assert result is cached
+    assert cached.name == 'new'
+    assert cached.digest == '2'
+    assert cached._extra == 'extra'
+
+
+def test_get_returns_none_when_expired(mocker):
+    now = mocker.patch('signals_notebook.utils.identity_map.time.monotonic', return_value=100.0)
+    identity_map = IdentityMap(ttl=10)
+    identity_map.merge(_Model(eid='a', digest='1', name='name'))
+
+    now.return_value = 111.0
+
+    assert identity_map.get('a') is None
+    assert 'a' in identity_map
+    assert identity_map.misses == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    identity_map = IdentityMap(max_entries=2)
+    identity_map.merge(_Model(eid='a', digest='1', name='a'))
+    identity_map.merge(_Model(eid='b', digest='1', name='b'))
+    identity_map.get('a')
+
+    identity_map.merge(_Model(eid='c', digest='1', name='c'))
+
+    assert 'a' in identity_map
+    assert 'b' not in identity_map
+    assert 'c' in identity_map
+
+
+def test_memory_cap():
+    identity_map = IdentityMap(max_memory=25, sizeof=lambda obj: 10)
+    for key in 'abc':
+        identity_map.merge(_Model(eid=key, digest='1', name=key))
+
+    assert len(identity_map) == 2
+    assert identity_map.memory == 20
+
+    identity_map.invalidate('c')
+    assert identity_map.memory == 10
+
+    identity_map.clear()
+    assert len(identity_map) == 0
+    assert identity_map.memory == 0
+
+
+def test_size_is_not_estimated_without_memory_cap(mocker):
+    sizeof = mocker.Mock(return_value=10)
+    identity_map = IdentityMap(sizeof=sizeof)
+
+    identity_map.merge(_Model(eid='a', digest='1', name='old'))
+    identity_map.merge(_Model(eid='a', digest='2', name='new'))
+
+    sizeof.assert_not_called()
+    assert identity_map.memory == 0
@@ -0,0 +1,35 @@
+import json
+import sys
+
+import pytest
+
+from signals_notebook.utils import get_json_decoder
+
+
+def test_get_json_decoder_stdlib():
+    assert get_json_decoder('json') is json.loads
+
+
+def test_get_json_decoder_callable():
+    def loads(content):
+        return content
+
+    assert get_json_decoder(loads) is loads
+
+
+def test_get_json_decoder_auto_falls_back_to_stdlib(mocker):
+    mocker.patch.dict(sys.modules, {'orjson': None, 'msgspec': None, 'msgspec.json': None, 'ujson': None})
+
+    assert get_json_decoder() is json.loads
+
+
+def test_get_json_decoder_missing_backend(mocker):
+    mocker.patch.dict(sys.modules, {'orjson': None})
+
+    with pytest.raises(ImportError):
+        get_json_decoder('orjson')
+
+
+def test_get_json_decoder_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_decoder('yaml')
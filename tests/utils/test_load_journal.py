@@ -0,0 +1,27 @@
+from signals_notebook.utils import LoadJournal
+
+
+def test_journal_is_restored_from_file(tmp_path):
+    path = str(tmp_path / 'restore.journal')
+    journal = LoadJournal(path)
+    journal.record_created('dump/notebook', 'journal:1')
+    journal.mark_completed('dump/notebook/text:1')
+
+    result = LoadJournal(path)
+
+    assert result.get_created('dump/notebook') == 'journal:1'
+    assert result.get_created('dump/notebook/text:1') is None
+    assert result.is_completed('dump/notebook/text:1')
+    assert not result.is_completed('dump/notebook')
+
+
+def test_incomplete_record_is_ignored(tmp_path):
+    path = tmp_path / 'restore.journal'
+    path.write_text('{"path": "dump/notebook", "eid": "journal:1"}\n{"path": "dump/notebook/te')
+
+    result = LoadJournal(str(path))
+
+    assert result.get_created('dump/notebook') == 'journal:1'
+    assert not result.is_completed('dump/notebook/te')
+    result.mark_completed('dump/notebook/text:1')
+    assert LoadJournal(str(path)).is_completed('dump/notebook/text:1')
@@ -0,0 +1,41 @@
+from signals_notebook.utils import LocalFSHandler, open_read, StreamingFSHandler, write_chunks
+
+
+def test_write_and_read(tmp_path):
+    fs_handler = LocalFSHandler(str(tmp_path / 'dump'))
+    path = fs_handler.join_path('notebook:1', 'text:1', 'metadata.json')
+
+    fs_handler.write(path, '{"name": "text"}', base_alias=['Notebook', 'Text'])
+
+    assert fs_handler.read(path) == b'{"name": "text"}'
+    assert (tmp_path / 'dump' / 'notebook:1' / 'text:1' / 'metadata.json').exists()
+
+
+def test_write_stream(tmp_path):
+    fs_handler = LocalFSHandler(str(tmp_path))
+
+    write_chunks(fs_handler, fs_handler.join_path('text:1', 'Text.txt'), iter([b'Some ', b'text']))
+
+    with open_read(fs_handler, fs_handler.join_path('text:1', 'Text.txt')) as f:
+        assert f.read() == b'Some text'
+    assert isinstance(fs_handler, StreamingFSHandler)
+    assert [path.name for path in tmp_path.joinpath('text:1').iterdir()] == ['Text.txt']
+
+
+def test_write_chunks_falls_back_to_write(mocker):
+    fs_handler = mocker.Mock(spec=['write', 'read', 'list_subfolders', 'join_path'])
+    fs_handler.read.return_value = b'Some text'
+
+    write_chunks(fs_handler, 'Text.txt', iter([b'Some ', b'text']))
+
+    fs_handler.write.assert_called_once_with('Text.txt', b'Some text', base_alias=None)
+    assert open_read(fs_handler, 'Text.txt').read() == b'Some text'
+
+
+def test_list_subfolders(tmp_path):
+    fs_handler = LocalFSHandler(str(tmp_path))
+    fs_handler.write(fs_handler.join_path('notebook:1', 'text:2', 'metadata.json'), b'{}')
+    fs_handler.write(fs_handler.join_path('notebook:1', 'text:1', 'metadata.json'), b'{}')
+    fs_handler.write(fs_handler.join_path('notebook:1', 'metadata.json'), b'{}')
+
+    assert fs_handler.list_subfolders('notebook:1') == ['text:1', 'text:2']
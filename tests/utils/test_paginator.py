@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from signals_notebook.common_types import Response
+from signals_notebook.utils import AsyncPaginator, Paginator
+
+
+class _ItemResponse(Response[dict]):
+    pass
+
+
+def _page(number, has_next=True):
+    links = {'self': f'https://example.com/items?page={number}'}
+    if has_next:
+        links['next'] = f'https://example.com/items?page={number + 1}'
+
+    return {
+        'links': links,
+        'data': [{'type': 'entity', 'id': f'{number}', 'attributes': {'page': number}}],
+    }
+
+
+@pytest.fixture()
+def get_response_object(mocker):
+    def _f(response):
+        mock = mocker.Mock()
+        mock.json.return_value = response
+        return mock
+
+    return _f
+
+
+@pytest.fixture()
+def paged_api(mocker, get_response_object):
+    def _f(pages_count):
+        pages = [get_response_object(_page(i, has_next=i < pages_count - 1)) for i in range(pages_count)]
+        api = mocker.Mock()
+        api.call.side_effect = pages
+        return api
+
+    return _f
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_iterate_all_pages(paged_api, mocker, prefetch):
+    api = paged_api(3)
+
+    result = [item.body['page'] for item in Paginator(api, _ItemResponse, prefetch=prefetch, path=('items',))]
+
+    assert result == [0, 1, 2]
+    api.call.assert_has_calls(
+        [
+            mocker.call(method='GET', path=('items',)),
+            mocker.call(method='GET', path='https://example.com/items?page=1'),
+            mocker.call(method='GET', path='https://example.com/items?page=2'),
+        ]
+    )
+
+
+def test_next_page_is_prefetched(paged_api):
+    api = paged_api(2)
+    second_page_requested = threading.Event()
+    side_effect = list(api.call.side_effect)
+
+    def _call(**kwargs):
+        if len(side_effect) == 1:
+            second_page_requested.set()
+        return side_effect.pop(0)
+
+    api.call.side_effect = _call
+    items = iter(Paginator(api, _ItemResponse, prefetch=1, path=('items',)))
+
+    next(items)
+
+    assert second_page_requested.wait(timeout=5)
+    items.close()
+
+
+def test_prefetch_is_bounded(paged_api):
+    api = paged_api(10)
+    items = iter(Paginator(api, _ItemResponse, prefetch=1, path=('items',)))
+
+    next(items)
+    time.sleep(0.3)
+
+    assert api.call.call_count == 2
+    items.close()
+
+
+def test_prefetch_is_disabled_by_default(paged_api):
+    api = paged_api(2)
+    threads_count = threading.active_count()
+    items = iter(Paginator(api, _ItemResponse, path=('items',)))
+
+    next(items)
+
+    assert threading.active_count() == threads_count
+    assert api.call.call_count == 1
+    items.close()
+
+
+def test_error_is_raised_in_consumer(mocker, get_response_object):
+    api = mocker.Mock()
+    api.call.side_effect = [get_response_object(_page(0)), ValueError('failed')]
+    items = iter(Paginator(api, _ItemResponse, prefetch=1, path=('items',)))
+
+    assert next(items).body['page'] == 0
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_stop_consuming(paged_api):
+    api = paged_api(10)
+    items = iter(Paginator(api, _ItemResponse, prefetch=1, path=('items',)))
+
+    next(items)
+    items.close()
+
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and thread.daemon:
+            thread.join(timeout=1)
+    assert api.call.call_count < 10
+
+
+def test_items_are_validated_one_at_a_time(mocker, get_response_object):
+    payload = {
+        'links': {'self': 'https://example.com/items'},
+        'data': [
+            {'type': 'entity', 'id': '1', 'attributes': {'page': 0}},
+            {'type': 'unknown', 'id': '2', 'attributes': {'page': 0}},
+        ],
+    }
+    api = mocker.Mock()
+    api.call.return_value = get_response_object(payload)
+    items = iter(Paginator(api, _ItemResponse, prefetch=0, path=('items',)))
+
+    assert next(items).eid == '1'
+    with pytest.raises(ValidationError):
+        next(items)
+    assert len(payload['data']) == 2
+
+
+def test_async_paginator(paged_api, mocker):
+    api = paged_api(2)
+    api.call = mocker.AsyncMock(side_effect=list(api.call.side_effect))
+
+    async def _collect():
+        return [item.body['page'] async for item in AsyncPaginator(api, _ItemResponse, path=('items',))]
+
+    assert asyncio.run(_collect()) == [0, 1]
+    api.call.assert_has_awaits(
+        [
+            mocker.call(method='GET', path=('items',)),
+            mocker.call(method='GET', path='https://example.com/items?page=1'),
+        ]
+    )
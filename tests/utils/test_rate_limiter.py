@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from signals_notebook.utils import RateLimiter
+
+
+def test_rate_limit():
+    limiter = RateLimiter(requests_per_second=50, burst=1)
+
+    started_at = time.monotonic()
+    for _ in range(6):
+        with limiter:
+            pass
+
+    assert time.monotonic() - started_at >= 0.09
+
+
+def test_burst_is_not_delayed(mocker):
+    sleep_mock = mocker.patch('signals_notebook.utils.rate_limiter.time.sleep')
+    limiter = RateLimiter(requests_per_second=1, burst=5)
+
+    for _ in range(5):
+        with limiter:
+            pass
+
+    sleep_mock.assert_not_called()
+
+
+def test_max_concurrent():
+    limiter = RateLimiter(max_concurrent=2)
+    lock = threading.Lock()
+    max_in_flight = 0
+
+    def _worker():
+        nonlocal max_in_flight
+        with limiter:
+            with lock:
+                max_in_flight = max(max_in_flight, limiter.in_flight)
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert max_in_flight == 2
+    assert limiter.in_flight == 0
+
+
+def test_max_concurrent_async():
+    limiter = RateLimiter(requests_per_second=1000, max_concurrent=3)
+    max_in_flight = 0
+
+    async def _worker():
+        nonlocal max_in_flight
+        async with limiter:
+            max_in_flight = max(max_in_flight, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def _main():
+        await asyncio.gather(*[_worker() for _ in range(10)])
+
+    asyncio.run(_main())
+
+    assert max_in_flight == 3
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.parametrize('kwargs', [{'requests_per_second': 0}, {'max_concurrent': 0}])
+def test_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        RateLimiter(**kwargs)
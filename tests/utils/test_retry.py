@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from signals_notebook.utils import RetryPolicy
+
+
+@pytest.mark.parametrize(
+    'method,status_code,expected',
+    [
+        ('GET', 503, True),
+        ('get', 429, True),
+        ('DELETE', 502, True),
+        ('GET', 500, False),
+        ('POST', 429, True),
+        ('POST', 503, False),
+        ('PATCH', 503, False),
+    ],
+)
+def test_is_retryable_status_default(method, status_code, expected):
+    assert RetryPolicy().is_retryable_status(method, status_code, attempt=0) is expected
+
+
+def test_is_retryable_status_custom():
+    policy = RetryPolicy(total=2, status_codes_by_method={'POST': [503]})
+
+    assert policy.is_retryable_status('POST', 503, attempt=1)
+    assert not policy.is_retryable_status('POST', 503, attempt=2)
+    assert not policy.is_retryable_status('GET', 503, attempt=0)
+
+
+def test_is_retryable_error():
+    policy = RetryPolicy()
+
+    assert policy.is_retryable_error('GET', attempt=0)
+    assert not policy.is_retryable_error('POST', attempt=0)
+    assert not RetryPolicy(retry_connection_errors=False).is_retryable_error('GET', attempt=0)
+
+
+def test_get_backoff_exponential():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=0)
+
+    assert [policy.get_backoff(attempt) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_get_backoff_jitter():
+    policy = RetryPolicy(backoff_factor=1, jitter=0.5)
+
+    for _ in range(20):
+        assert 2 <= policy.get_backoff(1) <= 3
+
+
+def test_get_backoff_retry_after_seconds():
+    policy = RetryPolicy(jitter=0)
+
+    assert policy.get_backoff(0, {'Retry-After': '7'}) == 7
+    assert RetryPolicy(jitter=0, respect_retry_after=False).get_backoff(0, {'Retry-After': '7'}) == 0.5
+
+
+def test_get_backoff_retry_after_date():
+    policy = RetryPolicy(jitter=0)
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert 25 < policy.get_backoff(0, {'Retry-After': format_datetime(retry_at, usegmt=True)}) <= 30
+
+
+def test_statistics():
+    policy = RetryPolicy()
+
+    policy.statistics.record(429, 1.5)
+    policy.statistics.record(429, 2)
+    policy.statistics.record(None, 0.5)
+
+    assert policy.statistics.retries == 3
+    assert policy.statistics.total_backoff == 4
+    assert policy.statistics.retries_by_status == {429: 2}
+
+    policy.statistics.reset()
+
+    assert policy.statistics.retries == 0